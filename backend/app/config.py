@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import List
+from typing import List, Optional
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -23,19 +23,99 @@ class Settings(BaseSettings):
     CLERK_JWT_KEY: str
     CLERK_AUDIENCE: str = "your-clerk-audience"
     CLERK_ISSUER: str = "https://clerk.your-domain.com"
+    CLERK_JWKS_URL: str = "https://clerk.your-domain.com/.well-known/jwks.json"
+    JWKS_CACHE_TTL: int = 60 * 60  # seconds between background key refreshes
+    JWKS_MIN_REFETCH_INTERVAL: int = 30  # seconds; throttles refetches for unknown kids
+    AUTH_TOKEN_CACHE_SIZE: int = 10_000  # verified tokens kept in memory
+    AUTH_TOKEN_CACHE_MAX_TTL: int = 5 * 60  # seconds, capped by the token's exp
     
     # Supabase Configuration
     SUPABASE_URL: str
     SUPABASE_KEY: str
     SUPABASE_JWT_SECRET: str
+    DB_MAX_WORKERS: int = 16  # Threads running blocking supabase-py queries
+    RESUME_CACHE_TTL: int = 30  # seconds; per worker, hits are revalidated by updated_at (0 disables)
+    RESUME_CACHE_MAX_ENTRIES: int = 5000
+    
+    # Outbound HTTP pool
+    HTTP_TIMEOUT: float = 30.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE: int = 20
     
     # OpenAI Configuration
     OPENAI_API_KEY: str
+    OPENAI_BASE_URL: Optional[str] = None  # Point at a fake/proxy OpenAI server
+    OPENAI_MODEL: str = "gpt-4"
+    OPENAI_SECTION_MODEL: str = "gpt-3.5-turbo"  # Cheaper model for per-section prompts
+    SECTION_CONCURRENCY: int = 4  # Max concurrent per-section calls per request
+    OPENAI_TIMEOUT: float = 60.0
+    OPENAI_RPM: int = 500  # Requests per minute budget (0 disables)
+    OPENAI_TPM: int = 150000  # Tokens per minute budget (0 disables)
+    OPENAI_MAX_CONCURRENCY: int = 16
+    OPENAI_PER_USER_CONCURRENCY: int = 4
+    OPENAI_MAX_RETRIES: int = 4
+    
+    # LLM circuit breaker and degraded-mode backfill
+    LLM_BREAKER_FAILURE_RATE: float = 0.5
+    LLM_BREAKER_MIN_CALLS: int = 5
+    LLM_BREAKER_SLOW_CALL_SECONDS: float = 30.0
+    LLM_BREAKER_OPEN_SECONDS: float = 30.0
+    ANALYSIS_BACKFILL_INTERVAL: int = 60  # seconds (0 disables)
+    ANALYSIS_BACKFILL_BATCH: int = 10
+    
+    # LLM response cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL: int = 24 * 60 * 60  # seconds
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+    LLM_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    REDIS_URL: Optional[str] = None  # Enables the shared cache tier across workers
+    
+    # Background jobs
+    WEB_CONCURRENCY: int = 1  # server processes (read by gunicorn/uvicorn); jobs need 1
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_MAXSIZE: int = 100
+    JOB_RETENTION_SECONDS: int = 60 * 60
     
     # Storage Configuration
+    STORAGE_BACKEND: str = "supabase"  # "supabase" or "local"
+    STORAGE_CHUNK_SIZE: int = 256 * 1024
+    LOCAL_STORAGE_BASE_URL: str = "http://localhost:8000/uploads"
     UPLOAD_DIR: str = "uploads"
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
+    MAX_REQUEST_SIZE: int = 1024 * 1024  # other request bodies; also form-field allowance on uploads
+    DEFAULT_MAX_STORAGE_BYTES: int = 50 * 1024 * 1024  # when user_settings has no row
+    STORAGE_USAGE_CACHE_TTL: int = 30  # seconds
+    STORAGE_RECONCILE_INTERVAL: int = 60 * 60  # seconds (0 disables)
+    
+    # Text extraction and batch uploads
+    EXTRACTION_WORKERS: int = 0  # extraction processes (0 = one per CPU)
+    EXTRACTION_TIMEOUT: float = 20.0  # seconds per document (0 disables)
+    EXTRACTION_MEMORY_LIMIT_MB: int = 1024  # address space per worker (0 disables)
+    DOCX_EXTRACTOR: str = "streaming"  # "streaming" or "python-docx"
+    PDF_MIN_CHARS_PER_PAGE: int = 20  # below this a PDF is treated as scanned
+    EXTRACTION_CACHE_BYTES: int = 32 * 1024 * 1024  # text cached by content hash (0 disables)
+    BATCH_MAX_FILES: int = 200
+    BATCH_MAX_BYTES: int = 100 * 1024 * 1024  # 100MB per batch request
+    BATCH_CONCURRENCY: int = 8  # files in flight per batch
+    BATCH_INSERT_SIZE: int = 25  # max rows per bulk insert
+    BATCH_INSERT_DELAY: float = 0.05  # seconds to wait for more rows to insert together
     ALLOWED_EXTENSIONS: List[str] = ["pdf", "docx"]
+    
+    # Local keyword matching
+    SKILLS_VOCABULARY_FILE: Optional[str] = None  # JSON {name: [aliases]} extending the built-in skills
+    JOB_RANKING_MAX_JOBS: int = 100  # job descriptions per rank-jobs request
+    JOB_RANKING_MAX_EXPLAIN: int = 5  # top matches that may be sent to the LLM
+    
+    # Semantic resume search
+    EMBEDDING_PROVIDER: str = "hashing"  # "hashing" (local, deterministic) or "openai"
+    EMBEDDING_MODEL: str = "text-embedding-3-small"  # for the openai provider
+    EMBEDDING_DIMENSIONS: int = 512
+    SEARCH_INDEX_MAX_USERS: int = 1000  # per-user indexes kept in memory
+    SEARCH_INDEX_SYNC_TTL: int = 30  # seconds before re-checking a user's resumes for changes
+    SEARCH_ANN_MIN_SIZE: int = 1024  # vectors per index before switching to approximate (LSH) search
+    
+    # Resume version history
+    VERSION_SNAPSHOT_INTERVAL: int = 10  # full copy every N versions, diffs in between
 
     class Config:
         env_file = ".env"
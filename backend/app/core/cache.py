@@ -0,0 +1,183 @@
+"""In-process and shared caches."""
+from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+import sys
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _sizeof(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+class LRUCache:
+    """
+    Least-recently-used cache with per-entry TTL and a total size budget.
+    
+    Entries are evicted when they expire, when ``max_entries`` is exceeded
+    or when the summed size of the cached values exceeds ``max_bytes``.
+    Not thread-safe; intended for use from the event loop.
+    """
+    
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, size: Optional[int] = None):
+        """Cache a value, evicting least-recently-used entries as needed."""
+        size = _sizeof(value) if size is None else size
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, size, value)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+    
+    def delete(self, key: str):
+        """Remove a key if present."""
+        if key in self._entries:
+            self._remove(key)
+    
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+        self._bytes = 0
+    
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current occupancy."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self._bytes
+        }
+
+class RedisCache:
+    """
+    Shared cache tier backed by Redis, visible to every uvicorn worker.
+    
+    Requires the optional ``redis`` package. Errors are logged and treated
+    as misses so an unavailable Redis never fails a request.
+    """
+    
+    def __init__(self, url: str, prefix: str = "cache:"):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError("The 'redis' package is required for a shared cache tier") from e
+        self.client = aioredis.from_url(url)
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+    
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            value = await self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Shared cache get failed: {str(e)}")
+            self.errors += 1
+            return None
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+    
+    async def set(self, key: str, value: str, ttl: float):
+        try:
+            await self.client.set(self.prefix + key, value, ex=int(ttl))
+        except Exception as e:
+            logger.warning(f"Shared cache set failed: {str(e)}")
+            self.errors += 1
+    
+    async def delete(self, key: str):
+        try:
+            await self.client.delete(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Shared cache delete failed: {str(e)}")
+            self.errors += 1
+    
+    async def close(self):
+        await self.client.aclose()
+    
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'errors': self.errors}
+
+class TieredCache:
+    """
+    Two-tier string cache: an in-process LRU in front of an optional shared tier.
+    
+    Shared-tier hits are copied into the local tier so repeat lookups on
+    the same worker stay in-process.
+    """
+    
+    def __init__(self, local: LRUCache, shared: Optional[RedisCache] = None):
+        self.local = local
+        self.shared = shared
+    
+    async def get(self, key: str) -> Optional[str]:
+        value = self.local.get(key)
+        if value is None and self.shared is not None:
+            value = await self.shared.get(key)
+            if value is not None:
+                self.local.set(key, value)
+        return value
+    
+    async def set(self, key: str, value: str):
+        self.local.set(key, value)
+        if self.shared is not None:
+            await self.shared.set(key, value, self.local.ttl)
+    
+    async def delete(self, key: str):
+        self.local.delete(key)
+        if self.shared is not None:
+            await self.shared.delete(key)
+    
+    async def close(self):
+        if self.shared is not None:
+            await self.shared.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'local': self.local.stats(),
+            'shared': self.shared.stats() if self.shared is not None else None
+        }
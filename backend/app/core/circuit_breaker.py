@@ -0,0 +1,156 @@
+"""Circuit breaker for unreliable upstream dependencies."""
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+from collections import deque
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the dependency while the circuit is open."""
+    
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} is unavailable (circuit open, retry in {retry_after:.0f}s)")
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """
+    Fail fast while a dependency is unhealthy.
+    
+    The breaker tracks the outcome of the last ``window`` calls. A call is a
+    failure if it raises an exception accepted by ``is_failure`` or takes
+    longer than ``slow_call_seconds``. Once at least ``min_calls`` have been
+    recorded and the failure rate reaches ``failure_rate``, the circuit
+    opens for ``open_seconds``; calls are then rejected immediately with
+    CircuitOpenError. After that, up to ``half_open_calls`` probe calls are
+    let through: if they all succeed the circuit closes, and any failure
+    re-opens it.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        slow_call_seconds: Optional[float] = None,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 2,
+        is_failure: Callable[[Exception], bool] = lambda e: True
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.is_failure = is_failure
+        self.state = self.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.rejected = 0
+        self.opened = 0
+    
+    def check(self):
+        """
+        Raise CircuitOpenError if a call would currently be rejected.
+        
+        Moves an open circuit to half-open once its cool-down has elapsed.
+        """
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.open_seconds - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, remaining)
+            self._transition(self.HALF_OPEN)
+        if self.state == self.HALF_OPEN and self._probes_in_flight >= self.half_open_calls:
+            self.rejected += 1
+            raise CircuitOpenError(self.name, 0)
+    
+    @property
+    def available(self) -> bool:
+        """Whether a call would be let through right now (without side effects)."""
+        if self.state == self.OPEN:
+            return time.monotonic() >= self._opened_at + self.open_seconds
+        if self.state == self.HALF_OPEN:
+            return self._probes_in_flight < self.half_open_calls
+        return True
+    
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` if the circuit allows it and record the outcome."""
+        self.check()
+        probe = self.state == self.HALF_OPEN
+        if probe:
+            self._probes_in_flight += 1
+        start = time.monotonic()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            if probe:
+                self._probes_in_flight -= 1
+            raise
+        except Exception as e:
+            if probe:
+                self._probes_in_flight -= 1
+            if self.is_failure(e):
+                self._record(False)
+            raise
+        if probe:
+            self._probes_in_flight -= 1
+        slow = self.slow_call_seconds is not None and time.monotonic() - start > self.slow_call_seconds
+        self._record(not slow)
+        return result
+    
+    def record_failure(self, error: Exception):
+        """
+        Record an error raised after ``call`` returned, e.g. part-way
+        through consuming a streamed response.
+        """
+        if self.is_failure(error):
+            self._record(False)
+    
+    def _record(self, success: bool):
+        if self.state == self.HALF_OPEN:
+            if not success:
+                self._transition(self.OPEN)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_calls:
+                self._transition(self.CLOSED)
+            return
+        if self.state == self.OPEN:
+            return
+        
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+            self._transition(self.OPEN)
+    
+    def _transition(self, state: str):
+        if state == self.state:
+            return
+        logger.warning(f"Circuit '{self.name}' {self.state} -> {state}")
+        self.state = state
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+            self.opened += 1
+        self._probe_successes = 0
+        self._outcomes.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'recent_calls': len(self._outcomes),
+            'recent_failures': self._outcomes.count(False),
+            'opened': self.opened,
+            'rejected': self.rejected
+        }
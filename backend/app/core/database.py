@@ -1,70 +1,289 @@
 """Supabase database client and utilities."""
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from uuid import UUID
+import asyncio
+from pydantic import TypeAdapter
 from supabase import create_client, Client
 from ..config import get_settings
-from ..models.resume import Resume, ResumeCreate, ResumeAnalysis
+from .cache import LRUCache
+from ..models.resume import Resume, ResumeCreate, ResumeAnalysis, ResumeSummary, AnalysisStatus
+import base64
+import hashlib
+import json
+import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns returned by resume listings; large text/JSON columns are opt-in
+RESUME_SUMMARY_COLUMNS = (
+    'id, user_id, title, file_type, file_url, file_size, analysis_status, '
+    'created_at, updated_at, score:analysis->score'
+)
+RESUME_DETAIL_FIELDS = {'content', 'optimized_content', 'analysis'}
+
+# Version metadata; content/delta are only read to rebuild a version
+RESUME_VERSION_COLUMNS = 'version_number, kind, source, content_length, content_sha256, created_at'
+
+_TIMESTAMP = TypeAdapter(datetime)
+_TIMESTAMP_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[T ][\d:.]+(Z|[+-]\d{2}(:?\d{2})?)?$')
+
+def encode_cursor(created_at: str, resume_id: str) -> str:
+    """Encode a listing position as an opaque URL-safe cursor."""
+    raw = json.dumps([created_at, str(resume_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        ValueError if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, resume_id = json.loads(raw)
+        # Timestamps are interpolated into the filter, so only allow ISO-8601 characters
+        if not _TIMESTAMP_RE.match(created_at):
+            raise ValueError(created_at)
+        return created_at, str(UUID(resume_id))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+class CachedResume:
+    """A cached resume with its ETag and lazily rendered JSON body."""
+    
+    __slots__ = ("resume", "etag", "_body")
+    
+    def __init__(self, resume: Resume):
+        self.resume = resume
+        version = f"{resume.user_id}:{resume.id}:{resume.updated_at.isoformat()}"
+        self.etag = f'W/"{hashlib.sha1(version.encode()).hexdigest()}"'
+        self._body: Optional[bytes] = None
+    
+    @property
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = self.resume.model_dump_json().encode()
+        return self._body
+
 class DatabaseService:
-    """Handle database operations with Supabase."""
+    """
+    Handle database operations with Supabase.
+    
+    supabase-py is synchronous, so every query is executed on a bounded
+    thread pool instead of the event loop. The pool size caps the number
+    of concurrent round trips per worker.
+    """
     
-    def __init__(self):
+    def __init__(self, client: Optional[Client] = None, max_workers: Optional[int] = None):
         self.settings = get_settings()
-        self.client: Client = create_client(
+        self.client: Client = client or create_client(
             self.settings.SUPABASE_URL,
             self.settings.SUPABASE_KEY
         )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.settings.DB_MAX_WORKERS,
+            thread_name_prefix="supabase-db"
+        )
+        # Read-through cache for single resumes, keyed by (user_id, resume_id)
+        # and versioned by updated_at. Each worker has its own, so hits are
+        # revalidated against the row's updated_at before use
+        self.resume_cache = LRUCache(
+            max_entries=self.settings.RESUME_CACHE_MAX_ENTRIES,
+            ttl=self.settings.RESUME_CACHE_TTL
+        )
+    
+    @staticmethod
+    def _resume_key(resume_id: UUID, user_id: str) -> str:
+        return f"{user_id}:{resume_id}"
+    
+    def _cache_resume(self, resume: Resume) -> CachedResume:
+        """Cache a resume unless a newer version is already cached."""
+        key = self._resume_key(resume.id, resume.user_id)
+        current = self.resume_cache.get(key)
+        if current is not None and current.resume.updated_at > resume.updated_at:
+            return current
+        entry = CachedResume(resume)
+        if self.settings.RESUME_CACHE_TTL > 0:
+            self.resume_cache.set(key, entry, size=len(resume.content))
+        return entry
+    
+    async def _execute(self, query) -> Any:
+        """Run a prepared query builder's execute() on the DB thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, query.execute)
+    
+    def close(self):
+        """Shut down the DB thread pool."""
+        self._executor.shutdown(wait=False)
+    
+    async def rpc(self, function: str, params: Dict) -> Any:
+        """
+        Call a Postgres function through PostgREST.
+        
+        Each call runs in a single transaction, so multi-step writes that
+        must happen together belong in a function (see migrations) rather
+        than in several round trips from here.
+        
+        Args:
+            function: Function name
+            params: Named arguments
+        
+        Returns:
+            The function's result (rows for set-returning functions)
+        """
+        result = await self._execute(self.client.rpc(function, params))
+        return result.data
+    
+    @staticmethod
+    def resume_row(
+        resume: ResumeCreate,
+        file_url: str,
+        analysis: Optional[ResumeAnalysis] = None,
+        analysis_status: Optional[str] = None,
+        file_size: Optional[int] = None
+    ) -> Dict:
+        """Build the JSON row accepted by the create_resume(s) functions."""
+        return {
+            **resume.model_dump(),
+            'file_url': file_url,
+            'file_size': file_size,
+            'analysis': analysis.model_dump(mode='json') if analysis else None,
+            'analysis_status': analysis_status or AnalysisStatus.COMPLETE
+        }
     
-    async def create_resume(self, resume: ResumeCreate, file_url: str) -> Resume:
+    async def create_resume(
+        self,
+        resume: ResumeCreate,
+        file_url: str,
+        analysis: Optional[ResumeAnalysis] = None,
+        analysis_status: Optional[str] = None,
+        file_size: Optional[int] = None
+    ) -> Resume:
         """
-        Create a new resume record.
+        Create a new resume record in a single write.
+        
+        The row, its analysis and the owner's storage usage (when
+        ``file_size`` is given) are written in one transaction by the
+        ``create_resume`` database function.
         
         Args:
             resume: Resume creation model
             file_url: URL of uploaded file
+            analysis: Optional analysis results to store with the resume
+            analysis_status: Optional analysis status (e.g. pending backfill)
+            file_size: Size of the stored file in bytes, for quota accounting
             
         Returns:
             Created Resume object
         """
         try:
-            data = {
-                **resume.model_dump(),
-                'file_url': file_url,
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
-            }
-            
-            result = self.client.table('resumes').insert(data).execute()
+            rows = await self.rpc(
+                'create_resume',
+                {
+                    'p_resume': self.resume_row(resume, file_url, analysis, analysis_status),
+                    'p_file_size': file_size
+                }
+            )
             
-            return Resume(**result.data[0])
+            created = Resume(**rows[0])
+            self._cache_resume(created)
+            return created
             
         except Exception as e:
             logger.error(f"Failed to create resume: {str(e)}")
             raise
     
-    async def get_resume(self, resume_id: UUID, user_id: str) -> Optional[Resume]:
+    async def create_resumes(self, rows: List[Dict]) -> List[Resume]:
+        """
+        Insert many resumes, and account their files, in one write.
+        
+        Args:
+            rows: Rows built with resume_row(); file_url must be unique
+            
+        Returns:
+            Created Resume objects, in the order of ``rows``
+        """
+        try:
+            created = {
+                row['file_url']: Resume(**row)
+                for row in await self.rpc('create_resumes', {'p_resumes': rows})
+            }
+            resumes = [created[row['file_url']] for row in rows]
+            for resume in resumes:
+                self._cache_resume(resume)
+            return resumes
+            
+        except Exception as e:
+            logger.error(f"Failed to create resumes: {str(e)}")
+            raise
+    
+    async def get_resume(self, resume_id: UUID, user_id: str, use_cache: bool = True) -> Optional[Resume]:
         """
         Retrieve a resume by ID.
         
         Args:
             resume_id: Resume UUID
             user_id: User ID for authorization
+            use_cache: False to always read the full row, e.g. before a
+                write that is based on the current content
             
         Returns:
             Resume object if found, None otherwise
         """
+        entry = await self.get_resume_entry(resume_id, user_id, use_cache)
+        return entry.resume if entry else None
+    
+    async def get_resume_entry(
+        self,
+        resume_id: UUID,
+        user_id: str,
+        use_cache: bool = True
+    ) -> Optional[CachedResume]:
+        """
+        Retrieve a resume with its ETag, from the cache when possible.
+        
+        A cached entry is only used after checking that the row's
+        ``updated_at`` is unchanged, a single-column read that is much
+        cheaper than the full row, so edits made through other workers are
+        seen immediately.
+        
+        Args:
+            resume_id: Resume UUID
+            user_id: User ID for authorization
+            use_cache: False to skip the cache and read the full row
+        
+        Returns:
+            CachedResume if found, None otherwise
+        """
+        key = self._resume_key(resume_id, user_id)
+        entry = self.resume_cache.get(key) if use_cache else None
         try:
-            result = self.client.table('resumes')\
-                .select('*')\
-                .eq('id', str(resume_id))\
-                .eq('user_id', user_id)\
-                .execute()
+            if entry is not None:
+                result = await self._execute(
+                    self.client.table('resumes')\
+                        .select('updated_at')\
+                        .eq('id', str(resume_id))\
+                        .eq('user_id', user_id)
+                )
+                if not result.data:
+                    self.resume_cache.delete(key)
+                    return None
+                if _TIMESTAMP.validate_python(result.data[0]['updated_at']) == entry.resume.updated_at:
+                    return entry
+                self.resume_cache.delete(key)
+            
+            result = await self._execute(
+                self.client.table('resumes')\
+                    .select('*')\
+                    .eq('id', str(resume_id))\
+                    .eq('user_id', user_id)
+            )
                 
-            return Resume(**result.data[0]) if result.data else None
+            return self._cache_resume(Resume(**result.data[0])) if result.data else None
             
         except Exception as e:
             logger.error(f"Failed to retrieve resume: {str(e)}")
@@ -89,6 +308,7 @@ class DatabaseService:
         Returns:
             Updated Resume object
         """
+        self.resume_cache.delete(self._resume_key(resume_id, user_id))
         try:
             data = {
                 **updates,
@@ -96,15 +316,19 @@ class DatabaseService:
             }
             
             if analysis:
-                data['analysis'] = analysis.model_dump()
+                data['analysis'] = analysis.model_dump(mode='json')
+                data['analysis_status'] = AnalysisStatus.COMPLETE
             
-            result = self.client.table('resumes')\
-                .update(data)\
-                .eq('id', str(resume_id))\
-                .eq('user_id', user_id)\
-                .execute()
-                
-            return Resume(**result.data[0])
+            result = await self._execute(
+                self.client.table('resumes')\
+                    .update(data)\
+                    .eq('id', str(resume_id))\
+                    .eq('user_id', user_id)
+            )
+            
+            resume = Resume(**result.data[0])
+            self._cache_resume(resume)
+            return resume
             
         except Exception as e:
             logger.error(f"Failed to update resume: {str(e)}")
@@ -118,40 +342,234 @@ class DatabaseService:
             resume_id: Resume UUID
             user_id: User ID for authorization
         """
+        self.resume_cache.delete(self._resume_key(resume_id, user_id))
         try:
-            self.client.table('resumes')\
-                .delete()\
-                .eq('id', str(resume_id))\
-                .eq('user_id', user_id)\
-                .execute()
+            await self._execute(
+                self.client.table('resumes')\
+                    .delete()\
+                    .eq('id', str(resume_id))\
+                    .eq('user_id', user_id)
+            )
                 
         except Exception as e:
             logger.error(f"Failed to delete resume: {str(e)}")
             raise
     
-    async def list_user_resumes(self, user_id: str) -> List[Resume]:
+    async def list_user_resumes(
+        self,
+        user_id: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Sequence[str] = ()
+    ) -> Tuple[List[ResumeSummary], Optional[str]]:
         """
-        List all resumes for a user.
+        List a page of a user's resumes, newest first.
+        
+        Uses keyset pagination on (created_at, id) so every page is an
+        index range scan, however deep the user pages.
         
         Args:
             user_id: User ID
+            limit: Page size
+            cursor: Opaque cursor from the previous page, or None for the first
+            fields: Extra large columns to include (see RESUME_DETAIL_FIELDS)
             
         Returns:
-            List of Resume objects
+            Tuple of (summaries, cursor for the next page or None)
+        
+        Raises:
+            ValueError if the cursor or a field is invalid
         """
+        unknown = set(fields) - RESUME_DETAIL_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        columns = ', '.join([RESUME_SUMMARY_COLUMNS, *sorted(set(fields))])
+        
+        query = self.client.table('resumes')\
+            .select(columns)\
+            .eq('user_id', user_id)
+        if cursor:
+            created_at, resume_id = decode_cursor(cursor)
+            query = query.or_(
+                f'created_at.lt."{created_at}",'
+                f'and(created_at.eq."{created_at}",id.lt.{resume_id})'
+            )
+        
         try:
-            result = self.client.table('resumes')\
-                .select('*')\
-                .eq('user_id', user_id)\
-                .order('created_at', desc=True)\
-                .execute()
-                
-            return [Resume(**row) for row in result.data]
+            result = await self._execute(
+                query\
+                    .order('created_at', desc=True)\
+                    .order('id', desc=True)\
+                    .limit(limit + 1)
+            )
             
+            rows = result.data
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_cursor(rows[-1]['created_at'], rows[-1]['id'])
+            return [ResumeSummary(**row) for row in rows], next_cursor
+        
         except Exception as e:
             logger.error(f"Failed to list resumes: {str(e)}")
             raise
     
+    async def list_pending_analyses(self, limit: int) -> List[Resume]:
+        """
+        List resumes (across all users) whose analysis awaits backfill.
+        
+        Args:
+            limit: Maximum number of resumes to return
+        
+        Returns:
+            Oldest pending Resume objects first
+        """
+        try:
+            result = await self._execute(
+                self.client.table('resumes')\
+                    .select('*')\
+                    .eq('analysis_status', AnalysisStatus.PENDING)\
+                    .order('created_at')\
+                    .limit(limit)
+            )
+            
+            return [Resume(**row) for row in result.data]
+        
+        except Exception as e:
+            logger.error(f"Failed to list pending analyses: {str(e)}")
+            raise
+    
+    async def list_resume_stamps(self, user_id: str) -> List[Dict]:
+        """
+        List the ``id`` and ``updated_at`` of every resume a user has.
+        
+        Small enough to diff against a search index on each sync.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Rows with ``id`` and ``updated_at``
+        """
+        try:
+            result = await self._execute(
+                self.client.table('resumes')\
+                    .select('id, updated_at')\
+                    .eq('user_id', user_id)
+            )
+            return result.data
+        
+        except Exception as e:
+            logger.error(f"Failed to list resume timestamps: {str(e)}")
+            raise
+    
+    async def get_resume_texts(self, user_id: str, resume_ids: Sequence[str]) -> List[Dict]:
+        """
+        Fetch the searchable text of some of a user's resumes.
+        
+        Args:
+            user_id: User ID for authorization
+            resume_ids: Resume IDs to fetch
+        
+        Returns:
+            Rows with ``id``, ``title``, ``content`` and ``updated_at``
+        """
+        rows = []
+        try:
+            # Chunked so the id filter stays within URL length limits
+            for start in range(0, len(resume_ids), 100):
+                result = await self._execute(
+                    self.client.table('resumes')\
+                        .select('id, title, content, updated_at')\
+                        .eq('user_id', user_id)\
+                        .in_('id', [str(resume_id) for resume_id in resume_ids[start:start + 100]])
+                )
+                rows.extend(result.data)
+            return rows
+        
+        except Exception as e:
+            logger.error(f"Failed to fetch resume texts: {str(e)}")
+            raise
+    
+    async def add_resume_version(self, resume_id: UUID, params: Dict) -> Optional[Dict]:
+        """
+        Record a version of a resume's content.
+        
+        Args:
+            resume_id: Resume UUID
+            params: Remaining ``add_resume_version`` arguments without the
+                ``p_`` prefix (content, content_sha256, delta, ...)
+        
+        Returns:
+            The recorded (or unchanged latest) version row
+        """
+        try:
+            rows = await self.rpc(
+                'add_resume_version',
+                {'p_resume_id': str(resume_id), **{f"p_{k}": v for k, v in params.items()}}
+            )
+            return rows[0] if rows else None
+        
+        except Exception as e:
+            logger.error(f"Failed to record resume version: {str(e)}")
+            raise
+    
+    async def list_resume_versions(self, resume_id: UUID) -> List[Dict]:
+        """
+        List a resume's versions, newest first, without their content.
+        
+        Args:
+            resume_id: Resume UUID
+        
+        Returns:
+            Version rows (number, kind, source, length, timestamp)
+        """
+        try:
+            result = await self._execute(
+                self.client.table('resume_versions')\
+                    .select(RESUME_VERSION_COLUMNS)\
+                    .eq('resume_id', str(resume_id))\
+                    .order('version_number', desc=True)
+            )
+            return result.data
+        
+        except Exception as e:
+            logger.error(f"Failed to list resume versions: {str(e)}")
+            raise
+    
+    async def get_resume_version_chain(
+        self,
+        resume_id: UUID,
+        version_number: int,
+        window: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Fetch the rows needed to rebuild one version, oldest first.
+        
+        Args:
+            resume_id: Resume UUID
+            version_number: Version to rebuild
+            window: Only fetch the last ``window`` versions up to
+                ``version_number`` (one snapshot interval)
+        
+        Returns:
+            Version rows including content/delta; callers start from the
+            last snapshot among them
+        """
+        try:
+            query = self.client.table('resume_versions')\
+                .select(f"{RESUME_VERSION_COLUMNS},content,delta")\
+                .eq('resume_id', str(resume_id))\
+                .lte('version_number', version_number)
+            if window:
+                query = query.gt('version_number', version_number - window)
+            result = await self._execute(query.order('version_number'))
+            return result.data
+        
+        except Exception as e:
+            logger.error(f"Failed to fetch resume versions: {str(e)}")
+            raise
+    
     async def get_user_resume_count(self, user_id: str) -> int:
         """
         Get total number of resumes for a user.
@@ -163,10 +581,11 @@ class DatabaseService:
             Number of resumes
         """
         try:
-            result = self.client.table('resumes')\
-                .select('id', count='exact')\
-                .eq('user_id', user_id)\
-                .execute()
+            result = await self._execute(
+                self.client.table('resumes')\
+                    .select('id', count='exact')\
+                    .eq('user_id', user_id)
+            )
                 
             return result.count
             
@@ -174,5 +593,80 @@ class DatabaseService:
             logger.error(f"Failed to count resumes: {str(e)}")
             return 0
 
+    async def get_storage_usage(self, user_id: str) -> Optional[Dict]:
+        """
+        Get a user's recorded storage usage and quota.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Dict with storage_used_bytes and max_storage_bytes, or None if
+            the user has no settings row yet
+        """
+        try:
+            result = await self._execute(
+                self.client.table('user_settings')\
+                    .select('storage_used_bytes, max_storage_bytes')\
+                    .eq('user_id', user_id)
+            )
+            
+            return result.data[0] if result.data else None
+        
+        except Exception as e:
+            logger.error(f"Failed to get storage usage: {str(e)}")
+            raise
+    
+    async def increment_storage_usage(self, user_id: str, delta: int) -> Dict:
+        """
+        Atomically add ``delta`` bytes (may be negative) to a user's usage.
+        
+        Creates the settings row on first use; usage never drops below zero.
+        
+        Args:
+            user_id: User ID
+            delta: Bytes to add
+        
+        Returns:
+            Dict with the new storage_used_bytes and max_storage_bytes
+        """
+        try:
+            rows = await self.rpc(
+                'increment_storage_usage',
+                {'p_user_id': user_id, 'p_delta': delta}
+            )
+            
+            return rows[0]
+        
+        except Exception as e:
+            logger.error(f"Failed to update storage usage: {str(e)}")
+            raise
+    
+    async def list_storage_accounts(self, after: Optional[str], limit: int) -> List[Dict]:
+        """
+        Page through users' recorded storage usage, ordered by user ID.
+        
+        Args:
+            after: Return users after this user ID (None for the first page)
+            limit: Page size
+        
+        Returns:
+            Dicts with user_id and storage_used_bytes
+        """
+        try:
+            query = self.client.table('user_settings')\
+                .select('user_id, storage_used_bytes')\
+                .order('user_id')\
+                .limit(limit)
+            if after is not None:
+                query = query.gt('user_id', after)
+            result = await self._execute(query)
+            
+            return result.data
+        
+        except Exception as e:
+            logger.error(f"Failed to list storage accounts: {str(e)}")
+            raise
+
 # Initialize database service
 db = DatabaseService()
\ No newline at end of file
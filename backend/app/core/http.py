@@ -0,0 +1,32 @@
+"""Shared, pooled HTTP client for outbound service calls."""
+from typing import Optional
+import httpx
+from ..config import get_settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client.
+    
+    All services share one connection pool so keep-alive connections to
+    Supabase and Clerk are reused across requests.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        settings = get_settings()
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.HTTP_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE
+            )
+        )
+    return _client
+
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
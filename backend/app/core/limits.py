@@ -0,0 +1,88 @@
+"""Request body size limits, enforced while the body streams in."""
+from typing import Dict
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+class RequestBodyTooLarge(HTTPException):
+    """Raised from ``receive`` once a request body passes its limit."""
+    
+    def __init__(self, limit: int):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Request body exceeds {limit} bytes"
+        )
+
+class BodySizeLimitMiddleware:
+    """
+    Reject request bodies larger than a per-path limit.
+    
+    A declared ``Content-Length`` over the limit is refused before anything
+    is read. Otherwise (chunked bodies, lying clients) bytes are counted as
+    they arrive and the request is aborted with 413 the moment the limit is
+    crossed, so an oversized upload is never fully buffered or spooled.
+    
+    Being an HTTPException, the error raised mid-body passes through
+    FastAPI's body parsing untouched and renders as a normal 413.
+    """
+    
+    def __init__(self, app: ASGIApp, default_limit: int, path_limits: Dict[str, int]):
+        self.app = app
+        self.default_limit = default_limit
+        self.path_limits = path_limits
+    
+    def limit_for(self, path: str) -> int:
+        return self.path_limits.get(path.rstrip('/'), self.default_limit)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        limit = self.limit_for(scope["path"])
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    declared = 0
+                if declared > limit:
+                    await self._reject(scope, receive, send, limit)
+                    return
+                break
+        
+        received = 0
+        
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise RequestBodyTooLarge(limit)
+            return message
+        
+        response_started = False
+        
+        async def tracking_send(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except RequestBodyTooLarge:
+            # Read outside the exception handlers (e.g. by a middleware)
+            if response_started:
+                raise
+            await self._reject(scope, receive, send, limit)
+    
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, limit: int):
+        error = RequestBodyTooLarge(limit)
+        response = JSONResponse(
+            status_code=error.status_code,
+            content={"detail": error.detail},
+            headers={"Connection": "close"}
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,33 @@
+"""Periodic background tasks tied to the application lifecycle."""
+from typing import Awaitable, Callable, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+class PeriodicTask:
+    """Run a coroutine function every ``interval`` seconds until stopped."""
+    
+    def __init__(self, name: str, interval: float, fn: Callable[[], Awaitable[None]]):
+        self.name = name
+        self.interval = interval
+        self.fn = fn
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.ensure_future(self._run())
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.fn()
+            except Exception as e:
+                logger.error(f"Periodic task '{self.name}' failed: {str(e)}")
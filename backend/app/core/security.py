@@ -1,31 +1,111 @@
 """Authentication and authorization utilities."""
 from typing import Optional, Dict
+import hashlib
+import time
 import jwt
-from jwt import PyJWTError
+from jwt import PyJWK, PyJWTError
 from fastapi import HTTPException, status
-import httpx
 import logging
 from ..config import get_settings
+from .cache import LRUCache
+from .http import get_http_client
+from .periodic import PeriodicTask
+from .singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+class JWKSCache:
+    """
+    Signing keys from a JWKS endpoint, indexed by ``kid``.
+    
+    Keys are parsed once per fetch and refreshed every ``ttl`` seconds by a
+    background task. A token signed with an unknown ``kid`` (key rotation)
+    triggers an immediate refetch, at most once per ``min_refetch_interval``
+    so forged kids cannot hammer the endpoint. Concurrent fetches share one
+    request.
+    """
+    
+    def __init__(self, url: str, ttl: float, min_refetch_interval: float):
+        self.url = url
+        self.ttl = ttl
+        self.min_refetch_interval = min_refetch_interval
+        self._keys: Dict[str, PyJWK] = {}
+        self._fetched_at: Optional[float] = None
+        self._attempted_at = float('-inf')
+        self._inflight = SingleFlight()
+        self.refresh_task = PeriodicTask("jwks_refresh", ttl, self.refresh)
+        self.fetches = 0
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    async def refresh(self):
+        """Fetch the key set now (coalesced with any fetch in flight)."""
+        await self._inflight.do("jwks", self._fetch)
+    
+    async def _fetch(self):
+        self._attempted_at = time.monotonic()
+        response = await get_http_client().get(self.url)
+        response.raise_for_status()
+        keys = {}
+        for key in response.json().get('keys', []):
+            try:
+                keys[key['kid']] = PyJWK(key)
+            except (KeyError, PyJWTError) as e:
+                logger.warning(f"Skipping unusable JWKS key: {str(e)}")
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        self.fetches += 1
+    
+    async def get_key(self, kid: str) -> Optional[PyJWK]:
+        """
+        Return the signing key for ``kid``.
+        
+        Args:
+            kid: Key ID from the token header
+        
+        Returns:
+            The key, or None if it is unknown even after a refetch
+        """
+        if self._fetched_at is None:
+            await self.refresh()
+            return self._keys.get(kid)
+        
+        now = time.monotonic()
+        stale = now - self._fetched_at >= self.ttl
+        unknown = kid not in self._keys
+        if (stale or unknown) and now - self._attempted_at >= self.min_refetch_interval:
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Keep serving the keys we have rather than failing every request
+                logger.error(f"JWKS refresh failed: {str(e)}")
+        return self._keys.get(kid)
+
 class ClerkAuth:
     """Handle Clerk authentication and validation."""
     
     def __init__(self):
         self.settings = get_settings()
-        self.jwks_url = "https://clerk.your-domain.com/.well-known/jwks.json"  # TODO: Configure in settings
-        self._jwks = None
+        self.jwks = JWKSCache(
+            self.settings.CLERK_JWKS_URL,
+            ttl=self.settings.JWKS_CACHE_TTL,
+            min_refetch_interval=self.settings.JWKS_MIN_REFETCH_INTERVAL
+        )
+        # Verified claims keyed by token hash; entries expire with the token
+        self._verified = LRUCache(
+            max_entries=self.settings.AUTH_TOKEN_CACHE_SIZE,
+            ttl=self.settings.AUTH_TOKEN_CACHE_MAX_TTL
+        )
     
-    async def _fetch_jwks(self) -> Dict:
-        """Fetch JSON Web Key Set from Clerk."""
-        if self._jwks is None:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.jwks_url)
-                response.raise_for_status()
-                self._jwks = response.json()
-        return self._jwks
+    def _cache_verified(self, token_hash: str, payload: Dict, user_info: Dict):
+        exp = payload.get('exp')
+        ttl = self.settings.AUTH_TOKEN_CACHE_MAX_TTL
+        if exp is not None:
+            ttl = min(ttl, float(exp) - time.time())
+        if ttl > 0:
+            self._verified.set(token_hash, (exp, user_info), ttl=ttl, size=1)
     
     async def verify_token(self, token: str) -> Optional[Dict]:
         """
@@ -33,10 +113,10 @@ class ClerkAuth:
         
         Args:
             token: JWT token string
-            
+        
         Returns:
             Dict containing user information if valid
-            
+        
         Raises:
             HTTPException if token is invalid
         """
@@ -45,48 +125,47 @@ class ClerkAuth:
             if token.startswith('Bearer '):
                 token = token[7:]
             
-            # Fetch JWKS
-            jwks = await self._fetch_jwks()
+            # Skip signature verification for tokens already verified
+            token_hash = hashlib.sha256(token.encode()).hexdigest()
+            cached = self._verified.get(token_hash)
+            if cached is not None:
+                exp, user_info = cached
+                if exp is None or exp > time.time():
+                    return user_info
+                self._verified.delete(token_hash)
             
             # Get header without verification
             unverified_header = jwt.get_unverified_header(token)
             
             # Find the key
-            rsa_key = {}
-            for key in jwks['keys']:
-                if key['kid'] == unverified_header['kid']:
-                    rsa_key = {
-                        'kty': key['kty'],
-                        'kid': key['kid'],
-                        'n': key['n'],
-                        'e': key['e']
-                    }
-                    break
+            signing_key = await self.jwks.get_key(unverified_header.get('kid'))
             
-            if rsa_key:
+            if signing_key:
                 try:
                     # Verify token
                     payload = jwt.decode(
                         token,
-                        rsa_key,
+                        signing_key.key,
                         algorithms=['RS256'],
                         audience=self.settings.CLERK_AUDIENCE,
                         issuer=self.settings.CLERK_ISSUER
                     )
                     
-                    return {
+                    user_info = {
                         'user_id': payload['sub'],
                         'email': payload.get('email'),
                         'roles': payload.get('roles', []),
                         'metadata': payload.get('user_metadata', {})
                     }
-                    
+                    self._cache_verified(token_hash, payload, user_info)
+                    return user_info
+                
                 except jwt.ExpiredSignatureError:
                     raise HTTPException(
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         detail="Token has expired"
                     )
-                except jwt.JWTClaimsError:
+                except (jwt.InvalidAudienceError, jwt.InvalidIssuerError, jwt.MissingRequiredClaimError):
                     raise HTTPException(
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         detail="Invalid claims"
@@ -96,12 +175,14 @@ class ClerkAuth:
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         detail=f"Invalid token: {str(e)}"
                     )
-                    
+            
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token signing key"
             )
-            
+        
+        except HTTPException:
+            raise
         except PyJWTError as e:
             logger.error(f"JWT validation error: {str(e)}")
             raise HTTPException(
@@ -114,6 +195,13 @@ class ClerkAuth:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Authentication failed"
             )
+    
+    def stats(self) -> Dict:
+        return {
+            'jwks_keys': len(self.jwks),
+            'jwks_fetches': self.jwks.fetches,
+            'token_cache': self._verified.stats()
+        }
 
 # Instantiate auth handler
 auth_handler = ClerkAuth()
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""Coalescing of duplicate concurrent calls."""
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class _Call(Generic[T]):
+    def __init__(self, task: "asyncio.Task[T]"):
+        self.task = task
+        self.waiters = 0
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent callers with the same key.
+    
+    The first caller for a key starts the work as a separate task; later
+    callers await the same task. Each caller awaits through a shield, so a
+    caller that is cancelled (e.g. the client disconnected) only stops
+    waiting. The shared task is cancelled only once every waiter is gone.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self.started = 0
+        self.coalesced = 0
+        self.abandoned = 0
+    
+    def __len__(self) -> int:
+        return len(self._calls)
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn`` once for all concurrent callers using ``key``.
+        
+        Args:
+            key: Fingerprint identifying duplicate calls
+            fn: Zero-argument coroutine function doing the work
+        
+        Returns:
+            The shared result (or raises the shared exception)
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda task: self._finish(key, call))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Forget the call first so a new caller starts fresh work
+                # instead of joining a task that is being cancelled.
+                self._forget(key, call)
+                self.abandoned += 1
+                call.task.cancel()
+    
+    def _forget(self, key: str, call: _Call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+    
+    def _finish(self, key: str, call: _Call):
+        self._forget(key, call)
+        # Mark the exception as retrieved when every waiter has already left
+        if not call.task.cancelled():
+            call.task.exception()
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'in_flight': len(self._calls),
+            'started': self.started,
+            'coalesced': self.coalesced,
+            'abandoned': self.abandoned
+        }
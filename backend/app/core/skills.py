@@ -0,0 +1,138 @@
+"""Skills vocabulary for local keyword matching.
+
+Maps each skill's display name to the spellings that count as a mention.
+Aliases are matched as whole token sequences after the same tokenization
+applied to resumes and job descriptions, so "CI/CD" also matches "ci cd".
+Deliberately ambiguous spellings (Go, R, C, bare "Excel") are left out,
+as are everyday words that name a skill only in context: "spring" (a
+semester), "ts", "security", "containers", "lambda". Those skills are
+matched through qualified forms such as "spring boot" or "aws lambda".
+"""
+from typing import Dict, List
+
+SKILLS: Dict[str, List[str]] = {
+    # Programming languages
+    "Python": ["python", "python3"],
+    "Java": ["java"],
+    "JavaScript": ["javascript", "js", "ecmascript", "es6"],
+    "TypeScript": ["typescript"],
+    "Go": ["golang"],
+    "Rust": ["rust"],
+    "C++": ["c++", "cpp"],
+    "C#": ["c#", "csharp"],
+    "Ruby": ["ruby"],
+    "PHP": ["php"],
+    "Kotlin": ["kotlin"],
+    "Swift": ["swift"],
+    "Scala": ["scala"],
+    "SQL": ["sql"],
+    "Bash": ["bash", "shell scripting"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3"],
+    # Frameworks and libraries
+    "React": ["react", "react.js", "reactjs"],
+    "Angular": ["angular", "angularjs"],
+    "Vue": ["vue", "vue.js", "vuejs"],
+    "Node.js": ["node.js", "nodejs"],
+    "Express": ["express.js", "expressjs"],
+    "Next.js": ["next.js", "nextjs"],
+    "Django": ["django"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi"],
+    "Spring": ["spring boot", "springboot", "spring framework", "spring mvc"],
+    ".NET": [".net", "dotnet", "asp.net"],
+    "Ruby on Rails": ["rails", "ruby on rails"],
+    "GraphQL": ["graphql"],
+    "REST APIs": ["restful", "rest api", "rest apis", "restful apis"],
+    "gRPC": ["grpc"],
+    # Data and machine learning
+    "Machine Learning": ["machine learning", "ml"],
+    "Deep Learning": ["deep learning"],
+    "NLP": ["nlp", "natural language processing"],
+    "Computer Vision": ["computer vision"],
+    "LLMs": ["llm", "llms", "large language models"],
+    "TensorFlow": ["tensorflow"],
+    "PyTorch": ["pytorch", "torch"],
+    "scikit-learn": ["scikit-learn", "sklearn"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "Spark": ["spark", "pyspark", "apache spark"],
+    "Hadoop": ["hadoop"],
+    "Airflow": ["airflow"],
+    "Kafka": ["kafka"],
+    "dbt": ["dbt"],
+    "ETL": ["etl", "elt"],
+    "Data Analysis": ["data analysis", "data analytics"],
+    "Data Visualization": ["data visualization"],
+    "Statistics": ["statistics", "statistical analysis"],
+    "Tableau": ["tableau"],
+    "Power BI": ["power bi", "powerbi"],
+    "Microsoft Excel": ["microsoft excel", "ms excel"],
+    # Databases
+    "PostgreSQL": ["postgresql", "postgres"],
+    "MySQL": ["mysql"],
+    "SQL Server": ["sql server", "mssql"],
+    "Oracle": ["oracle"],
+    "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"],
+    "Elasticsearch": ["elasticsearch", "elastic search"],
+    "Cassandra": ["cassandra"],
+    "DynamoDB": ["dynamodb"],
+    "Snowflake": ["snowflake"],
+    "BigQuery": ["bigquery"],
+    "NoSQL": ["nosql"],
+    # Cloud and infrastructure
+    "AWS": ["aws", "amazon web services"],
+    "Azure": ["azure", "microsoft azure"],
+    "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Docker": ["docker", "containerization", "docker containers"],
+    "Kubernetes": ["kubernetes", "k8s"],
+    "Terraform": ["terraform"],
+    "Ansible": ["ansible"],
+    "Serverless": ["serverless", "aws lambda"],
+    "Linux": ["linux", "unix"],
+    "CI/CD": ["ci/cd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "Jenkins": ["jenkins"],
+    "GitHub Actions": ["github actions"],
+    "Git": ["git", "github", "gitlab"],
+    "Microservices": ["microservices", "microservice"],
+    "Distributed Systems": ["distributed systems"],
+    "System Design": ["system design"],
+    "Observability": ["observability", "monitoring"],
+    "Prometheus": ["prometheus"],
+    "Grafana": ["grafana"],
+    "Nginx": ["nginx"],
+    # Practices
+    "Agile": ["agile"],
+    "Scrum": ["scrum"],
+    "Kanban": ["kanban"],
+    "Unit Testing": ["unit testing", "unit tests"],
+    "Test Automation": ["test automation", "automated testing"],
+    "TDD": ["tdd", "test driven development", "test-driven development"],
+    "Code Review": ["code review", "code reviews"],
+    "Security": ["application security", "appsec", "information security", "cybersecurity", "security engineering"],
+    "OAuth": ["oauth", "oauth2"],
+    "Performance Optimization": ["performance optimization", "performance tuning"],
+    "Data Structures": ["data structures"],
+    "Algorithms": ["algorithms"],
+    "Object-Oriented Programming": ["oop", "object oriented programming", "object-oriented programming"],
+    # Mobile and frontend
+    "iOS": ["ios"],
+    "Android": ["android"],
+    "React Native": ["react native"],
+    "Flutter": ["flutter"],
+    "Responsive Design": ["responsive design"],
+    "Accessibility": ["accessibility", "wcag"],
+    "UI/UX": ["ui/ux", "ux", "user experience"],
+    "Figma": ["figma"],
+    # Product and collaboration
+    "Product Management": ["product management"],
+    "Project Management": ["project management"],
+    "Stakeholder Management": ["stakeholder management", "stakeholders"],
+    "Leadership": ["leadership", "team lead", "led a team"],
+    "Mentoring": ["mentoring", "mentorship", "mentored"],
+    "Communication": ["communication", "communication skills"],
+    "Collaboration": ["collaboration", "cross-functional", "cross functional"],
+    "Problem Solving": ["problem solving", "problem-solving"],
+    "Jira": ["jira"],
+}
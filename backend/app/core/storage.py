@@ -1,33 +1,233 @@
 """Supabase storage client and utilities."""
-from typing import BinaryIO, Optional
-from supabase import create_client, Client
+from typing import AsyncIterator, BinaryIO, Dict, List, Optional, Union
+from pathlib import Path
+import asyncio
+import inspect
+import os
+import httpx
 from ..config import get_settings
+from .http import get_http_client
 import logging
 from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
 
+FileSource = Union[bytes, bytearray, memoryview, BinaryIO, AsyncIterator[bytes]]
+
+async def iter_chunks(file: FileSource, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Yield a file source in chunks without materialising extra copies.
+    
+    Buffers are sliced through a memoryview; file-like objects (including
+    FastAPI's UploadFile) are read incrementally; async iterators are
+    passed through unchanged.
+    """
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        view = memoryview(file)
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+    elif hasattr(file, 'read'):
+        read = file.read
+        while True:
+            if inspect.iscoroutinefunction(read):
+                chunk = await read(chunk_size)
+            else:
+                chunk = await asyncio.to_thread(read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        async for chunk in file:
+            yield chunk
+
+class SupabaseStorageBackend:
+    """Talk to the Supabase Storage REST API over the shared HTTP pool."""
+    
+    def __init__(self, url: str, key: str, bucket_name: str, chunk_size: int):
+        self.base_url = f"{url.rstrip('/')}/storage/v1"
+        self.bucket_name = bucket_name
+        self.chunk_size = chunk_size
+        self.headers = {
+            "Authorization": f"Bearer {key}",
+            "apikey": key
+        }
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return get_http_client()
+    
+    async def ensure_bucket(self):
+        response = await self.client.get(
+            f"{self.base_url}/bucket/{self.bucket_name}",
+            headers=self.headers
+        )
+        if response.status_code == 200:
+            return
+        response = await self.client.post(
+            f"{self.base_url}/bucket",
+            headers=self.headers,
+            json={"id": self.bucket_name, "name": self.bucket_name, "public": False}
+        )
+        response.raise_for_status()
+    
+    async def upload(
+        self,
+        file_path: str,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str]
+    ):
+        async def body():
+            async for chunk in chunks:
+                yield bytes(chunk)
+        
+        headers = {
+            **self.headers,
+            "content-type": content_type or "application/octet-stream",
+            "x-upsert": "false"
+        }
+        response = await self.client.post(
+            f"{self.base_url}/object/{self.bucket_name}/{file_path}",
+            headers=headers,
+            content=body()
+        )
+        response.raise_for_status()
+    
+    def public_url(self, file_path: str) -> str:
+        return f"{self.base_url}/object/public/{self.bucket_name}/{file_path}"
+    
+    async def stream(self, file_path: str) -> AsyncIterator[bytes]:
+        async with self.client.stream(
+            "GET",
+            f"{self.base_url}/object/{self.bucket_name}/{file_path}",
+            headers=self.headers
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(self.chunk_size):
+                yield chunk
+    
+    async def delete(self, file_path: str):
+        response = await self.client.request(
+            "DELETE",
+            f"{self.base_url}/object/{self.bucket_name}",
+            headers=self.headers,
+            json={"prefixes": [file_path]}
+        )
+        response.raise_for_status()
+    
+    async def list(self, prefix: str) -> List[Dict]:
+        objects, offset, page_size = [], 0, 1000
+        while True:
+            response = await self.client.post(
+                f"{self.base_url}/object/list/{self.bucket_name}",
+                headers=self.headers,
+                json={"prefix": prefix, "limit": page_size, "offset": offset}
+            )
+            response.raise_for_status()
+            page = response.json()
+            objects.extend(page)
+            if len(page) < page_size:
+                return objects
+            offset += page_size
+
+class LocalStorageBackend:
+    """
+    Filesystem stand-in for Supabase Storage.
+    
+    Mirrors the bucket layout under ``UPLOAD_DIR`` so the service can run
+    (and be benchmarked) offline. Disk I/O runs in worker threads.
+    """
+    
+    def __init__(self, root: str, bucket_name: str, base_url: str, chunk_size: int):
+        self.root = Path(root) / bucket_name
+        self.base_url = base_url.rstrip('/')
+        self.chunk_size = chunk_size
+    
+    def _resolve(self, file_path: str) -> Path:
+        path = (self.root / file_path).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"Invalid storage path: {file_path}")
+        return path
+    
+    async def ensure_bucket(self):
+        await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+    
+    async def upload(
+        self,
+        file_path: str,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str]
+    ):
+        path = self._resolve(file_path)
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.part")
+        handle = await asyncio.to_thread(open, tmp_path, 'wb')
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(handle.write, chunk)
+        except BaseException:
+            handle.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        handle.close()
+        await asyncio.to_thread(os.replace, tmp_path, path)
+    
+    def public_url(self, file_path: str) -> str:
+        return f"{self.base_url}/{file_path}"
+    
+    async def stream(self, file_path: str) -> AsyncIterator[bytes]:
+        handle = await asyncio.to_thread(open, self._resolve(file_path), 'rb')
+        try:
+            while True:
+                chunk = await asyncio.to_thread(handle.read, self.chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            handle.close()
+    
+    async def delete(self, file_path: str):
+        await asyncio.to_thread(self._resolve(file_path).unlink)
+    
+    async def list(self, prefix: str) -> List[Dict]:
+        def scan():
+            folder = self._resolve(prefix)
+            if not folder.is_dir():
+                return []
+            return [
+                {"name": entry.name, "metadata": {"size": entry.stat().st_size}}
+                for entry in folder.iterdir()
+                if entry.is_file() and not entry.name.startswith('.')
+            ]
+        return await asyncio.to_thread(scan)
+
 class StorageService:
     """Handle file storage operations with Supabase."""
     
-    def __init__(self):
+    def __init__(self, backend=None):
         self.settings = get_settings()
-        self.client: Client = create_client(
+        self.bucket_name = "resumes"
+        self.chunk_size = self.settings.STORAGE_CHUNK_SIZE
+        self.backend = backend or self._create_backend()
+    
+    def _create_backend(self):
+        if self.settings.STORAGE_BACKEND == "local":
+            return LocalStorageBackend(
+                self.settings.UPLOAD_DIR,
+                self.bucket_name,
+                self.settings.LOCAL_STORAGE_BASE_URL,
+                self.chunk_size
+            )
+        return SupabaseStorageBackend(
             self.settings.SUPABASE_URL,
-            self.settings.SUPABASE_KEY
+            self.settings.SUPABASE_KEY,
+            self.bucket_name,
+            self.chunk_size
         )
-        self.bucket_name = "resumes"
     
     async def initialize(self):
         """Initialize storage bucket if it doesn't exist."""
         try:
-            # Check if bucket exists, create if it doesn't
-            buckets = self.client.storage.list_buckets()
-            if not any(b['name'] == self.bucket_name for b in buckets):
-                self.client.storage.create_bucket(
-                    self.bucket_name,
-                    public=False
-                )
+            await self.backend.ensure_bucket()
         except Exception as e:
             logger.error(f"Failed to initialize storage: {str(e)}")
             raise HTTPException(
@@ -37,7 +237,7 @@ class StorageService:
     
     async def upload_file(
         self,
-        file: BinaryIO,
+        file: FileSource,
         file_path: str,
         content_type: Optional[str] = None
     ) -> str:
@@ -45,27 +245,24 @@ class StorageService:
         Upload a file to Supabase storage.
         
         Args:
-            file: File-like object to upload
+            file: Bytes, file-like object or async iterator of chunks
             file_path: Path where file will be stored
             content_type: Optional MIME type
-            
+        
         Returns:
             URL of uploaded file
-            
+        
         Raises:
             HTTPException if upload fails
         """
         try:
-            # Upload file
-            result = self.client.storage.from_(self.bucket_name).upload(
-                path=file_path,
-                file=file,
-                file_options={"content-type": content_type} if content_type else None
+            await self.backend.upload(
+                file_path,
+                iter_chunks(file, self.chunk_size),
+                content_type
             )
-            
-            # Get public URL
-            return self.client.storage.from_(self.bucket_name).get_public_url(file_path)
-            
+            return self.backend.public_url(file_path)
+        
         except Exception as e:
             logger.error(f"Failed to upload file: {str(e)}")
             raise HTTPException(
@@ -73,21 +270,22 @@ class StorageService:
                 detail="File upload failed"
             )
     
-    async def get_file(self, file_path: str) -> bytes:
+    async def stream_file(self, file_path: str) -> AsyncIterator[bytes]:
         """
-        Retrieve a file from storage.
+        Stream a file from storage in chunks.
         
         Args:
             file_path: Path to file in storage
-            
-        Returns:
-            File contents as bytes
-            
+        
+        Yields:
+            Successive chunks of the file
+        
         Raises:
             HTTPException if file not found or retrieval fails
         """
         try:
-            return self.client.storage.from_(self.bucket_name).download(file_path)
+            async for chunk in self.backend.stream(file_path):
+                yield chunk
         except Exception as e:
             logger.error(f"Failed to retrieve file: {str(e)}")
             raise HTTPException(
@@ -95,18 +293,34 @@ class StorageService:
                 detail="File not found"
             )
     
+    async def get_file(self, file_path: str) -> bytes:
+        """
+        Retrieve a file from storage.
+        
+        Args:
+            file_path: Path to file in storage
+        
+        Returns:
+            File contents as bytes
+        
+        Raises:
+            HTTPException if file not found or retrieval fails
+        """
+        chunks = [chunk async for chunk in self.stream_file(file_path)]
+        return b"".join(chunks)
+    
     async def delete_file(self, file_path: str):
         """
         Delete a file from storage.
         
         Args:
             file_path: Path to file in storage
-            
+        
         Raises:
             HTTPException if deletion fails
         """
         try:
-            self.client.storage.from_(self.bucket_name).remove([file_path])
+            await self.backend.delete(file_path)
         except Exception as e:
             logger.error(f"Failed to delete file: {str(e)}")
             raise HTTPException(
@@ -114,22 +328,55 @@ class StorageService:
                 detail="File deletion failed"
             )
     
+    def path_from_url(self, file_url: str) -> Optional[str]:
+        """
+        Recover the storage path from a URL returned by upload_file.
+        
+        Args:
+            file_url: Public URL of a stored file
+        
+        Returns:
+            Path within the bucket, or None if the URL is not ours
+        """
+        prefix = self.backend.public_url("")
+        if file_url and file_url.startswith(prefix):
+            return file_url[len(prefix):]
+        return None
+    
+    async def measure_user_storage(self, user_id: str) -> int:
+        """
+        Sum the sizes of a user's stored files by listing their folder.
+        
+        This is O(files) and a full storage round trip; the hot path uses
+        the incremental counter in user_settings instead.
+        
+        Args:
+            user_id: User ID to measure
+        
+        Returns:
+            Total storage usage in bytes
+        
+        Raises:
+            Exception if the listing fails
+        """
+        files = await self.backend.list(f"user_{user_id}")
+        return sum((file.get('metadata') or {}).get('size', 0) for file in files)
+    
     async def get_user_storage_usage(self, user_id: str) -> int:
         """
         Get total storage usage for a user in bytes.
         
         Args:
             user_id: User ID to check
-            
+        
         Returns:
             Total storage usage in bytes
         """
         try:
-            files = self.client.storage.from_(self.bucket_name).list(f"user_{user_id}")
-            return sum(file.get('metadata', {}).get('size', 0) for file in files)
+            return await self.measure_user_storage(user_id)
         except Exception as e:
             logger.error(f"Failed to get storage usage: {str(e)}")
             return 0
 
 # Initialize storage service
-storage = StorageService()
\ No newline at end of file
+storage = StorageService()
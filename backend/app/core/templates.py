@@ -1,5 +1,9 @@
 """Resume section templates for AI-powered optimization."""
 
+# Bump whenever a template or response parsing changes so cached LLM
+# responses produced by older prompts are no longer reused.
+PROMPT_TEMPLATE_VERSION = "2"
+
 SECTION_TEMPLATES = {
     "contact": """Format the following contact information:
 {content}
@@ -51,6 +55,23 @@ Output format:
   * Impact: [quantifiable impact]"""
 }
 
+# System prompt for analyzing a single section; the user message carries
+# the section name, its text and the optional job description.
+SECTION_ANALYSIS_PROMPT = """You are an expert resume analyst. Analyze the given section of a resume and give:
+1. A score out of 100 for this section
+2. Specific feedback on improvements, as an object of category to suggestion
+3. Suggestions as a list of strings
+4. Keywords found in the section
+5. Important keywords that should be added to the section
+Format your response as JSON with the keys score, feedback, suggestions, keywords_found and missing_keywords."""
+
+# Used when keywords come from the local matcher (a job naming known skills)
+SECTION_FEEDBACK_PROMPT = """You are an expert resume analyst. Analyze the given section of a resume and give:
+1. A score out of 100 for this section
+2. Specific feedback on improvements, as an object of category to suggestion
+3. Suggestions as a list of strings
+Format your response as JSON with the keys score, feedback and suggestions."""
+
 RESUME_PROMPT_TEMPLATE = """Create a polished, professional resume for a {job_title} position using the following information:
 
 Contact Information:
@@ -0,0 +1,165 @@
+"""In-memory vector index with exact and LSH-approximate cosine search."""
+from typing import Dict, Hashable, List, Optional, Tuple
+import numpy as np
+
+class VectorIndex:
+    """
+    Unit vectors in one contiguous float32 matrix, mapped to ids.
+    
+    Rows are kept dense: removing a vector moves the last row into its
+    slot, and the matrix grows by doubling, so upserts and removals are
+    O(dimensions) and exact search is a single matrix-vector product.
+    
+    Once the index holds ``ann_min_size`` vectors it also keeps a
+    random-hyperplane LSH code per vector for each of ``tables`` tables
+    (``bits`` sign bits packed into a uint16, rows aligned with the
+    vectors). Approximate search then only rescores the rows that share a
+    code with the query in some table, falling back to exact search if
+    fewer than ``k`` do. Small indexes never pay for the codes.
+    """
+    
+    def __init__(
+        self,
+        dimensions: int,
+        ann_min_size: int = 1024,
+        tables: int = 24,
+        bits: int = 16,
+        seed: int = 0
+    ):
+        if not 0 < bits <= 16:
+            raise ValueError("bits must be between 1 and 16")
+        self.dimensions = dimensions
+        self.ann_min_size = ann_min_size
+        self.tables = tables
+        self.bits = bits
+        self.seed = seed
+        self.vectors = np.zeros((16, dimensions), dtype=np.float32)
+        self.ids: List[Hashable] = []
+        self.rows: Dict[Hashable, int] = {}
+        # LSH state, built by _build_lsh
+        self.planes: Optional[np.ndarray] = None
+        self.codes: Optional[np.ndarray] = None
+        self._powers = 1 << np.arange(bits, dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __contains__(self, id: Hashable) -> bool:
+        return id in self.rows
+    
+    @property
+    def nbytes(self) -> int:
+        size = self.vectors.nbytes
+        if self.planes is not None:
+            size += self.planes.nbytes + self.codes.nbytes
+        return size
+    
+    def _codes(self, vectors: np.ndarray) -> np.ndarray:
+        """LSH codes of ``vectors`` rows, shaped (tables, len(vectors))."""
+        above = (vectors @ self.planes.T > 0).reshape(len(vectors), self.tables, self.bits)
+        return (above.astype(np.int64) @ self._powers).astype(np.uint16).T
+    
+    def _build_lsh(self):
+        self.planes = np.random.default_rng(self.seed).standard_normal(
+            (self.tables * self.bits, self.dimensions)
+        ).astype(np.float32)
+        self.codes = np.zeros((self.tables, self.vectors.shape[0]), dtype=np.uint16)
+        self.codes[:, :len(self.ids)] = self._codes(self.vectors[:len(self.ids)])
+    
+    def _as_vector(self, vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if vector.shape[0] != self.dimensions:
+            raise ValueError(f"Expected {self.dimensions} dimensions, got {vector.shape[0]}")
+        return vector
+    
+    def _grow(self):
+        capacity = self.vectors.shape[0] * 2
+        vectors = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        vectors[:len(self.ids)] = self.vectors[:len(self.ids)]
+        self.vectors = vectors
+        if self.codes is not None:
+            codes = np.zeros((self.tables, capacity), dtype=np.uint16)
+            codes[:, :len(self.ids)] = self.codes[:, :len(self.ids)]
+            self.codes = codes
+    
+    def upsert(self, id: Hashable, vector: np.ndarray):
+        """Add a vector, or replace the vector stored under ``id``."""
+        vector = self._as_vector(vector)
+        row = self.rows.get(id)
+        if row is None:
+            row = len(self.ids)
+            if row == self.vectors.shape[0]:
+                self._grow()
+            self.ids.append(id)
+            self.rows[id] = row
+        self.vectors[row] = vector
+        
+        if self.codes is not None:
+            self.codes[:, row] = self._codes(vector[None, :])[:, 0]
+        elif len(self.ids) >= self.ann_min_size:
+            self._build_lsh()
+    
+    def remove(self, id: Hashable) -> bool:
+        """Remove ``id``; returns False if it was not indexed."""
+        row = self.rows.pop(id, None)
+        if row is None:
+            return False
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self.vectors[row] = self.vectors[last]
+            if self.codes is not None:
+                self.codes[:, row] = self.codes[:, last]
+            self.ids[row] = moved
+            self.rows[moved] = row
+        self.ids.pop()
+        return True
+    
+    def _candidates(self, query: np.ndarray) -> np.ndarray:
+        """Rows sharing an LSH code with ``query`` in at least one table."""
+        if self.codes is None:
+            self._build_lsh()
+        size = len(self.ids)
+        keys = self._codes(query[None, :])[:, 0]
+        hits = np.zeros(size, dtype=bool)
+        for codes, key in zip(self.codes[:, :size], keys):
+            hits |= codes == key
+        return np.flatnonzero(hits)
+    
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        approximate: Optional[bool] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Find the ``k`` vectors most similar to ``query``.
+        
+        Args:
+            query: Unit query vector
+            k: Number of results
+            approximate: Force LSH (True) or exact (False) search; by default
+                LSH is used once the index holds ``ann_min_size`` vectors
+        
+        Returns:
+            (id, cosine similarity) pairs, most similar first
+        """
+        query = self._as_vector(query)
+        if not self.ids or k <= 0:
+            return []
+        if approximate is None:
+            approximate = len(self.ids) >= self.ann_min_size
+        
+        rows = self._candidates(query) if approximate else None
+        if rows is None or len(rows) < k:
+            rows = np.arange(len(self.ids))
+            scores = self.vectors[:len(self.ids)] @ query
+        else:
+            scores = self.vectors[rows] @ query
+        
+        if k < len(rows):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.ids[rows[i]], float(scores[i])) for i in top]
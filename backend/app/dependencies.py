@@ -3,6 +3,7 @@ from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from .config import get_settings
 from .core.security import auth_handler
+from .services.llm_scheduler import set_llm_caller
 import logging
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,8 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate user"
         )
+    # Attribute LLM calls made while serving this request to the user
+    set_llm_caller(user_info)
     return user_info
 
 def check_roles(required_roles: list[str]):
@@ -3,6 +3,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from .config import get_settings
 from .routers import api_router
+from .core.database import db
+from .core.http import close_http_client
+from .core.limits import BodySizeLimitMiddleware
+from .core.security import auth_handler
+from .services.resume_optimizer import optimizer
+from .services.jobs import job_manager
+from .services.uploads import analysis_backfill
+from .services.quota import storage_reconciliation
+from .services.extraction import extraction_pool
 
 # Get settings
 settings = get_settings()
@@ -15,6 +24,17 @@ app = FastAPI(
     redoc_url=f"{settings.API_V1_STR}/redoc",
 )
 
+# Bound request bodies while they stream in (added before CORS so that
+# CORS stays outermost and 413s carry its headers)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    default_limit=settings.MAX_REQUEST_SIZE,
+    path_limits={
+        f"{settings.API_V1_STR}/resumes/upload": settings.MAX_UPLOAD_SIZE + settings.MAX_REQUEST_SIZE,
+        f"{settings.API_V1_STR}/resumes/batch": settings.BATCH_MAX_BYTES + settings.MAX_REQUEST_SIZE,
+    }
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -43,15 +63,24 @@ async def global_exception_handler(request: Request, exc: Exception):
 @app.on_event("startup")
 async def startup_event():
     """Initialize services and connections on startup."""
-    # TODO: Initialize services (e.g., database connections)
-    pass
+    await job_manager.start()
+    analysis_backfill.start()
+    storage_reconciliation.start()
+    auth_handler.jwks.refresh_task.start()
+    await extraction_pool.start()
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
-    # TODO: Clean up resources
-    pass
+    await analysis_backfill.stop()
+    await storage_reconciliation.stop()
+    await auth_handler.jwks.refresh_task.stop()
+    await job_manager.stop()
+    db.close()
+    extraction_pool.close()
+    await close_http_client()
+    await optimizer.cache.close()
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,8 +1,24 @@
-from .resume import Resume, ResumeCreate, ResumeUpdate, ResumeAnalysis
+from .resume import (
+    Resume, ResumeCreate, ResumeUpdate, ResumeAnalysis, SectionAnalysis, ResumeSummary, ResumePage,
+    ResumeVersion, KeywordMatch, JobRankingRequest, RankedJob, ResumeSearchRequest, ResumeSearchResult
+)
+from .job import Job, JobStage, JobStatus
 
 __all__ = [
     "Resume",
     "ResumeCreate",
     "ResumeUpdate",
-    "ResumeAnalysis"
+    "ResumeAnalysis",
+    "SectionAnalysis",
+    "ResumeSummary",
+    "ResumePage",
+    "ResumeVersion",
+    "KeywordMatch",
+    "JobRankingRequest",
+    "RankedJob",
+    "ResumeSearchRequest",
+    "ResumeSearchResult",
+    "Job",
+    "JobStage",
+    "JobStatus"
 ]
\ No newline at end of file
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+from uuid import UUID, uuid4
+
+class JobStatus:
+    """Job and stage lifecycle states."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    PENDING = "pending"
+
+class JobStage(BaseModel):
+    """Progress of a single job stage."""
+    name: str = Field(..., description="Stage name")
+    status: str = Field(JobStatus.PENDING, description="Stage status")
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class Job(BaseModel):
+    """Background job status."""
+    id: UUID = Field(default_factory=uuid4)
+    user_id: str = Field(..., description="ID of the user who submitted the job")
+    kind: str = Field(..., description="Job type")
+    status: str = Field(JobStatus.QUEUED, description="Overall job status")
+    stages: List[JobStage] = Field(default_factory=list, description="Per-stage progress")
+    result: Optional[Dict[str, Any]] = Field(None, description="Job result once succeeded")
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -3,6 +3,12 @@ from typing import Optional, List, Dict
 from datetime import datetime
 from uuid import UUID
 
+class AnalysisStatus:
+    """Resume analysis states."""
+    COMPLETE = "complete"
+    PENDING = "pending"
+    FAILED = "failed"
+
 class JobDescription(BaseModel):
     """Job description model."""
     title: str = Field(..., description="Job title")
@@ -32,8 +38,32 @@ class ResumeOptimizationRequest(BaseModel):
     job_description: Optional[JobDescription] = Field(None, description="Target job description")
     optimization_level: str = Field(
         "standard",
-        description="Level of optimization (standard, advanced, professional)"
+        description=(
+            "Level of optimization (standard, advanced, professional, sectioned). "
+            "'sectioned' optimizes each resume section in parallel."
+        )
+    )
+
+class SectionAnalysis(BaseModel):
+    """Analysis of one resume section, reused while the section is unchanged."""
+    fingerprint: str = Field(..., description="Hash of the section text and analysis inputs")
+    score: float = Field(..., description="Section score", ge=0, le=100)
+    feedback: List[Dict[str, str]] = Field(default_factory=list)
+    suggestions: List[str] = Field(default_factory=list)
+    keywords_found: List[str] = Field(default_factory=list)
+    missing_keywords: List[str] = Field(default_factory=list)
+    weight: int = Field(0, description="Section length, weights the overall score")
+
+class KeywordMatch(BaseModel):
+    """Local keyword match between a resume and a job description."""
+    score: Optional[float] = Field(
+        None,
+        description="Weighted share of the job's skills found in the resume (None if it names no known skills)",
+        ge=0,
+        le=100
     )
+    keywords_found: List[str] = Field(..., description="Job skills found in the resume")
+    missing_keywords: List[str] = Field(..., description="Job skills missing from the resume")
 
 class ResumeAnalysis(BaseModel):
     """Resume analysis results."""
@@ -42,7 +72,47 @@ class ResumeAnalysis(BaseModel):
     suggestions: List[str] = Field(..., description="Improvement suggestions")
     keywords_found: List[str] = Field(..., description="Relevant keywords found")
     missing_keywords: List[str] = Field(..., description="Suggested missing keywords")
+    keyword_score: Optional[float] = Field(
+        None,
+        description="Local keyword match score against the job description, if one was given",
+        ge=0,
+        le=100
+    )
     analysis_date: datetime = Field(default_factory=datetime.utcnow)
+    sections: Optional[Dict[str, SectionAnalysis]] = Field(
+        None,
+        description="Per-section results; edits re-analyze only sections whose fingerprint changed"
+    )
+
+class JobRankingRequest(BaseModel):
+    """Request model for ranking job descriptions against a resume."""
+    jobs: List[JobDescription] = Field(..., min_length=1, description="Job descriptions to rank")
+    explain_top: int = Field(
+        0,
+        ge=0,
+        description="Number of best-matching jobs to also analyze with the LLM"
+    )
+
+class RankedJob(KeywordMatch):
+    """A job description's keyword match against a resume."""
+    index: int = Field(..., description="Position of the job in the request")
+    title: str = Field(..., description="Job title")
+    company: Optional[str] = Field(None, description="Company name")
+    analysis: Optional[ResumeAnalysis] = Field(
+        None,
+        description="Detailed LLM analysis, for the top `explain_top` jobs"
+    )
+
+class ResumeSearchRequest(BaseModel):
+    """Request model for semantic resume search."""
+    query: str = Field(..., min_length=1, description="Free text, e.g. a role, skills or a job description")
+    limit: int = Field(10, ge=1, le=50, description="Maximum number of results")
+
+class ResumeSearchResult(BaseModel):
+    """A resume matching a search query."""
+    id: UUID
+    title: str
+    score: float = Field(..., description="Cosine similarity to the query")
 
 class Resume(ResumeBase):
     """Complete resume model including database fields."""
@@ -51,9 +121,60 @@ class Resume(ResumeBase):
     created_at: datetime
     updated_at: datetime
     analysis: Optional[ResumeAnalysis] = None
+    analysis_status: Optional[str] = Field(
+        None,
+        description="'pending' while analysis awaits backfill after an LLM outage, "
+                    "'failed' if the backfill could not analyze it"
+    )
     optimized_content: Optional[str] = Field(None, description="Optimized resume content")
     original_filename: Optional[str] = None
     file_url: Optional[HttpUrl] = None
+    file_size: Optional[int] = Field(None, description="Stored file size in bytes")
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ResumeSummary(BaseModel):
+    """
+    Lightweight resume listing entry.
+    
+    Large columns (content, optimized_content, analysis) are only present
+    when requested via ``fields``.
+    """
+    id: UUID
+    user_id: str
+    title: str
+    file_type: str
+    file_url: Optional[HttpUrl] = None
+    file_size: Optional[int] = None
+    score: Optional[float] = Field(None, description="Analysis score, if analyzed")
+    analysis_status: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    content: Optional[str] = None
+    optimized_content: Optional[str] = None
+    analysis: Optional[ResumeAnalysis] = None
+
+class ResumePage(BaseModel):
+    """One page of a cursor-paginated resume listing."""
+    items: List[ResumeSummary]
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Pass as `cursor` to fetch the next page; null on the last page"
+    )
+
+class ResumeVersion(BaseModel):
+    """One recorded version of a resume's content."""
+    version_number: int
+    kind: str = Field(..., description="'snapshot' (full text stored) or 'delta' (diff stored)")
+    source: Optional[str] = Field(None, description="What produced the version: original, edit, optimize")
+    content_length: Optional[int] = Field(None, description="Length of the version's text in characters")
+    created_at: datetime
+    content: Optional[str] = Field(None, description="Full text; only when fetching a single version")
+
+class OptimizedResume(Resume):
+    """Optimized resume including pipeline stage timings."""
+    stage_timings: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Wall-clock time per optimization stage in milliseconds"
+    )
\ No newline at end of file
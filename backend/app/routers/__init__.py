@@ -1,9 +1,10 @@
 from fastapi import APIRouter
-from . import health, resume
+from . import health, resume, jobs
 
 # Create main router
 api_router = APIRouter()
 
 # Include sub-routers
 api_router.include_router(health.router, prefix="/health", tags=["health"])
-api_router.include_router(resume.router, prefix="/resumes", tags=["resumes"])
\ No newline at end of file
+api_router.include_router(resume.router, prefix="/resumes", tags=["resumes"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
\ No newline at end of file
@@ -1,6 +1,12 @@
 from fastapi import APIRouter, Depends
 from ..dependencies import get_app_settings
 from ..config import Settings
+from ..services.resume_optimizer import optimizer
+from ..services.jobs import job_manager
+from ..services.quota import quota
+from ..services.extraction import extraction_pool
+from ..services.search import search_index
+from ..core.security import auth_handler
 
 router = APIRouter()
 
@@ -15,4 +21,22 @@ async def health_check(settings: Settings = Depends(get_app_settings)):
         "app_name": settings.APP_NAME,
         "version": "1.0.0",
         "api_version": settings.API_V1_STR
+    }
+
+@router.get("/metrics")
+async def metrics():
+    """
+    Runtime metrics endpoint.
+    Returns runtime counters for monitoring.
+    """
+    return {
+        "llm_cache": optimizer.cache.stats(),
+        "llm_inflight": optimizer.inflight.stats(),
+        "llm_scheduler": optimizer.scheduler.stats(),
+        "llm_breaker": optimizer.breaker.stats(),
+        "jobs": job_manager.stats(),
+        "storage_quota": quota.stats(),
+        "auth": auth_handler.stats(),
+        "extraction": extraction_pool.stats(),
+        "search": search_index.stats()
     }
\ No newline at end of file
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, HTTPException
+from uuid import UUID
+from ..models.job import Job
+from ..services.jobs import job_manager
+from ..dependencies import get_current_user
+
+router = APIRouter()
+
+@router.get("/{job_id}", response_model=Job)
+async def get_job(
+    job_id: UUID,
+    current_user: dict = Depends(get_current_user)
+):
+    """Report the status and per-stage progress of a background job."""
+    job = job_manager.get_job(job_id, current_user["user_id"])
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail="Job not found"
+        )
+    return job
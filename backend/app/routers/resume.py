@@ -1,64 +1,56 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, Body
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, Query, Header
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from typing import List, Optional
 from ..models.resume import (
-    Resume, ResumeCreate, ResumeUpdate, ResumeAnalysis,
-    JobDescription, ResumeOptimizationRequest
+    Resume, ResumeUpdate,
+    JobDescription, ResumeOptimizationRequest, OptimizedResume, AnalysisStatus,
+    ResumePage, ResumeVersion, KeywordMatch, JobRankingRequest, RankedJob,
+    ResumeSearchRequest, ResumeSearchResult
 )
-from ..services.resume_optimizer import ResumeOptimizer
+from ..services.resume_optimizer import optimizer, SECTIONED_OPTIMIZATION
+from ..services.pipeline import run_stages, timed_stage
+from ..services.jobs import job_manager, JobsDisabledError, QueueFullError
+from ..services.uploads import process_upload, UPLOAD_JOB, UPLOAD_STAGES
+from ..services.quota import quota
+from ..services.batch import process_batch, BatchFile
+from ..services.extraction import ExtractionError
+from ..services.intake import read_upload, detach_upload, UploadRejected
+from ..services.keywords import keyword_matcher, job_text
+from ..services.ranking import rank_jobs
+from ..services.versions import history, VersionSource, VersionIntegrityError
+from ..services.search import search_index
+from ..config import get_settings
 from ..dependencies import get_current_user, require_premium
 from ..core.storage import storage
 from ..core.database import db
-from uuid import UUID, uuid4
+from uuid import UUID
 import json
 import logging
 
 router = APIRouter()
-optimizer = ResumeOptimizer()
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
-@router.post("/upload", response_model=Resume)
+@router.post("/upload", response_model=Resume, responses={202: {"description": "Queued for background processing"}})
 async def upload_resume(
     file: UploadFile = File(...),
     job_description: Optional[str] = Form(None),
+    background: bool = Query(False, description="Process asynchronously and return a job ID"),
     current_user: dict = Depends(get_current_user)
 ):
     """Upload and analyze a resume file."""
     try:
-        # Validate file type
-        file_ext = file.filename.split('.')[-1].lower()
-        if file_ext not in ['pdf', 'docx']:
-            raise HTTPException(
-                status_code=400,
-                detail="Only PDF and DOCX files are supported"
-            )
+        # Validate type, size and content while reading
+        uploaded = await read_upload(file)
         
         # Check storage quota
-        usage = await storage.get_user_storage_usage(current_user["user_id"])
-        if usage >= 50 * 1024 * 1024:  # 50MB limit
+        usage = await quota.get_usage(current_user["user_id"])
+        if not usage.allows(uploaded.size):
             raise HTTPException(
                 status_code=400,
                 detail="Storage quota exceeded"
             )
         
-        # Generate unique file path
-        file_id = str(uuid4())
-        file_path = f"user_{current_user['user_id']}/{file_id}.{file_ext}"
-        
-        # Upload file to storage
-        content = await file.read()
-        file_url = await storage.upload_file(
-            content,
-            file_path,
-            file.content_type
-        )
-        
-        # Extract and analyze text
-        text_content = await optimizer.extract_text_from_resume(
-            content,
-            file_ext
-        )
-        
         # Parse job description if provided
         job_info = None
         if job_description:
@@ -71,30 +63,57 @@ async def upload_resume(
                     detail="Invalid job description format"
                 )
         
-        # Analyze resume
-        analysis = await optimizer.analyze_resume(
-            text_content,
-            str(job_info) if job_info else None
-        )
+        upload = {
+            "user_id": current_user["user_id"],
+            "filename": uploaded.filename,
+            "file_ext": uploaded.file_ext,
+            "content": uploaded.content,
+            "content_type": uploaded.content_type,
+            "job_info": job_info,
+            "content_hash": uploaded.sha256
+        }
         
-        # Create resume record
-        resume = ResumeCreate(
-            title=file.filename,
-            content=text_content,
-            file_type=file_ext,
-            user_id=current_user["user_id"]
-        )
+        if background:
+            try:
+                job = await job_manager.submit(
+                    UPLOAD_JOB,
+                    current_user["user_id"],
+                    upload,
+                    stages=UPLOAD_STAGES
+                )
+            except JobsDisabledError:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Background processing is not available on this server"
+                )
+            except QueueFullError:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Upload queue is full, please retry later"
+                )
+            return JSONResponse(
+                status_code=202,
+                content={
+                    "job_id": str(job.id),
+                    "status": job.status,
+                    "status_url": f"{settings.API_V1_STR}/jobs/{job.id}"
+                }
+            )
         
-        # Save to database
-        complete_resume = await db.create_resume(resume, file_url)
+        return await process_upload(**upload)
         
-        # Update with analysis
-        return await db.update_resume(
-            complete_resume.id,
-            current_user["user_id"],
-            {"analysis": analysis.model_dump()}
+    except HTTPException:
+        raise
+    except UploadRejected as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.detail
+        )
+    except ExtractionError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=str(e)
         )
-        
     except Exception as e:
         logger.error(f"Error processing resume: {str(e)}")
         raise HTTPException(
@@ -102,24 +121,160 @@ async def upload_resume(
             detail=f"Failed to process resume: {str(e)}"
         )
 
-@router.get("", response_model=List[Resume])
-async def list_resumes(current_user: dict = Depends(get_current_user)):
-    """List all resumes for the current user."""
-    return await db.list_user_resumes(current_user["user_id"])
+@router.post("/batch", responses={200: {"content": {"application/x-ndjson": {}}}})
+async def upload_resume_batch(
+    files: List[UploadFile] = File(...),
+    job_description: Optional[str] = Form(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Upload and analyze many resume files at once.
+    
+    Streams newline-delimited JSON: one line per file as it finishes
+    (`index`, `filename`, `status`, `resume_id` or `error`), then a final
+    summary line.
+    """
+    if len(files) > settings.BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.BATCH_MAX_FILES} files per batch"
+        )
+    if sum(file.size or 0 for file in files) > settings.BATCH_MAX_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail="Batch is too large"
+        )
+    
+    job_info = None
+    if job_description:
+        try:
+            job_info = JobDescription(**json.loads(job_description))
+        except json.JSONDecodeError:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid job description format"
+            )
+    
+    # Files are read and validated one by one inside the batch's bounded
+    # tasks. The form closes its files once this handler returns, before
+    # the response body is streamed, so take them over first.
+    usage = await quota.get_usage(current_user["user_id"])
+    accepted_bytes = 0
+    rejected = []
+    batch = []
+    for index, file in enumerate(files):
+        size = file.size or 0
+        if not usage.allows(accepted_bytes + size):
+            rejected.append({"index": index, "filename": file.filename, "status": "failed",
+                             "error": "Storage quota exceeded"})
+            continue
+        accepted_bytes += size
+        batch.append(BatchFile(index, detach_upload(file)))
+    
+    async def lines():
+        succeeded = 0
+        for item in rejected:
+            yield json.dumps(item) + "\n"
+        async for item in process_batch(current_user["user_id"], batch, job_info):
+            succeeded += item["status"] == "succeeded"
+            yield json.dumps(item) + "\n"
+        yield json.dumps({
+            "done": True,
+            "total": len(files),
+            "succeeded": succeeded,
+            "failed": len(files) - succeeded
+        }) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.get("", response_model=ResumePage, response_model_exclude_unset=True)
+async def list_resumes(
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated large fields to include: content, optimized_content, analysis"
+    ),
+    current_user: dict = Depends(get_current_user)
+):
+    """List the current user's resumes, newest first, one page at a time."""
+    requested = [f.strip() for f in fields.split(',') if f.strip()] if fields else []
+    try:
+        items, next_cursor = await db.list_user_resumes(
+            current_user["user_id"],
+            limit,
+            cursor=cursor,
+            fields=requested
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    return ResumePage(items=items, next_cursor=next_cursor)
+
+@router.post("/search", response_model=List[ResumeSearchResult])
+async def search_resumes(
+    request: ResumeSearchRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Find the current user's resumes most similar to a free-text query.
+    
+    Matches titles and content by embedding similarity, e.g. "data
+    engineering" finds the variant tailored for data engineering roles.
+    """
+    try:
+        results = await search_index.search(current_user["user_id"], request.query, request.limit)
+    except Exception as e:
+        if optimizer.is_unavailable(e):
+            logger.warning(f"Embeddings unavailable, cannot search resumes: {str(e)}")
+            raise HTTPException(
+                status_code=503,
+                detail="Resume search is temporarily unavailable, please retry shortly",
+                headers={"Retry-After": str(max(1, int(getattr(e, "retry_after", 0))))}
+            )
+        logger.error(f"Error searching resumes: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to search resumes: {str(e)}"
+        )
+    return [
+        ResumeSearchResult(id=resume_id, title=title, score=round(score, 4))
+        for resume_id, title, score in results
+    ]
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
 
-@router.get("/{resume_id}", response_model=Resume)
+@router.get("/{resume_id}", response_model=Resume, responses={304: {"description": "Not modified"}})
 async def get_resume(
     resume_id: UUID,
+    if_none_match: Optional[str] = Header(None),
     current_user: dict = Depends(get_current_user)
 ):
-    """Retrieve a specific resume and its analysis."""
-    resume = await db.get_resume(resume_id, current_user["user_id"])
-    if not resume:
+    """
+    Retrieve a specific resume and its analysis.
+    
+    Returns an ETag; send it back in If-None-Match to get 304 while the
+    resume is unchanged.
+    """
+    entry = await db.get_resume_entry(resume_id, current_user["user_id"])
+    if not entry:
         raise HTTPException(
             status_code=404,
             detail="Resume not found"
         )
-    return resume
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
 
 @router.put("/{resume_id}", response_model=Resume)
 async def update_resume(
@@ -127,9 +282,9 @@ async def update_resume(
     resume_update: ResumeUpdate,
     current_user: dict = Depends(get_current_user)
 ):
-    """Update a resume's content and trigger re-analysis."""
+    """Update a resume's content, record it as a version and trigger re-analysis."""
     # Verify resume exists and belongs to user
-    existing = await db.get_resume(resume_id, current_user["user_id"])
+    existing = await db.get_resume(resume_id, current_user["user_id"], use_cache=False)
     if not existing:
         raise HTTPException(
             status_code=404,
@@ -141,19 +296,35 @@ async def update_resume(
         updates = resume_update.model_dump(exclude_unset=True)
         if updates.get('content'):
             # Re-analyze if content changed
-            analysis = await optimizer.analyze_resume(updates['content'])
-            return await db.update_resume(
+            try:
+                # Only sections that changed are sent to the LLM again
+                analysis = await optimizer.analyze_resume_sections(
+                    updates['content'],
+                    previous=existing.analysis
+                )
+            except Exception as e:
+                if not optimizer.is_unavailable(e):
+                    raise
+                # Degraded mode: save the edit, analyze later via backfill
+                logger.warning(f"LLM unavailable, deferring analysis for resume {resume_id}: {str(e)}")
+                updates["analysis_status"] = AnalysisStatus.PENDING
+                analysis = None
+            updated = await db.update_resume(
                 resume_id,
                 current_user["user_id"],
                 updates,
                 analysis
             )
+            if updated.content != existing.content:
+                await history.record(resume_id, existing.content, updated.content, VersionSource.EDIT)
         else:
-            return await db.update_resume(
+            updated = await db.update_resume(
                 resume_id,
                 current_user["user_id"],
                 updates
             )
+        await search_index.upsert(updated)
+        return updated
             
     except Exception as e:
         logger.error(f"Error updating resume: {str(e)}")
@@ -162,7 +333,68 @@ async def update_resume(
             detail=f"Failed to update resume: {str(e)}"
         )
 
-@router.post("/{resume_id}/optimize", response_model=Resume)
+@router.post("/{resume_id}/keywords", response_model=KeywordMatch)
+async def match_resume_keywords(
+    resume_id: UUID,
+    job: JobDescription,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Match a resume's skills against a job description.
+    
+    Runs locally over the skills vocabulary (no LLM call), so it returns
+    in milliseconds and is available to every user, even while the LLM is
+    unavailable.
+    """
+    resume = await db.get_resume(resume_id, current_user["user_id"])
+    if not resume:
+        raise HTTPException(
+            status_code=404,
+            detail="Resume not found"
+        )
+    
+    return keyword_matcher.match(resume.content, job_text(job), job.requirements)
+
+@router.post("/{resume_id}/rank-jobs", response_model=List[RankedJob])
+async def rank_resume_jobs(
+    resume_id: UUID,
+    request: JobRankingRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Rank job descriptions by how well a resume fits them, best first.
+    
+    All jobs are scored locally in one pass; only the top `explain_top`
+    are sent to the LLM for a detailed analysis.
+    """
+    if len(request.jobs) > settings.JOB_RANKING_MAX_JOBS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.JOB_RANKING_MAX_JOBS} job descriptions per request"
+        )
+    if request.explain_top > settings.JOB_RANKING_MAX_EXPLAIN:
+        raise HTTPException(
+            status_code=400,
+            detail=f"explain_top can be at most {settings.JOB_RANKING_MAX_EXPLAIN}"
+        )
+    
+    resume = await db.get_resume(resume_id, current_user["user_id"])
+    if not resume:
+        raise HTTPException(
+            status_code=404,
+            detail="Resume not found"
+        )
+    
+    try:
+        return await rank_jobs(resume.content, request.jobs, request.explain_top)
+    except Exception as e:
+        logger.error(f"Error ranking jobs: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to rank jobs: {str(e)}"
+        )
+
+@router.post("/{resume_id}/optimize", response_model=OptimizedResume)
 async def optimize_resume(
     resume_id: UUID,
     request: ResumeOptimizationRequest,
@@ -170,7 +402,7 @@ async def optimize_resume(
 ):
     """Premium feature: Optimize resume for a specific job."""
     # Verify resume exists and belongs to user
-    resume = await db.get_resume(resume_id, current_user["user_id"])
+    resume = await db.get_resume(resume_id, current_user["user_id"], use_cache=False)
     if not resume:
         raise HTTPException(
             status_code=404,
@@ -178,34 +410,162 @@ async def optimize_resume(
         )
     
     try:
-        # Analyze resume against job description
-        analysis = await optimizer.analyze_resume(
-            resume.content,
-            str(request.job_description) if request.job_description else None
-        )
-        
-        # Generate optimized content
+        # Analysis and generation are independent LLM calls, so run them
+        # concurrently; a failure in either cancels the other.
         sections = optimizer.classify_sections(resume.content)
-        optimized = await optimizer.generate_optimized_resume(
-            sections,
-            request.job_description.title if request.job_description else None
-        )
+        if request.optimization_level == SECTIONED_OPTIMIZATION:
+            generate = optimizer.generate_sectioned_resume
+        else:
+            generate = optimizer.generate_optimized_resume
+        results, timings = await run_stages({
+            "analyze": optimizer.analyze_resume(
+                resume.content,
+                request.job_description
+            ),
+            "optimize": generate(
+                sections,
+                request.job_description.title if request.job_description else None
+            )
+        })
+        optimized = results["optimize"]
         
         # Update resume with optimized content and analysis
-        return await db.update_resume(
-            resume_id,
-            current_user["user_id"],
-            {"content": optimized, "optimized_content": optimized},
-            analysis
-        )
+        with timed_stage(timings, "persist"):
+            updated = await db.update_resume(
+                resume_id,
+                current_user["user_id"],
+                {"content": optimized, "optimized_content": optimized},
+                results["analyze"]
+            )
+            await history.record(resume_id, resume.content, optimized, VersionSource.OPTIMIZE)
+            await search_index.upsert(updated)
+        
+        return OptimizedResume(**updated.model_dump(), stage_timings=timings)
         
     except Exception as e:
+        if optimizer.is_unavailable(e):
+            logger.warning(f"LLM unavailable, cannot optimize resume: {str(e)}")
+            raise HTTPException(
+                status_code=503,
+                detail="Resume optimization is temporarily unavailable, please retry shortly",
+                headers={"Retry-After": str(max(1, int(getattr(e, "retry_after", 0))))}
+            )
         logger.error(f"Error optimizing resume: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to optimize resume: {str(e)}"
         )
 
+@router.post("/{resume_id}/optimize/stream")
+async def stream_optimize_resume(
+    resume_id: UUID,
+    request: ResumeOptimizationRequest,
+    current_user: dict = Depends(require_premium)
+):
+    """
+    Premium feature: Stream an optimized resume as server-sent events.
+    
+    Emits one `line` event per cleaned line as the model generates it,
+    then persists the full text and emits `done` with the updated resume ID.
+    """
+    resume = await db.get_resume(resume_id, current_user["user_id"], use_cache=False)
+    if not resume:
+        raise HTTPException(
+            status_code=404,
+            detail="Resume not found"
+        )
+    
+    sections = optimizer.classify_sections(resume.content)
+    job_title = request.job_description.title if request.job_description else "Software Engineering"
+    
+    def sse(event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    
+    async def events():
+        lines = []
+        try:
+            async for line in optimizer.stream_optimized_resume(sections, job_title):
+                lines.append(line)
+                yield sse("line", {"text": line})
+            
+            optimized = "\n".join(lines)
+            updated = await db.update_resume(
+                resume_id,
+                current_user["user_id"],
+                {"content": optimized, "optimized_content": optimized}
+            )
+            await history.record(resume_id, resume.content, optimized, VersionSource.OPTIMIZE)
+            await search_index.upsert(updated)
+            yield sse("done", {"resume_id": str(updated.id), "updated_at": updated.updated_at.isoformat()})
+            
+        except Exception as e:
+            logger.error(f"Error streaming optimized resume: {str(e)}")
+            yield sse("error", {"detail": f"Failed to optimize resume: {str(e)}"})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/{resume_id}/versions", response_model=List[ResumeVersion], response_model_exclude_none=True)
+async def list_resume_versions(
+    resume_id: UUID,
+    current_user: dict = Depends(get_current_user)
+):
+    """List a resume's content versions, newest first (without content)."""
+    resume = await db.get_resume(resume_id, current_user["user_id"])
+    if not resume:
+        raise HTTPException(
+            status_code=404,
+            detail="Resume not found"
+        )
+    
+    try:
+        return await history.list(resume_id)
+    except Exception as e:
+        logger.error(f"Error listing resume versions: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to list resume versions: {str(e)}"
+        )
+
+@router.get("/{resume_id}/versions/{version_number}", response_model=ResumeVersion)
+async def get_resume_version(
+    resume_id: UUID,
+    version_number: int,
+    current_user: dict = Depends(get_current_user)
+):
+    """Get one version of a resume, including its full content."""
+    resume = await db.get_resume(resume_id, current_user["user_id"])
+    if not resume:
+        raise HTTPException(
+            status_code=404,
+            detail="Resume not found"
+        )
+    
+    try:
+        version = await history.get(resume_id, version_number)
+    except VersionIntegrityError as e:
+        logger.error(str(e))
+        raise HTTPException(
+            status_code=500,
+            detail="Resume version could not be restored"
+        )
+    except Exception as e:
+        logger.error(f"Error fetching resume version: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch resume version: {str(e)}"
+        )
+    
+    if not version:
+        raise HTTPException(
+            status_code=404,
+            detail="Version not found"
+        )
+    return version
+
 @router.delete("/{resume_id}")
 async def delete_resume(
     resume_id: UUID,
@@ -213,7 +573,7 @@ async def delete_resume(
 ):
     """Delete a resume and its associated file."""
     # Verify resume exists and belongs to user
-    resume = await db.get_resume(resume_id, current_user["user_id"])
+    resume = await db.get_resume(resume_id, current_user["user_id"], use_cache=False)
     if not resume:
         raise HTTPException(
             status_code=404,
@@ -222,11 +582,17 @@ async def delete_resume(
     
     try:
         # Delete from storage first
-        file_path = f"user_{current_user['user_id']}/{resume_id}"
-        await storage.delete_file(file_path)
+        file_path = storage.path_from_url(str(resume.file_url))
+        if file_path:
+            await storage.delete_file(file_path)
         
         # Then delete from database
         await db.delete_resume(resume_id, current_user["user_id"])
+        search_index.remove(current_user["user_id"], resume_id)
+        
+        # Unknown sizes (older resumes) are corrected by reconciliation
+        if file_path and resume.file_size:
+            await quota.record(current_user["user_id"], -resume.file_size)
         
         return JSONResponse(
             status_code=200,
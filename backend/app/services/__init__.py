@@ -1,3 +1,3 @@
-from .resume_optimizer import ResumeOptimizer
+from .resume_optimizer import ResumeOptimizer, optimizer
 
-__all__ = ["ResumeOptimizer"]
\ No newline at end of file
+__all__ = ["ResumeOptimizer", "optimizer"]
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""Batch resume uploads: bounded, pipelined processing with bulk inserts."""
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+import asyncio
+import logging
+from fastapi import UploadFile
+from ..config import get_settings
+from ..core.database import db
+from ..models.resume import Resume, JobDescription
+from .intake import read_upload, UploadRejected
+from .uploads import process_upload
+
+logger = logging.getLogger(__name__)
+
+class BatchFile(NamedTuple):
+    """One file of a batch upload, still unread (see intake.detach_upload)."""
+    index: int
+    file: UploadFile
+
+class BulkResumeWriter:
+    """
+    Coalesce resume inserts into bulk writes.
+    
+    Rows added within ``delay`` seconds of each other, up to ``max_rows``
+    at a time, are written with one ``create_resumes`` call; each caller
+    gets its own Resume back (or the shared error).
+    """
+    
+    def __init__(self, max_rows: int, delay: float):
+        self.max_rows = max_rows
+        self.delay = delay
+        self._pending: List[Tuple[Dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._writes: List[asyncio.Task] = []
+        self.flushes = 0
+    
+    async def add(self, row: Dict) -> Resume:
+        """Queue a row (see db.resume_row) and wait until it is written."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((row, future))
+        if len(self._pending) >= self.max_rows:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.delay, self._flush)
+        # Shielded: once queued the row is written even if the caller goes away
+        return await asyncio.shield(future)
+    
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self._writes.append(asyncio.ensure_future(self._write(batch)))
+    
+    async def _write(self, batch: List[Tuple[Dict, asyncio.Future]]):
+        self.flushes += 1
+        try:
+            resumes = await db.create_resumes([row for row, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), resume in zip(batch, resumes):
+            if not future.done():
+                future.set_result(resume)
+    
+    async def close(self):
+        """Write anything still pending and wait for in-flight writes."""
+        self._flush()
+        await asyncio.gather(*self._writes, return_exceptions=True)
+
+async def process_batch(
+    user_id: str,
+    files: List[BatchFile],
+    job_info: Optional[JobDescription] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Process a batch of uploads, yielding each item's status as it finishes.
+    
+    Up to BATCH_CONCURRENCY files move through read (intake validation) ->
+    extract (process pool) -> store -> analyze (LLM scheduler) at once, so
+    parsing, storage writes and LLM calls of different files overlap and
+    at most that many files are held in memory. Saves are coalesced into
+    bulk inserts. Every file is closed once processed.
+    
+    Args:
+        user_id: Owner of the resumes
+        files: Files to process
+        job_info: Optional job description to analyze against
+    
+    Yields:
+        Per-item dicts with index, filename, status and resume_id or error
+    """
+    settings = get_settings()
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+    writer = BulkResumeWriter(settings.BATCH_INSERT_SIZE, settings.BATCH_INSERT_DELAY)
+    
+    async def run(item: BatchFile) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"index": item.index, "filename": item.file.filename}
+        async with semaphore:
+            try:
+                uploaded = await read_upload(item.file)
+                resume = await process_upload(
+                    user_id,
+                    uploaded.filename,
+                    uploaded.file_ext,
+                    uploaded.content,
+                    uploaded.content_type,
+                    job_info,
+                    save=writer.add,
+                    content_hash=uploaded.sha256
+                )
+            except UploadRejected as e:
+                return {**result, "status": "failed", "error": e.detail}
+            except Exception as e:
+                logger.error(f"Batch item {item.file.filename} failed: {str(e)}")
+                return {**result, "status": "failed", "error": str(e)}
+            finally:
+                await item.file.close()
+        return {
+            **result,
+            "status": "succeeded",
+            "resume_id": str(resume.id),
+            "analysis_status": resume.analysis_status
+        }
+    
+    tasks = [asyncio.ensure_future(run(item)) for item in files]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        # Client went away or the batch finished: stop leftovers, flush writes
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Files of tasks cancelled before they started
+        for item in files:
+            await item.file.close()
+        await writer.close()
@@ -0,0 +1,153 @@
+"""Pluggable text embedding providers."""
+from typing import Callable, Dict, List, Sequence
+from abc import ABC, abstractmethod
+from functools import lru_cache
+import asyncio
+import zlib
+import numpy as np
+from ..config import get_settings
+from .keywords import tokenize
+from .resume_optimizer import optimizer
+
+# Too common to say anything about what a resume is about
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our "
+    "the their to was were will with we you your i my me".split()
+)
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+class EmbeddingProvider(ABC):
+    """
+    Turns texts into L2-normalized float32 vectors of ``dimensions`` length.
+    
+    Vectors from different providers (or dimensions) are not comparable,
+    so indexes must be rebuilt when the provider changes.
+    """
+    name = "base"
+    
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+    
+    @abstractmethod
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed ``texts`` as a (len(texts), dimensions) float32 matrix."""
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic local embeddings via the hashing trick.
+    
+    Words (minus stopwords) and adjacent word pairs are hashed with CRC32
+    into ``dimensions`` signed buckets and weighted ``log(1 + count)``.
+    Needs no model or network and gives the same vector for the same text
+    in every process, so it works offline and in tests. Similarity is
+    lexical: "data engineering" matches texts that say so, not synonyms.
+    """
+    name = "hashing"
+    
+    def __init__(self, dimensions: int = 512):
+        super().__init__(dimensions)
+        self._feature = lru_cache(maxsize=1 << 16)(self._hash_feature)
+    
+    def _hash_feature(self, feature: str):
+        digest = zlib.crc32(feature.encode('utf-8'))
+        return digest % self.dimensions, 1.0 if digest & 0x80000000 else -1.0
+    
+    def embed_text(self, text: str) -> np.ndarray:
+        words = [token for token in tokenize(text) if token not in STOPWORDS]
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        if not features:
+            return vector
+        counts: Dict[tuple, int] = {}
+        for feature in features:
+            key = self._feature(feature)
+            counts[key] = counts.get(key, 0) + 1
+        indices = np.fromiter((index for index, _ in counts), dtype=np.intp, count=len(counts))
+        signs = np.fromiter((sign for _, sign in counts), dtype=np.float32, count=len(counts))
+        weights = np.log1p(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+        np.add.at(vector, indices, signs * weights)
+        return vector
+    
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return _normalize(np.vstack([self.embed_text(text) for text in texts]))
+    
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        # Whole resumes take a few ms each; keep batches off the event loop
+        if len(texts) > 1:
+            return await asyncio.to_thread(self.embed_many, texts)
+        return self.embed_many(texts)
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """
+    Embeddings from the OpenAI API (``EMBEDDING_MODEL``).
+    
+    Each batch goes through the same LLMScheduler (rate budgets, retries
+    with backoff) and circuit breaker as chat completions.
+    """
+    name = "openai"
+    
+    # Inputs per request, and a character cap keeping each under the
+    # model's token limit
+    BATCH_SIZE = 100
+    MAX_CHARS = 24000
+    
+    def __init__(self, client, model: str, dimensions: int, scheduler, breaker):
+        super().__init__(dimensions)
+        self.client = client
+        self.model = model
+        self.scheduler = scheduler
+        self.breaker = breaker
+    
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[List[float]] = []
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            batch = [text[:self.MAX_CHARS] or " " for text in texts[start:start + self.BATCH_SIZE]]
+            # Fail fast before queueing while the circuit is open
+            self.breaker.check()
+            response = await self.scheduler.run(
+                lambda: self.breaker.call(
+                    lambda: self.client.embeddings.create(
+                        model=self.model,
+                        input=batch,
+                        dimensions=self.dimensions
+                    )
+                ),
+                tokens=sum(len(text) for text in batch) // 4
+            )
+            rows.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+        if not rows:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return _normalize(np.asarray(rows, dtype=np.float32))
+
+def _openai_provider(dimensions: int) -> EmbeddingProvider:
+    # Reuse the optimizer's client, scheduler and breaker: same key, base
+    # URL, timeouts and rate budgets
+    return OpenAIEmbeddingProvider(
+        optimizer.client,
+        get_settings().EMBEDDING_MODEL,
+        dimensions,
+        optimizer.scheduler,
+        optimizer.breaker
+    )
+
+EMBEDDING_PROVIDERS: Dict[str, Callable[[int], EmbeddingProvider]] = {
+    "hashing": HashingEmbeddingProvider,
+    "openai": _openai_provider,
+}
+
+def get_embedding_provider(name: str, dimensions: int) -> EmbeddingProvider:
+    """
+    Create the embedding provider registered as ``name``.
+    
+    Raises:
+        ValueError if no provider has that name
+    """
+    factory = EMBEDDING_PROVIDERS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown embedding provider: {name}")
+    return factory(dimensions)
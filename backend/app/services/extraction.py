@@ -0,0 +1,443 @@
+"""Resume text extraction, run off the event loop on a process pool."""
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import re
+import zipfile
+from ..config import get_settings
+from ..core.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+class ExtractionError(Exception):
+    """A document could not be extracted (timeout, memory limit, crash)."""
+    pass
+
+class ScannedDocumentError(ExtractionError):
+    """A PDF has no text layer (scanned or image-only)."""
+    pass
+
+# Pages parsed by the first PDF task; decides early whether a PDF is scanned
+PDF_SAMPLE_PAGES = 2
+# Upper bound on pages per worker task, so text streams back in steps
+PDF_PAGES_PER_TASK = 16
+
+DOCX_ENGINES = ("streaming", "python-docx")
+
+# Workers are started from a clean server process, never forked from the
+# app: the pool is rebuilt mid-traffic by _recycle, when the app has DB
+# pool, to_thread and HTTP client threads whose held locks (logging, ssl)
+# a forked child would inherit
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_P, _TR, _TC = _W + "p", _W + "tr", _W + "tc"
+_TEXT_TAGS = {_W + "t": None, _W + "tab": "\t", _W + "br": "\n", _W + "cr": "\n"}
+# Text boxes are stored twice: a DrawingML mc:Choice and a VML mc:Fallback copy
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_HEADER_PART = re.compile(r"word/header\d*\.xml$")
+_FOOTER_PART = re.compile(r"word/footer\d*\.xml$")
+
+def _docx_parts(names) -> list:
+    """Headers, then the body, then footers (contact details often live in headers)."""
+    headers = sorted(name for name in names if _HEADER_PART.match(name))
+    footers = sorted(name for name in names if _FOOTER_PART.match(name))
+    body = ["word/document.xml"] if "word/document.xml" in names else []
+    return headers + body + footers
+
+def _stream_part(stream, lines: list):
+    """
+    Append the text of one WordprocessingML part to ``lines``.
+    
+    Paragraphs (including those in text boxes) become lines; table rows
+    become one tab-separated line. ``mc:Fallback`` copies of text boxes are
+    skipped. Elements are cleared as soon as they are consumed, so memory
+    stays flat however long the part is.
+    """
+    from lxml import etree  # ships with python-docx
+    
+    # Open paragraphs / cells / rows, innermost last: (tag, collected text)
+    stack: list = []
+    # Depth of mc:Fallback elements we are inside
+    fallback = 0
+    
+    def emit(text: str):
+        if stack and stack[-1][0] in (_TC, _TR):
+            stack[-1][1].append(text)
+        elif text:
+            lines.append(text)
+    
+    for event, elem in etree.iterparse(
+        stream, events=("start", "end"), resolve_entities=False, huge_tree=False
+    ):
+        tag = elem.tag
+        if tag == _MC_FALLBACK:
+            if event == "start":
+                fallback += 1
+            else:
+                fallback -= 1
+                elem.clear()
+            continue
+        if fallback:
+            continue
+        if event == "start":
+            if tag in (_P, _TC, _TR):
+                stack.append((tag, []))
+            continue
+        
+        if tag in _TEXT_TAGS:
+            if stack and stack[-1][0] == _P:
+                text = _TEXT_TAGS[tag]
+                stack[-1][1].append((elem.text or "") if text is None else text)
+        elif tag == _P:
+            emit("".join(stack.pop()[1]).strip())
+        elif tag == _TC:
+            emit(" ".join(part for part in stack.pop()[1] if part))
+        elif tag == _TR:
+            emit("\t".join(stack.pop()[1]).strip())
+        else:
+            continue
+        
+        # Drop the consumed element and the siblings already handled
+        elem.clear()
+        if tag in (_P, _TR):
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+def extract_docx_streaming(file_content: bytes) -> str:
+    """
+    Extract DOCX text by stream-parsing the package XML.
+    
+    Covers body paragraphs, tables, text boxes, headers and footers without
+    building python-docx's object tree.
+    """
+    lines: list = []
+    with zipfile.ZipFile(io.BytesIO(file_content)) as package:
+        parts = _docx_parts(package.namelist())
+        if not parts:
+            raise ValueError("Not a Word document: word/document.xml is missing")
+        for name in parts:
+            with package.open(name) as stream:
+                _stream_part(stream, lines)
+    return "\n".join(lines)
+
+def extract_docx_python_docx(file_content: bytes) -> str:
+    """Extract body paragraphs with python-docx (tables and headers are skipped)."""
+    from docx import Document
+    doc = Document(io.BytesIO(file_content))
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+
+def extract_pdf_pages(file_content: bytes, start: int, end: int) -> Tuple[int, List[str]]:
+    """
+    Extract the text of pages ``start`` to ``end`` (exclusive) of a PDF.
+    
+    Args:
+        file_content: Raw PDF bytes
+        start: First page index
+        end: Page index to stop at (clamped to the page count)
+    
+    Returns:
+        Tuple of the document's page count and one string per page
+    
+    Raises:
+        ExtractionError if the PDF cannot be read or is encrypted
+    """
+    from pypdf import PdfReader
+    from pypdf.errors import PyPdfError
+    try:
+        reader = PdfReader(io.BytesIO(file_content))
+        if reader.is_encrypted and not reader.decrypt(""):
+            raise ExtractionError("Password-protected PDFs are not supported")
+        count = len(reader.pages)
+        return count, [reader.pages[index].extract_text() or "" for index in range(start, min(end, count))]
+    except (PyPdfError, ValueError, KeyError) as e:
+        raise ExtractionError(f"Could not read PDF: {str(e)}")
+
+def extract_text(file_content: bytes, file_type: str, docx_engine: str = "streaming") -> str:
+    """
+    Extract plain text from a resume file (runs in a worker process).
+    
+    Args:
+        file_content: Raw file bytes
+        file_type: File extension
+        docx_engine: "streaming" or "python-docx"
+    
+    Returns:
+        Extracted text
+    
+    Raises:
+        ValueError for unsupported file types
+    """
+    if file_type.lower() == 'docx':
+        if docx_engine == "python-docx":
+            return extract_docx_python_docx(file_content)
+        return extract_docx_streaming(file_content)
+    if file_type.lower() == 'pdf':
+        _, pages = extract_pdf_pages(file_content, 0, 2 ** 31)
+        return "\n".join(pages)
+    raise ValueError(f"Unsupported file type: {file_type}")
+
+def _init_worker(memory_limit_bytes: int):
+    """Cap the worker's address space so a runaway document fails alone."""
+    if memory_limit_bytes <= 0:
+        return
+    try:
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not limit extraction worker memory: {str(e)}")
+
+def _warm_up() -> int:
+    # Import the parsers up front so the first real document doesn't pay for it
+    import docx  # noqa: F401
+    from lxml import etree  # noqa: F401
+    import pypdf  # noqa: F401
+    return os.getpid()
+
+class ExtractionPool:
+    """
+    Process pool that keeps CPU-bound document parsing off the event loop.
+    
+    At most one document per worker is handed to the pool at a time, so
+    ``timeout`` measures parsing rather than time spent queued. A document
+    that exceeds it has its worker killed: the pool is torn down and
+    replaced, and documents that were running next to it are retried on
+    the new pool. Each worker's address space is capped at
+    ``memory_limit_mb``; a document that blows through it fails with
+    ExtractionError instead of taking the host down.
+    
+    PDFs are split into page ranges that run on several workers at once;
+    their text is yielded page by page, in order, as ranges finish. A PDF
+    whose first pages carry (almost) no text is rejected before the rest
+    is parsed.
+    
+    Results are cached by content hash when the caller provides one, so a
+    resume uploaded again is not parsed again.
+    """
+    
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        memory_limit_mb: int = 0,
+        docx_engine: str = "streaming",
+        min_chars_per_page: int = 0,
+        cache_bytes: int = 0
+    ):
+        if docx_engine not in DOCX_ENGINES:
+            raise ValueError(f"Unknown DOCX extractor: {docx_engine}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout or None
+        self.memory_limit_mb = memory_limit_mb
+        self.docx_engine = docx_engine
+        self.min_chars_per_page = min_chars_per_page
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Warm-up of the current executor: (executor, task returning worker pids)
+        self._warm: Optional[Tuple[ProcessPoolExecutor, asyncio.Future]] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.cache = LRUCache(max_bytes=cache_bytes, ttl=3600) if cache_bytes > 0 else None
+        self.extracted = 0
+        self.pdf_pages = 0
+        self.scanned_rejected = 0
+        self.timeouts = 0
+        self.crashes = 0
+        self.restarts = 0
+    
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        # Created on first use so importing the app does not fork workers
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=_MP_CONTEXT,
+                initializer=_init_worker,
+                initargs=(self.memory_limit_mb * 1024 * 1024,)
+            )
+        return self._executor
+    
+    async def start(self):
+        """Spawn the workers and import the parsers before traffic arrives."""
+        pids = await self._ready()
+        logger.info(f"Extraction pool ready with {len(set(pids))} workers")
+    
+    async def _ready(self) -> List[int]:
+        """
+        Wait until the current pool's workers are up.
+        
+        Workers start from a fresh interpreter, which takes longer than a
+        fork; waiting here keeps that start-up (after a recycle too) out of
+        the per-document timeout.
+        """
+        executor = self.executor
+        if self._warm is None or self._warm[0] is not executor:
+            loop = asyncio.get_running_loop()
+            self._warm = (executor, asyncio.ensure_future(asyncio.gather(*[
+                loop.run_in_executor(executor, _warm_up) for _ in range(self.max_workers)
+            ])))
+        # Shielded: one caller going away must not cancel it for the rest
+        return await asyncio.shield(self._warm[1])
+    
+    async def extract(
+        self,
+        file_content: bytes,
+        file_type: str,
+        content_hash: Optional[str] = None
+    ) -> str:
+        """
+        Extract text from a resume file in worker processes.
+        
+        Args:
+            file_content: Raw file bytes
+            file_type: File extension
+            content_hash: Optional SHA-256 of the content, used as cache key
+        
+        Returns:
+            Extracted text
+        
+        Raises:
+            ScannedDocumentError if a PDF has no text layer
+            ExtractionError if the document is unreadable, times out,
+            exceeds the memory limit or crashes its worker
+            ValueError for unsupported file types
+        """
+        key = f"{content_hash}:{file_type.lower()}:{self.docx_engine}"
+        if content_hash and self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        if file_type.lower() == 'pdf':
+            text = "\n".join([page async for _, page in self.iter_pdf_pages(file_content)])
+        else:
+            text = await self._run(extract_text, file_content, file_type, self.docx_engine)
+        self.extracted += 1
+        
+        if content_hash and self.cache is not None:
+            self.cache.set(key, text)
+        return text
+    
+    async def iter_pdf_pages(self, file_content: bytes) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Yield ``(page_index, text)`` for every page of a PDF, in order.
+        
+        The first PDF_SAMPLE_PAGES pages are parsed first and checked for a
+        text layer; the remaining pages are split into ranges that run on
+        all workers in parallel.
+        
+        Raises:
+            ScannedDocumentError if the sampled pages carry no text
+            ExtractionError if the PDF cannot be extracted
+        """
+        page_count, sample = await self._run(extract_pdf_pages, file_content, 0, PDF_SAMPLE_PAGES)
+        self._check_text_layer(sample)
+        
+        remaining = page_count - len(sample)
+        size = max(1, min(PDF_PAGES_PER_TASK, -(-remaining // self.max_workers)))
+        tasks = [
+            asyncio.ensure_future(self._run(extract_pdf_pages, file_content, start, start + size))
+            for start in range(len(sample), page_count, size)
+        ]
+        try:
+            for index, text in enumerate(sample):
+                yield index, text
+            index = len(sample)
+            for task in tasks:
+                _, pages = await task
+                for text in pages:
+                    yield index, text
+                    index += 1
+            self.pdf_pages += page_count
+        finally:
+            # Stop parsing if the caller gave up or a range failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _check_text_layer(self, pages: List[str]):
+        chars = sum(len("".join(page.split())) for page in pages)
+        if pages and chars < self.min_chars_per_page * len(pages):
+            self.scanned_rejected += 1
+            raise ScannedDocumentError(
+                "PDF has no extractable text (scanned or image-only); "
+                "please upload a text-based PDF or a DOCX file"
+            )
+    
+    async def _run(self, fn: Callable, *args):
+        """Run ``fn(*args)`` on a worker, with the timeout and crash handling."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            # Two attempts: the first may be lost to another document's recycle
+            for _ in range(2):
+                executor = self.executor
+                try:
+                    await self._ready()
+                    if executor is not self._executor:
+                        continue  # recycled while its workers were starting
+                    future = loop.run_in_executor(executor, fn, *args)
+                    return await asyncio.wait_for(future, self.timeout)
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    self._recycle(executor, "document timed out")
+                    raise ExtractionError(f"Document took longer than {self.timeout:g}s to extract")
+                except BrokenProcessPool:
+                    if executor is not self._executor:
+                        continue
+                    self.crashes += 1
+                    self._recycle(executor, "worker crashed")
+                    raise ExtractionError("Document crashed the extractor (likely over the memory limit)")
+                except MemoryError:
+                    self.crashes += 1
+                    raise ExtractionError("Document exceeded the extraction memory limit")
+        raise ExtractionError("Extraction pool restarted repeatedly, please retry")
+    
+    def _recycle(self, executor: ProcessPoolExecutor, reason: str):
+        """Kill ``executor``'s workers and let the next call start a fresh pool."""
+        if executor is not self._executor:
+            return
+        logger.warning(f"Restarting extraction pool: {reason}")
+        self._executor = None
+        self.restarts += 1
+        # shutdown() can't stop a running task, so kill the processes first
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    def close(self):
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def stats(self) -> Dict:
+        return {
+            'workers': self.max_workers,
+            'docx_engine': self.docx_engine,
+            'running': self._executor is not None,
+            'extracted': self.extracted,
+            'pdf_pages': self.pdf_pages,
+            'scanned_rejected': self.scanned_rejected,
+            'timeouts': self.timeouts,
+            'crashes': self.crashes,
+            'restarts': self.restarts,
+            'cache': self.cache.stats() if self.cache is not None else None
+        }
+
+# Initialize extraction pool
+extraction_pool = ExtractionPool(
+    settings.EXTRACTION_WORKERS or None,
+    timeout=settings.EXTRACTION_TIMEOUT,
+    memory_limit_mb=settings.EXTRACTION_MEMORY_LIMIT_MB,
+    docx_engine=settings.DOCX_EXTRACTOR,
+    min_chars_per_page=settings.PDF_MIN_CHARS_PER_PAGE,
+    cache_bytes=settings.EXTRACTION_CACHE_BYTES
+)
@@ -0,0 +1,125 @@
+"""Bounded upload intake: size limit, file type sniffing and hashing in one pass."""
+from typing import List, NamedTuple, Optional, Sequence
+import hashlib
+import io
+from fastapi import UploadFile, status
+from ..config import get_settings
+
+settings = get_settings()
+
+# Leading bytes of each supported format. PDF readers accept junk before the
+# header, so it only has to appear within the first KB.
+_SNIFF_WINDOW = 1024
+
+def _looks_like(file_ext: str, head: bytes) -> bool:
+    if file_ext == 'pdf':
+        return b"%PDF-" in head[:_SNIFF_WINDOW]
+    if file_ext == 'docx':
+        return head.startswith(b"PK\x03\x04")  # zip local file header
+    return False
+
+class UploadRejected(Exception):
+    """An uploaded file failed intake; ``status_code`` is the HTTP status to return."""
+    
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+class UploadedFile(NamedTuple):
+    """A validated upload, read once into memory."""
+    filename: str
+    file_ext: str
+    content: bytes
+    content_type: Optional[str]
+    sha256: str
+    
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+def detach_upload(file: UploadFile) -> UploadFile:
+    """
+    Take ownership of an uploaded file so it outlives the request handler.
+    
+    FastAPI closes form files when the handler returns, which is before a
+    streaming response body is sent. The returned UploadFile holds the
+    spooled file instead and the caller must close it; the form's copy is
+    left with an empty buffer.
+    """
+    detached = UploadFile(file.file, size=file.size, filename=file.filename, headers=file.headers)
+    file.file = io.BytesIO()
+    return detached
+
+def _format_size(size: int) -> str:
+    if size >= 1024 * 1024:
+        return f"{size // (1024 * 1024)}MB"
+    return f"{size // 1024}KB"
+
+def _unsupported_type_message(allowed: Sequence[str]) -> str:
+    return f"Only {' and '.join(ext.upper() for ext in allowed)} files are supported"
+
+async def read_upload(
+    file: UploadFile,
+    max_bytes: Optional[int] = None,
+    allowed_extensions: Optional[Sequence[str]] = None
+) -> UploadedFile:
+    """
+    Read an uploaded file in chunks, validating it as it streams.
+    
+    The extension is checked before reading, the first chunk's magic bytes
+    must match it, the size limit is enforced chunk by chunk (reading stops
+    as soon as it is exceeded) and the SHA-256 is computed on the way. The
+    returned ``content`` is the single in-memory copy of the file that the
+    extraction and storage stages share.
+    
+    Args:
+        file: Uploaded file from the multipart form
+        max_bytes: Size limit (defaults to MAX_UPLOAD_SIZE)
+        allowed_extensions: Accepted extensions (defaults to ALLOWED_EXTENSIONS)
+    
+    Returns:
+        The validated UploadedFile
+    
+    Raises:
+        UploadRejected with 400 for unsupported, mislabelled or empty files
+        and 413 for files over the limit
+    """
+    max_bytes = max_bytes or settings.MAX_UPLOAD_SIZE
+    allowed = allowed_extensions or settings.ALLOWED_EXTENSIONS
+    filename = file.filename or ""
+    file_ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ""
+    if file_ext not in allowed:
+        raise UploadRejected(status.HTTP_400_BAD_REQUEST, _unsupported_type_message(allowed))
+    
+    too_large = UploadRejected(
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        f"File exceeds the {_format_size(max_bytes)} upload limit"
+    )
+    if file.size is not None and file.size > max_bytes:
+        raise too_large
+    
+    digest = hashlib.sha256()
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        chunk = await file.read(settings.STORAGE_CHUNK_SIZE)
+        if not chunk:
+            break
+        if not chunks and not _looks_like(file_ext, chunk):
+            raise UploadRejected(
+                status.HTTP_400_BAD_REQUEST,
+                f"File content is not a valid {file_ext.upper()} document"
+            )
+        size += len(chunk)
+        if size > max_bytes:
+            raise too_large
+        digest.update(chunk)
+        chunks.append(chunk)
+    
+    if not chunks:
+        raise UploadRejected(status.HTTP_400_BAD_REQUEST, "File is empty")
+    
+    # join() returns a lone chunk as-is, so small files are never copied
+    content = b"".join(chunks)
+    return UploadedFile(filename, file_ext, content, file.content_type, digest.hexdigest())
@@ -0,0 +1,291 @@
+"""Background job queue and in-process worker pool."""
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from uuid import UUID
+import asyncio
+import contextvars
+import time
+import logging
+from ..config import get_settings
+from ..models.job import Job, JobStage, JobStatus
+
+logger = logging.getLogger(__name__)
+
+class QueueFullError(Exception):
+    """Raised when the job queue has no capacity left."""
+
+class JobsDisabledError(Exception):
+    """Raised when background jobs are unavailable in this deployment."""
+
+class JobQueueBackend(ABC):
+    """
+    Interface for the queue that hands job IDs to workers.
+    
+    Job records and payloads stay with the JobManager; the backend only
+    orders work, so a broker-backed implementation can replace the
+    in-memory one without touching the workers.
+    """
+    
+    @abstractmethod
+    async def put(self, job_id: UUID):
+        """Enqueue a job; raises QueueFullError when out of capacity."""
+    
+    @abstractmethod
+    async def get(self) -> UUID:
+        """Wait for and return the next job ID."""
+    
+    @abstractmethod
+    def qsize(self) -> int:
+        """Number of jobs waiting."""
+
+class InMemoryJobQueue(JobQueueBackend):
+    """Local stand-in queue backed by asyncio.Queue."""
+    
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._queue: Optional["asyncio.Queue[UUID]"] = None
+    
+    @property
+    def queue(self) -> "asyncio.Queue[UUID]":
+        # Created lazily so it binds to the running event loop
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        return self._queue
+    
+    async def put(self, job_id: UUID):
+        try:
+            self.queue.put_nowait(job_id)
+        except asyncio.QueueFull:
+            raise QueueFullError("Job queue is full")
+    
+    async def get(self) -> UUID:
+        return await self.queue.get()
+    
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+JobHandler = Callable[[Job, Any, "JobProgress"], Awaitable[Optional[Dict[str, Any]]]]
+
+class JobProgress:
+    """Update a job's per-stage progress from inside a handler."""
+    
+    def __init__(self, job: Job):
+        self.job = job
+    
+    @contextmanager
+    def stage(self, name: str):
+        record = next((s for s in self.job.stages if s.name == name), None)
+        if record is None:
+            record = JobStage(name=name)
+            self.job.stages.append(record)
+        record.status = JobStatus.RUNNING
+        record.started_at = datetime.utcnow()
+        try:
+            yield record
+        except BaseException:
+            record.status = JobStatus.FAILED
+            raise
+        else:
+            record.status = JobStatus.SUCCEEDED
+        finally:
+            record.finished_at = datetime.utcnow()
+
+class JobManager:
+    """
+    Run registered job handlers on a pool of asyncio workers.
+    
+    Tracks queue depth, queue wait time and worker utilization.
+    
+    Job records, payloads and contexts live in this process, so a job can
+    only be polled on the server process that accepted it. Background jobs
+    are therefore disabled unless the server runs a single process
+    (``WEB_CONCURRENCY=1``).
+    """
+    
+    def __init__(self, backend: Optional[JobQueueBackend] = None):
+        self.settings = get_settings()
+        self.backend = backend or InMemoryJobQueue(self.settings.JOB_QUEUE_MAXSIZE)
+        self.worker_count = self.settings.JOB_WORKERS
+        self.enabled = self.settings.WEB_CONCURRENCY <= 1
+        self._closed = False
+        self._handlers: Dict[str, JobHandler] = {}
+        self._jobs: Dict[UUID, Job] = {}
+        self._payloads: Dict[UUID, Any] = {}
+        self._enqueued_at: Dict[UUID, float] = {}
+        self._contexts: Dict[UUID, contextvars.Context] = {}
+        self._workers: List[asyncio.Task] = []
+        self._started_at: Optional[float] = None
+        self._busy_seconds = 0.0
+        self._busy_workers = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._dequeued = 0
+        self.completed = 0
+        self.failed = 0
+    
+    def register(self, kind: str, handler: JobHandler):
+        """Register the coroutine that runs jobs of the given kind."""
+        self._handlers[kind] = handler
+    
+    async def start(self):
+        """Start the worker pool."""
+        if not self.enabled:
+            logger.warning(
+                f"Background jobs disabled: WEB_CONCURRENCY={self.settings.WEB_CONCURRENCY}, "
+                "job state is per process"
+            )
+            return
+        if self._workers:
+            return
+        self._closed = False
+        self._started_at = time.monotonic()
+        self._workers = [
+            asyncio.ensure_future(self._worker(index))
+            for index in range(self.worker_count)
+        ]
+    
+    async def stop(self):
+        """Cancel all workers and fail jobs that never started."""
+        self._closed = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        now = datetime.utcnow()
+        for job_id, job in self._jobs.items():
+            if job.status == JobStatus.QUEUED:
+                job.status = JobStatus.FAILED
+                job.error = "Server shut down before the job started"
+                job.finished_at = now
+                self._payloads.pop(job_id, None)
+                self._enqueued_at.pop(job_id, None)
+                self._contexts.pop(job_id, None)
+                self.failed += 1
+    
+    async def submit(
+        self,
+        kind: str,
+        user_id: str,
+        payload: Any,
+        stages: Optional[List[str]] = None
+    ) -> Job:
+        """
+        Queue a job.
+        
+        Args:
+            kind: Registered handler name
+            user_id: Owner of the job
+            payload: Handler input (kept in-process, never serialized)
+            stages: Stage names to report as pending up front
+        
+        Returns:
+            The queued Job
+        
+        Raises:
+            JobsDisabledError if background jobs are disabled
+            QueueFullError if the queue is at capacity or shutting down
+        """
+        if not self.enabled:
+            raise JobsDisabledError("Background jobs require WEB_CONCURRENCY=1")
+        if self._closed:
+            raise QueueFullError("Job queue is shutting down")
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        self._prune()
+        job = Job(
+            user_id=user_id,
+            kind=kind,
+            stages=[JobStage(name=name) for name in stages or []]
+        )
+        self._jobs[job.id] = job
+        self._payloads[job.id] = payload
+        self._enqueued_at[job.id] = time.monotonic()
+        # Run the handler with the submitter's context (e.g. LLM caller identity)
+        self._contexts[job.id] = contextvars.copy_context()
+        try:
+            await self.backend.put(job.id)
+        except QueueFullError:
+            self._forget(job.id)
+            raise
+        return job
+    
+    def get_job(self, job_id: UUID, user_id: str) -> Optional[Job]:
+        """Return a job if it exists and belongs to the user."""
+        job = self._jobs.get(job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        return job
+    
+    async def _worker(self, index: int):
+        while True:
+            job_id = await self.backend.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                continue
+            waited = time.monotonic() - self._enqueued_at.pop(job_id, time.monotonic())
+            self._dequeued += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            
+            self._busy_workers += 1
+            started = time.monotonic()
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.utcnow()
+            try:
+                handler = self._handlers[job.kind]
+                context = self._contexts.pop(job_id, None) or contextvars.copy_context()
+                job.result = await context.run(
+                    asyncio.ensure_future,
+                    handler(job, self._payloads.pop(job_id, None), JobProgress(job))
+                )
+                job.status = JobStatus.SUCCEEDED
+                self.completed += 1
+            except asyncio.CancelledError:
+                job.status = JobStatus.FAILED
+                job.error = "Worker shut down"
+                raise
+            except Exception as e:
+                logger.error(f"Job {job_id} ({job.kind}) failed: {str(e)}")
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+                self.failed += 1
+            finally:
+                job.finished_at = datetime.utcnow()
+                self._busy_workers -= 1
+                self._busy_seconds += time.monotonic() - started
+    
+    def _forget(self, job_id: UUID):
+        self._jobs.pop(job_id, None)
+        self._payloads.pop(job_id, None)
+        self._enqueued_at.pop(job_id, None)
+        self._contexts.pop(job_id, None)
+    
+    def _prune(self):
+        """Drop finished jobs older than the retention window."""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.settings.JOB_RETENTION_SECONDS)
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            self._forget(job_id)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, wait time and worker utilization."""
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        capacity = uptime * max(self.worker_count, 1)
+        return {
+            'queue_depth': self.backend.qsize(),
+            'workers': len(self._workers),
+            'busy_workers': self._busy_workers,
+            'utilization': round(self._busy_seconds / capacity, 4) if capacity else 0.0,
+            'avg_wait_ms': round(self._wait_total / self._dequeued * 1000, 1) if self._dequeued else 0.0,
+            'max_wait_ms': round(self._wait_max * 1000, 1),
+            'completed': self.completed,
+            'failed': self.failed
+        }
+
+# Initialize job manager
+job_manager = JobManager()
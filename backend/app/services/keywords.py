@@ -0,0 +1,177 @@
+"""Local keyword matching between resumes and job descriptions, without an LLM."""
+from typing import Dict, List, Optional, Sequence, Tuple
+import json
+import re
+import numpy as np
+from ..config import get_settings
+from ..core.skills import SKILLS
+from ..models.resume import JobDescription, KeywordMatch
+
+# Lowercase words, keeping the punctuation skill names rely on: "c++", "c#",
+# "node.js", ".net". Hyphens and slashes split, so "CI/CD" is "ci cd".
+_TOKEN = re.compile(r"\.?[a-z0-9](?:[a-z0-9+#.]*[a-z0-9+#])?")
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+def job_text(job: JobDescription) -> str:
+    """The part of a job matched as free text; requirements are weighted separately."""
+    return f"{job.title}\n{job.description}"
+
+def load_skills(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    The built-in skills vocabulary, extended by a JSON file if given.
+    
+    The file maps display names to alias lists, like SKILLS; entries with
+    the same name replace the built-in ones.
+    """
+    skills = dict(SKILLS)
+    if path:
+        with open(path, encoding='utf-8') as f:
+            skills.update(json.load(f))
+    return skills
+
+class KeywordMatcher:
+    """
+    Match resumes against job descriptions over a skills vocabulary.
+    
+    Texts are reduced to vectors of skill counts (longest alias wins, so
+    "React Native" is not also counted as "React"). A job's vector is
+    weighted sublinearly, ``log(1 + count)``, with skills listed in its
+    requirements counting ``requirement_weight`` times; passing ``idf``
+    (see inverse_document_frequency) turns that into TF-IDF over a set of
+    jobs. The match score is the weighted share of the job's skills that
+    appear in the resume. Everything after tokenization is NumPy, so a
+    match takes well under a millisecond.
+    """
+    
+    def __init__(self, skills: Dict[str, List[str]], requirement_weight: float = 2.0):
+        self.names = list(skills)
+        self.requirement_weight = requirement_weight
+        self.phrases: Dict[Tuple[str, ...], int] = {}
+        for index, aliases in enumerate(skills.values()):
+            for alias in aliases:
+                tokens = tuple(tokenize(alias))
+                if tokens:
+                    self.phrases.setdefault(tokens, index)
+        self.first_tokens = {phrase[0] for phrase in self.phrases}
+        self.max_phrase = max((len(phrase) for phrase in self.phrases), default=1)
+    
+    @property
+    def size(self) -> int:
+        return len(self.names)
+    
+    def count(self, text: str) -> np.ndarray:
+        """Count skill mentions in ``text`` as a vector over the vocabulary."""
+        tokens = tokenize(text)
+        indices = []
+        i = 0
+        while i < len(tokens):
+            if tokens[i] in self.first_tokens:
+                for length in range(min(self.max_phrase, len(tokens) - i), 0, -1):
+                    index = self.phrases.get(tuple(tokens[i:i + length]))
+                    if index is not None:
+                        indices.append(index)
+                        i += length
+                        break
+                else:
+                    i += 1
+            else:
+                i += 1
+        return np.bincount(
+            np.asarray(indices, dtype=np.intp),
+            minlength=self.size
+        ).astype(np.float32)
+    
+    def vectorize(self, texts: Sequence[str]) -> np.ndarray:
+        """Skill counts for many texts, one row per text."""
+        if not texts:
+            return np.zeros((0, self.size), dtype=np.float32)
+        return np.vstack([self.count(text) for text in texts])
+    
+    def job_counts(self, job_text: str, requirements: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Skill counts for a job, with requirements counting extra."""
+        counts = self.count(job_text)
+        if requirements:
+            counts += self.requirement_weight * self.count("\n".join(requirements))
+        return counts
+    
+    @staticmethod
+    def inverse_document_frequency(counts: np.ndarray) -> np.ndarray:
+        """Smoothed IDF per skill from a (documents x skills) count matrix."""
+        documents = counts.shape[0]
+        frequency = np.count_nonzero(counts, axis=0)
+        return (np.log((1 + documents) / (1 + frequency)) + 1).astype(np.float32)
+    
+    @staticmethod
+    def weigh(job_counts: np.ndarray, idf: Optional[np.ndarray] = None) -> np.ndarray:
+        """Skill weights for job count vectors (or a matrix of them)."""
+        weights = np.log1p(job_counts)
+        if idf is not None:
+            weights *= idf
+        return weights
+    
+    def match(
+        self,
+        resume_text: str,
+        job_text: str,
+        requirements: Optional[Sequence[str]] = None,
+        idf: Optional[np.ndarray] = None
+    ) -> KeywordMatch:
+        """
+        Match a resume against one job.
+        
+        Args:
+            resume_text: Raw resume text content
+            job_text: Job title and description
+            requirements: Job requirements, weighted above the description
+            idf: Optional per-skill IDF to weight rarer skills higher
+        
+        Returns:
+            KeywordMatch with the job's skills found in and missing from the
+            resume, most important first. The score is None when the job
+            mentions no known skills.
+        """
+        present = self.count(resume_text) > 0
+        weights = self.weigh(self.job_counts(job_text, requirements), idf)
+        return self._result(weights, present, float(weights[present].sum()))
+    
+    def rank(self, resume_text: str, jobs: Sequence[JobDescription]) -> List[KeywordMatch]:
+        """
+        Match one resume against many jobs at once.
+        
+        The resume is vectorized once and scored against every job with a
+        single matrix-vector product. Weights include IDF across ``jobs``,
+        so skills that every posting asks for count less than the ones
+        that set a posting apart.
+        
+        Args:
+            resume_text: Raw resume text content
+            jobs: Job descriptions to match against
+        
+        Returns:
+            One KeywordMatch per job, in the order given
+        """
+        if not jobs:
+            return []
+        present = self.count(resume_text) > 0
+        counts = np.vstack([self.job_counts(job_text(job), job.requirements) for job in jobs])
+        weights = self.weigh(counts, self.inverse_document_frequency(counts))
+        matched = weights @ present.astype(np.float32)
+        return [self._result(row, present, float(hit)) for row, hit in zip(weights, matched)]
+    
+    def _result(self, weights: np.ndarray, present: np.ndarray, matched: float) -> KeywordMatch:
+        total = float(weights.sum())
+        if total <= 0:
+            return KeywordMatch(score=None, keywords_found=[], missing_keywords=[])
+        
+        order = np.argsort(-weights, kind='stable')
+        order = order[weights[order] > 0]
+        return KeywordMatch(
+            score=round(min(100 * matched / total, 100), 1),
+            keywords_found=[self.names[i] for i in order if present[i]],
+            missing_keywords=[self.names[i] for i in order if not present[i]]
+        )
+
+# Initialize keyword matcher
+keyword_matcher = KeywordMatcher(load_skills(get_settings().SKILLS_VOCABULARY_FILE))
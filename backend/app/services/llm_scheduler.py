@@ -0,0 +1,273 @@
+"""Rate-limited, fair scheduling of OpenAI requests."""
+from typing import Any, Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional, TypeVar
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import asyncio
+import random
+import time
+import logging
+from openai import APIConnectionError, APIStatusError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PRIORITY_PREMIUM = 0
+PRIORITY_STANDARD = 1
+PREMIUM_ROLES = {"premium", "admin"}
+
+class LLMCaller(NamedTuple):
+    """Identity used for fair queueing and prioritisation."""
+    user_id: str
+    priority: int = PRIORITY_STANDARD
+
+ANONYMOUS_CALLER = LLMCaller(user_id="anonymous")
+
+_current_caller: ContextVar[LLMCaller] = ContextVar("llm_caller", default=ANONYMOUS_CALLER)
+
+def set_llm_caller(user: Dict[str, Any]):
+    """
+    Attribute LLM calls made in the current context to a user.
+    
+    Premium and admin users are scheduled ahead of everyone else.
+    """
+    premium = bool(PREMIUM_ROLES & set(user.get('roles') or []))
+    _current_caller.set(LLMCaller(
+        user_id=user['user_id'],
+        priority=PRIORITY_PREMIUM if premium else PRIORITY_STANDARD
+    ))
+
+def get_llm_caller() -> LLMCaller:
+    return _current_caller.get()
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether an OpenAI error is worth retrying (429, 5xx, connection/timeout)."""
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, APIConnectionError)
+
+class TokenBucket:
+    """Continuously refilling budget expressed as units per minute."""
+    
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def time_until(self, amount: float) -> float:
+        """Seconds until ``amount`` units are available (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+    
+    def consume(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+class _Waiter:
+    __slots__ = ("future", "caller", "tokens", "enqueued_at")
+    
+    def __init__(self, future: asyncio.Future, caller: LLMCaller, tokens: int):
+        self.future = future
+        self.caller = caller
+        self.tokens = tokens
+        self.enqueued_at = time.monotonic()
+
+class LLMScheduler:
+    """
+    Admission control in front of the OpenAI client.
+    
+    Enforces requests-per-minute and tokens-per-minute budgets plus global
+    and per-user concurrency limits. Waiting calls are served premium
+    first, then round-robin across users so one user's burst cannot starve
+    the rest. Rate-limit (429), 5xx and connection errors are retried with
+    full-jitter exponential backoff, honouring Retry-After.
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_concurrency: int = 16,
+        per_user_concurrency: int = 4,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max_concurrency
+        self.per_user_concurrency = per_user_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._queues: Dict[int, "OrderedDict[str, Deque[_Waiter]]"] = {
+            PRIORITY_PREMIUM: OrderedDict(),
+            PRIORITY_STANDARD: OrderedDict()
+        }
+        self._running = 0
+        self._running_by_user: Dict[str, int] = defaultdict(int)
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._waits: Deque[float] = deque(maxlen=1000)
+        self.granted = 0
+        self.retries = 0
+        self.throttled = 0
+    
+    async def run(self, fn: Callable[[], Awaitable[T]], tokens: int = 0) -> T:
+        """
+        Run an OpenAI call once admitted, retrying transient failures.
+        
+        Args:
+            fn: Zero-argument coroutine function making the API call
+            tokens: Estimated prompt + completion tokens
+        
+        Returns:
+            The call's result
+        """
+        for attempt in range(self.max_retries + 1):
+            async with self.slot(tokens):
+                try:
+                    return await fn()
+                except Exception as e:
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None or attempt == self.max_retries:
+                        raise
+                    self.retries += 1
+                    logger.warning(
+                        f"OpenAI call failed ({type(e).__name__}), "
+                        f"retry {attempt + 1}/{self.max_retries} in {delay:.2f}s"
+                    )
+            await asyncio.sleep(delay)
+    
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0):
+        """Hold one admission slot for the duration of the block."""
+        caller = get_llm_caller()
+        await self._acquire(caller, tokens)
+        try:
+            yield
+        finally:
+            self._release(caller)
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        if not is_transient_error(error):
+            return None
+        if isinstance(error, APIStatusError) and error.status_code == 429:
+            self.throttled += 1
+        
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.backoff_max))
+            except ValueError:
+                pass
+        return delay
+    
+    async def _acquire(self, caller: LLMCaller, tokens: int):
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), caller, tokens)
+        queue = self._queues[caller.priority]
+        queue.setdefault(caller.user_id, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # Granted just as we were cancelled: hand the slot back
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(caller)
+            raise
+    
+    def _release(self, caller: LLMCaller):
+        self._running -= 1
+        self._running_by_user[caller.user_id] -= 1
+        if self._running_by_user[caller.user_id] <= 0:
+            del self._running_by_user[caller.user_id]
+        self._dispatch()
+    
+    def _next_waiter(self) -> Optional[_Waiter]:
+        for priority in (PRIORITY_PREMIUM, PRIORITY_STANDARD):
+            queue = self._queues[priority]
+            for user_id in list(queue):
+                waiters = queue[user_id]
+                while waiters and waiters[0].future.done():
+                    waiters.popleft()
+                if not waiters:
+                    del queue[user_id]
+                    continue
+                if self._running_by_user.get(user_id, 0) >= self.per_user_concurrency:
+                    continue
+                return waiters[0]
+        return None
+    
+    def _dispatch(self):
+        while self._running < self.max_concurrency:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            
+            wait = 0.0
+            if self.request_bucket:
+                wait = max(wait, self.request_bucket.time_until(1))
+            if self.token_bucket:
+                wait = max(wait, self.token_bucket.time_until(waiter.tokens))
+            if wait > 0:
+                self._schedule(wait)
+                return
+            
+            queue = self._queues[waiter.caller.priority]
+            queue[waiter.caller.user_id].popleft()
+            # Rotate the user to the back for round-robin fairness
+            queue.move_to_end(waiter.caller.user_id)
+            if self.request_bucket:
+                self.request_bucket.consume(1)
+            if self.token_bucket:
+                self.token_bucket.consume(waiter.tokens)
+            self._running += 1
+            self._running_by_user[waiter.caller.user_id] += 1
+            self._waits.append(time.monotonic() - waiter.enqueued_at)
+            self.granted += 1
+            waiter.future.set_result(None)
+    
+    def _schedule(self, delay: float):
+        loop = asyncio.get_running_loop()
+        when = loop.time() + delay
+        if self._timer is not None and self._timer.when() <= when:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = loop.call_at(when, self._on_timer)
+    
+    def _on_timer(self):
+        self._timer = None
+        self._dispatch()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return queue lengths, queue-wait percentiles and retry counters."""
+        waits: List[float] = sorted(self._waits)
+        
+        def pct(p: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(p * len(waits)))] * 1000, 1)
+        
+        return {
+            'running': self._running,
+            'queued_premium': sum(len(w) for w in self._queues[PRIORITY_PREMIUM].values()),
+            'queued_standard': sum(len(w) for w in self._queues[PRIORITY_STANDARD].values()),
+            'granted': self.granted,
+            'retries': self.retries,
+            'throttled': self.throttled,
+            'queue_wait_p50_ms': pct(0.50),
+            'queue_wait_p95_ms': pct(0.95),
+            'queue_wait_max_ms': round(waits[-1] * 1000, 1) if waits else 0.0
+        }
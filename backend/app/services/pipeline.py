@@ -0,0 +1,68 @@
+"""Helpers for running multi-stage request pipelines."""
+from typing import Any, Awaitable, Dict, Tuple
+from contextlib import contextmanager
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+async def run_stages(stages: Dict[str, Awaitable]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Run independent pipeline stages concurrently.
+    
+    If any stage fails (or the caller is cancelled, e.g. the client
+    disconnected), every sibling still in flight is cancelled so no more
+    upstream work is paid for.
+    
+    Args:
+        stages: Mapping of stage name to awaitable
+    
+    Returns:
+        Tuple of (results by stage name, wall-clock milliseconds by stage name)
+    
+    Raises:
+        The first exception raised by any stage
+    """
+    timings: Dict[str, float] = {}
+    
+    async def timed(name: str, awaitable: Awaitable) -> Any:
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            timings[name] = _elapsed_ms(start)
+    
+    tasks = {
+        name: asyncio.ensure_future(timed(name, awaitable))
+        for name, awaitable in stages.items()
+    }
+    try:
+        await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    for name, task in tasks.items():
+        if not task.cancelled() and task.exception() is not None:
+            cancelled = [n for n, t in tasks.items() if t.cancelled()]
+            if cancelled:
+                logger.info(f"Stage '{name}' failed; cancelled {', '.join(cancelled)}")
+            raise task.exception()
+    
+    return {name: task.result() for name, task in tasks.items()}, timings
+
+@contextmanager
+def timed_stage(timings: Dict[str, float], name: str):
+    """Record the wall-clock milliseconds of a sequential stage into ``timings``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = _elapsed_ms(start)
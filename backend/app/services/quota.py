@@ -0,0 +1,119 @@
+"""Incremental per-user storage quota accounting."""
+from typing import NamedTuple, Optional
+import logging
+from ..config import get_settings
+from ..core.cache import LRUCache
+from ..core.database import db
+from ..core.periodic import PeriodicTask
+from ..core.storage import storage
+
+logger = logging.getLogger(__name__)
+
+class StorageUsage(NamedTuple):
+    used_bytes: int
+    max_bytes: int
+    
+    def allows(self, incoming_bytes: int) -> bool:
+        return self.used_bytes + incoming_bytes <= self.max_bytes
+
+class StorageQuotaService:
+    """
+    Track storage usage with a counter in ``user_settings``.
+    
+    Uploads and deletes adjust the counter atomically in the database
+    (``create_resume`` / ``increment_storage_usage``) instead of listing
+    the user's folder on every upload. Reads are served from a short-lived local cache that is
+    refreshed by this worker's own writes. A periodic reconciliation job
+    compares the counters with the real bucket listing and corrects drift
+    (crashed requests, files removed out of band, other workers).
+    """
+    
+    def __init__(self):
+        self.settings = get_settings()
+        self._cache = LRUCache(
+            max_entries=10_000,
+            ttl=self.settings.STORAGE_USAGE_CACHE_TTL
+        )
+        self.reconciled = 0
+        self.corrected = 0
+    
+    async def get_usage(self, user_id: str) -> StorageUsage:
+        """Return a user's (possibly slightly stale) usage and quota."""
+        usage = self._cache.get(user_id)
+        if usage is not None:
+            return usage
+        row = await db.get_storage_usage(user_id)
+        usage = self._from_row(row)
+        self._cache.set(user_id, usage, size=1)
+        return usage
+    
+    async def record(self, user_id: str, delta: int) -> StorageUsage:
+        """
+        Add ``delta`` bytes (negative for deletes) to a user's usage.
+        
+        Args:
+            user_id: User ID
+            delta: Bytes stored (positive) or freed (negative)
+        
+        Returns:
+            The updated usage
+        """
+        usage = self._from_row(await db.increment_storage_usage(user_id, delta))
+        self._cache.set(user_id, usage, size=1)
+        return usage
+    
+    def note_usage(self, user_id: str, delta: int):
+        """
+        Reflect a change already written to the database (e.g. by the
+        ``create_resume`` function) in the cached usage.
+        """
+        usage = self._cache.get(user_id)
+        if usage is not None:
+            self._cache.set(user_id, usage._replace(used_bytes=max(usage.used_bytes + delta, 0)), size=1)
+    
+    def _from_row(self, row: Optional[dict]) -> StorageUsage:
+        row = row or {}
+        return StorageUsage(
+            used_bytes=row.get('storage_used_bytes') or 0,
+            max_bytes=row.get('max_storage_bytes') or self.settings.DEFAULT_MAX_STORAGE_BYTES
+        )
+    
+    async def reconcile(self, page_size: int = 100):
+        """Correct every user's counter against the bucket listing."""
+        after: Optional[str] = None
+        while True:
+            accounts = await db.list_storage_accounts(after, page_size)
+            for account in accounts:
+                user_id = account['user_id']
+                try:
+                    actual = await storage.measure_user_storage(user_id)
+                except Exception as e:
+                    logger.error(f"Storage reconciliation failed for {user_id}: {str(e)}")
+                    continue
+                # Apply the difference rather than overwriting, so uploads
+                # recorded meanwhile are not lost
+                drift = actual - (account.get('storage_used_bytes') or 0)
+                if drift:
+                    logger.warning(f"Storage usage drift for {user_id}: {drift:+d} bytes")
+                    await self.record(user_id, drift)
+                    self.corrected += 1
+                self.reconciled += 1
+            if len(accounts) < page_size:
+                return
+            after = accounts[-1]['user_id']
+    
+    def stats(self):
+        return {
+            'cache': self._cache.stats(),
+            'reconciled': self.reconciled,
+            'corrected': self.corrected
+        }
+
+# Initialize quota service
+quota = StorageQuotaService()
+
+storage_reconciliation = PeriodicTask(
+    "storage_reconciliation",
+    quota.settings.STORAGE_RECONCILE_INTERVAL,
+    quota.reconcile
+)
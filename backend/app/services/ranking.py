@@ -0,0 +1,53 @@
+"""Rank many job descriptions against one resume."""
+from typing import List, Sequence
+import asyncio
+import logging
+from ..models.resume import JobDescription, RankedJob
+from .keywords import keyword_matcher
+from .resume_optimizer import optimizer
+
+logger = logging.getLogger(__name__)
+
+async def rank_jobs(
+    content: str,
+    jobs: Sequence[JobDescription],
+    explain_top: int = 0
+) -> List[RankedJob]:
+    """
+    Rank job descriptions by keyword fit, escalating the best to the LLM.
+    
+    Every job is scored locally by keyword_matcher.rank (one matrix
+    operation, milliseconds for 50 postings) instead of one LLM call per
+    posting. Only the top
+    ``explain_top`` jobs (those naming at least one known skill) get a full
+    analysis, concurrently. If the LLM is unavailable those jobs are
+    returned without one instead of failing the ranking.
+    
+    Args:
+        content: Raw resume text content
+        jobs: Job descriptions to rank
+        explain_top: Number of best matches to analyze with the LLM
+    
+    Returns:
+        RankedJob per job, best match first; jobs without a score come last
+    """
+    ranked = sorted(
+        (
+            RankedJob(index=index, title=job.title, company=job.company, **match.model_dump())
+            for index, (job, match) in enumerate(zip(jobs, keyword_matcher.rank(content, jobs)))
+        ),
+        key=lambda item: (item.score is None, -(item.score or 0), item.index)
+    )
+    
+    async def explain(item: RankedJob):
+        try:
+            item.analysis = await optimizer.analyze_resume(content, jobs[item.index])
+        except Exception as e:
+            if not optimizer.is_unavailable(e):
+                raise
+            logger.warning(f"LLM unavailable, ranking job {item.index} without analysis: {str(e)}")
+    
+    top = [item for item in ranked[:explain_top] if item.score is not None]
+    if top:
+        await asyncio.gather(*(explain(item) for item in top))
+    return ranked
@@ -1,22 +1,160 @@
 import re
+import json
+import asyncio
 import difflib
-from typing import Dict, List, Optional
+import hashlib
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Union
 from datetime import datetime
-from docx import Document
 from openai import AsyncOpenAI
-from ..core.templates import SECTION_TEMPLATES, RESUME_PROMPT_TEMPLATE
-from ..models.resume import ResumeAnalysis
+from ..core.templates import (
+    SECTION_TEMPLATES, RESUME_PROMPT_TEMPLATE, SECTION_ANALYSIS_PROMPT, SECTION_FEEDBACK_PROMPT,
+    PROMPT_TEMPLATE_VERSION
+)
+from ..core.cache import LRUCache, RedisCache, TieredCache
+from ..core.singleflight import SingleFlight
+from ..core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from .llm_scheduler import LLMScheduler, is_transient_error
+from .extraction import extraction_pool
+from .keywords import job_text, keyword_matcher
+from ..models.resume import JobDescription, KeywordMatch, ResumeAnalysis, SectionAnalysis
 from ..config import get_settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Optimization level that fans out one call per resume section
+SECTIONED_OPTIMIZATION = "sectioned"
+
+# Sampling parameters for full-resume generation
+RESUME_PARAMS = {"temperature": 0.2, "max_tokens": 2000}
+
+def _unique(values: Iterable[str]) -> List[str]:
+    """Drop case-insensitive duplicates, keeping first-seen order."""
+    seen = set()
+    result = []
+    for value in values:
+        key = value.strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            result.append(value)
+    return result
+
 class ResumeOptimizer:
     """Service for resume analysis and optimization using OpenAI."""
 
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncOpenAI(api_key=self.settings.OPENAI_API_KEY)
+        # Retries are handled by the scheduler so they respect rate budgets
+        self.client = AsyncOpenAI(
+            api_key=self.settings.OPENAI_API_KEY,
+            base_url=self.settings.OPENAI_BASE_URL,
+            timeout=self.settings.OPENAI_TIMEOUT,
+            max_retries=0
+        )
+        self.breaker = CircuitBreaker(
+            "openai",
+            failure_rate=self.settings.LLM_BREAKER_FAILURE_RATE,
+            min_calls=self.settings.LLM_BREAKER_MIN_CALLS,
+            slow_call_seconds=self.settings.LLM_BREAKER_SLOW_CALL_SECONDS,
+            open_seconds=self.settings.LLM_BREAKER_OPEN_SECONDS,
+            is_failure=is_transient_error
+        )
+        self.scheduler = LLMScheduler(
+            requests_per_minute=self.settings.OPENAI_RPM,
+            tokens_per_minute=self.settings.OPENAI_TPM,
+            max_concurrency=self.settings.OPENAI_MAX_CONCURRENCY,
+            per_user_concurrency=self.settings.OPENAI_PER_USER_CONCURRENCY,
+            max_retries=self.settings.OPENAI_MAX_RETRIES
+        )
+        self.cache = TieredCache(
+            LRUCache(
+                max_entries=self.settings.LLM_CACHE_MAX_ENTRIES,
+                max_bytes=self.settings.LLM_CACHE_MAX_BYTES,
+                ttl=self.settings.LLM_CACHE_TTL
+            ),
+            RedisCache(self.settings.REDIS_URL, prefix="llm:") if self.settings.REDIS_URL else None
+        )
+        self.inflight = SingleFlight()
+
+    @staticmethod
+    def completion_fingerprint(model: str, messages: List[Dict[str, str]], params: Dict) -> str:
+        """
+        Content-address a chat completion request.
+        
+        The key covers the model, the prompt template version, the prompt
+        messages with whitespace normalized, and the sampling parameters.
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "template_version": PROMPT_TEMPLATE_VERSION,
+                "messages": [
+                    {"role": m["role"], "content": re.sub(r'\s+', ' ', m["content"]).strip()}
+                    for m in messages
+                ],
+                "params": params
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def estimate_tokens(messages: List[Dict[str, str]], params: Dict) -> int:
+        """Rough prompt + completion token estimate for rate budgeting."""
+        prompt_tokens = sum(len(m["content"]) for m in messages) // 4
+        return prompt_tokens + params.get("max_tokens", 1000)
+
+    @staticmethod
+    def is_unavailable(error: Exception) -> bool:
+        """Whether an error means the LLM is down rather than the request being bad."""
+        return isinstance(error, CircuitOpenError) or is_transient_error(error)
+
+    async def _complete(self, model: str, messages: List[Dict[str, str]], **params) -> str:
+        """
+        Run a chat completion, serving identical requests from the cache.
+        
+        Concurrent identical requests (double-clicks, frontend retries)
+        share a single upstream call.
+        """
+        key = self.completion_fingerprint(model, messages, params)
+        if self.settings.LLM_CACHE_ENABLED:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        return await self.inflight.do(
+            key,
+            lambda: self._fetch_completion(key, model, messages, params)
+        )
+
+    async def _fetch_completion(
+        self,
+        key: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        params: Dict
+    ) -> str:
+        """
+        Call the OpenAI API through the circuit breaker and scheduler,
+        then populate the cache.
+        """
+        # Fail fast before queueing while the circuit is open
+        self.breaker.check()
+        response = await self.scheduler.run(
+            lambda: self.breaker.call(
+                lambda: self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    **params
+                )
+            ),
+            tokens=self.estimate_tokens(messages, params)
+        )
+        content = response.choices[0].message.content
+        
+        if self.settings.LLM_CACHE_ENABLED and content:
+            await self.cache.set(key, content)
+        return content
 
     @staticmethod
     def text_similarity(a: str, b: str) -> float:
@@ -38,14 +176,14 @@ class ResumeOptimizer:
         return text
 
     @staticmethod
-    async def extract_text_from_resume(file_content: bytes, file_type: str) -> str:
-        """Extract text content from resume file."""
+    async def extract_text_from_resume(
+        file_content: bytes,
+        file_type: str,
+        content_hash: Optional[str] = None
+    ) -> str:
+        """Extract text content from resume file (on the extraction process pool)."""
         try:
-            if file_type.lower() == 'docx':
-                doc = Document(file_content)
-                return "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            else:
-                raise ValueError(f"Unsupported file type: {file_type}")
+            return await extraction_pool.extract(file_content, file_type, content_hash)
         except Exception as e:
             logger.error(f"Error extracting text: {str(e)}")
             raise
@@ -83,26 +221,49 @@ class ResumeOptimizer:
         content: str,
         job_title: str = "software engineering"
     ) -> str:
-        """Optimize a resume section using structured templates."""
+        """
+        Optimize a resume section using structured templates.
+        
+        API errors propagate (CircuitOpenError and transient errors become
+        the caller's 503), so a section that was never optimized is not
+        saved as if it had been. Only an unusable response keeps the
+        original text.
+        """
+        prompt = SECTION_TEMPLATES[section_name].format(
+            content=content,
+            job_title=job_title
+        )
+        
+        optimized_text = await self._complete(
+            self.settings.OPENAI_SECTION_MODEL,
+            [{"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=1000
+        )
+        
         try:
-            prompt = SECTION_TEMPLATES[section_name].format(
-                content=content,
-                job_title=job_title
-            )
-            
-            response = await self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=1000
-            )
-            
-            optimized_text = response.choices[0].message.content
-            return self.validate_and_clean(optimized_text)
-            
+            optimized = self.validate_and_clean(optimized_text)
         except Exception as e:
-            logger.error(f"Error optimizing {section_name}: {str(e)}")
-            return content  # Return original if optimization fails
+            logger.error(f"Invalid optimization response for {section_name}: {str(e)}")
+            return content
+        if not optimized:
+            logger.warning(f"Empty optimization response for {section_name}, keeping original")
+            return content
+        return optimized
+
+    @staticmethod
+    def _resume_messages(sections: Dict[str, str], job_title: str) -> List[Dict[str, str]]:
+        """Build the full-resume prompt from classified sections."""
+        prompt = RESUME_PROMPT_TEMPLATE.format(
+            job_title=job_title,
+            contact=sections.get('contact', ''),
+            experience=sections.get('experience', ''),
+            education=sections.get('education', ''),
+            skills=sections.get('skills', ''),
+            projects=sections.get('projects', ''),
+            awards=sections.get('awards', '')
+        )
+        return [{"role": "user", "content": prompt}]
 
     async def generate_optimized_resume(
         self,
@@ -111,28 +272,14 @@ class ResumeOptimizer:
     ) -> str:
         """Generate a cohesive, optimized resume."""
         try:
-            # Generate prompt using template
-            prompt = RESUME_PROMPT_TEMPLATE.format(
-                job_title=job_title,
-                contact=sections.get('contact', ''),
-                experience=sections.get('experience', ''),
-                education=sections.get('education', ''),
-                skills=sections.get('skills', ''),
-                projects=sections.get('projects', ''),
-                awards=sections.get('awards', '')
+            # Generate optimized resume
+            content = await self._complete(
+                self.settings.OPENAI_MODEL,
+                self._resume_messages(sections, job_title),
+                **RESUME_PARAMS
             )
             
-            # Generate optimized resume using GPT-4
-            response = await self.client.chat.completions.create(
-                model="gpt-4",  # Using GPT-4 for better formatting
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.2,
-                max_tokens=2000
-            )
-            
-            optimized_resume = self.validate_and_clean(
-                response.choices[0].message.content
-            )
+            optimized_resume = self.validate_and_clean(content)
             
             # Split into lines and remove empty lines
             formatted_lines = [
@@ -147,10 +294,150 @@ class ResumeOptimizer:
             logger.error(f"Error generating resume: {str(e)}")
             raise
 
+    async def stream_optimized_resume(
+        self,
+        sections: Dict[str, str],
+        job_title: str = "Software Engineering"
+    ) -> AsyncIterator[str]:
+        """
+        Stream an optimized resume one cleaned line at a time.
+        
+        Tokens are forwarded as OpenAI streams them; each line is cleaned
+        with validate_and_clean as soon as it is complete. The full
+        response is cached under the same fingerprint as
+        generate_optimized_resume, and cache hits are replayed line by line.
+        Generation runs in its own task and holds the scheduler slot only
+        until OpenAI finishes, not until the client has read every line;
+        errors raised mid-stream count as circuit breaker failures.
+        
+        Args:
+            sections: Section name to content, as returned by classify_sections
+            job_title: Target job title
+            
+        Yields:
+            Non-empty cleaned lines of the optimized resume
+        """
+        model = self.settings.OPENAI_MODEL
+        messages = self._resume_messages(sections, job_title)
+        key = self.completion_fingerprint(model, messages, RESUME_PARAMS)
+        
+        cached = await self.cache.get(key) if self.settings.LLM_CACHE_ENABLED else None
+        if cached is not None:
+            for line in cached.split('\n'):
+                line = self.validate_and_clean(line)
+                if line:
+                    yield line
+            return
+        
+        # Lines are generated into an in-memory buffer (bounded by the
+        # response's max_tokens) so the scheduler slot is released as soon
+        # as generation ends, however slowly the client reads
+        lines: asyncio.Queue = asyncio.Queue()
+        
+        async def generate():
+            raw_parts: List[str] = []
+            pending = ""
+            try:
+                self.breaker.check()
+                async with self.scheduler.slot(self.estimate_tokens(messages, RESUME_PARAMS)):
+                    stream = await self.breaker.call(
+                        lambda: self.client.chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            stream=True,
+                            **RESUME_PARAMS
+                        )
+                    )
+                    try:
+                        async for chunk in stream:
+                            if not chunk.choices:
+                                continue
+                            delta = chunk.choices[0].delta.content
+                            if not delta:
+                                continue
+                            raw_parts.append(delta)
+                            pending += delta
+                            *complete, pending = pending.split('\n')
+                            for line in complete:
+                                line = self.validate_and_clean(line)
+                                if line:
+                                    lines.put_nowait(line)
+                    except Exception as e:
+                        # The call itself succeeded; count the broken stream
+                        self.breaker.record_failure(e)
+                        raise
+                
+                line = self.validate_and_clean(pending)
+                if line:
+                    lines.put_nowait(line)
+                
+                if self.settings.LLM_CACHE_ENABLED and raw_parts:
+                    await self.cache.set(key, "".join(raw_parts))
+            finally:
+                lines.put_nowait(None)
+        
+        producer = asyncio.ensure_future(generate())
+        try:
+            while True:
+                line = await lines.get()
+                if line is None:
+                    break
+                yield line
+            # Re-raise a generation error after the lines that preceded it
+            await producer
+        finally:
+            # Client went away: stop generating
+            if not producer.done():
+                producer.cancel()
+            elif not producer.cancelled():
+                producer.exception()
+
+    async def generate_sectioned_resume(
+        self,
+        sections: Dict[str, str],
+        job_title: Optional[str] = None
+    ) -> str:
+        """
+        Optimize each section concurrently and merge them in resume order.
+        
+        Each section gets its own small prompt, bounded by SECTION_CONCURRENCY,
+        so completion time is set by the slowest section. Sections without a
+        template are kept as-is.
+        
+        Args:
+            sections: Section name to content, as returned by classify_sections
+            job_title: Optional target job title
+            
+        Returns:
+            Optimized resume text with one heading per section
+        """
+        if not sections:
+            return await self.generate_optimized_resume(sections, job_title or "Software Engineering")
+        
+        job_title = job_title or "Software Engineering"
+        semaphore = asyncio.Semaphore(self.settings.SECTION_CONCURRENCY)
+        
+        async def optimize(name: str, content: str) -> str:
+            if name not in SECTION_TEMPLATES or not content:
+                return content
+            async with semaphore:
+                return await self.optimize_section(name, content, job_title)
+        
+        names = list(sections)
+        optimized = await asyncio.gather(
+            *(optimize(name, sections[name]) for name in names)
+        )
+        
+        return "\n\n".join(
+            f"{name.title()}\n{text}"
+            for name, text in zip(names, optimized)
+            if text
+        )
+
     async def analyze_resume(
         self,
         content: str,
-        job_description: Optional[str] = None
+        job_description: Optional[Union[str, JobDescription]] = None
     ) -> ResumeAnalysis:
         """
         Analyze resume content and provide feedback.
@@ -158,46 +445,261 @@ class ResumeOptimizer:
         Args:
             content: Raw resume text content
             job_description: Optional job description to match against
+                (a JobDescription also weights its requirements in the
+                keyword match)
             
         Returns:
             ResumeAnalysis object containing scores and feedback
         """
-        # Implementation from previous version
-        system_prompt = """You are an expert resume analyst. Analyze the resume provided and give:
+        match = self.keyword_match(content, job_description)
+        if match is None:
+            system_prompt = """You are an expert resume analyst. Analyze the resume provided and give:
         1. A score out of 100
         2. Specific feedback on improvements
         3. Keywords found in the resume
         4. Important keywords that should be added
         Format your response as JSON."""
+        else:
+            # Keywords come from the local matcher; only ask for the narrative
+            system_prompt = """You are an expert resume analyst. Analyze the resume provided and give:
+        1. A score out of 100
+        2. Specific feedback on improvements
+        Format your response as JSON."""
 
         user_prompt = f"Resume content:\n{content}"
         if job_description:
             user_prompt += f"\n\nJob Description:\n{job_description}"
 
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
+            result = await self._complete(
+                self.settings.OPENAI_MODEL,
+                [
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
                 response_format={"type": "json_object"}
             )
             
-            result = response.choices[0].message.content
-            analysis_dict = eval(result)
-            
-            return ResumeAnalysis(
-                score=float(analysis_dict.get('score', 0)),
-                feedback=[
-                    {"category": k, "suggestion": v}
-                    for k, v in analysis_dict.get('feedback', {}).items()
-                ],
-                suggestions=analysis_dict.get('suggestions', []),
-                keywords_found=analysis_dict.get('keywords_found', []),
-                missing_keywords=analysis_dict.get('missing_keywords', [])
-            )
+            analysis = ResumeAnalysis(**self._analysis_fields(result))
+            return self._with_keywords(analysis, match)
             
         except Exception as e:
             logger.error(f"Error in resume analysis: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def _analysis_fields(result: str) -> Dict:
+        """Parse an analysis JSON response into ResumeAnalysis fields."""
+        analysis_dict = json.loads(result)
+        feedback = analysis_dict.get('feedback') or {}
+        return {
+            'score': min(max(float(analysis_dict.get('score', 0)), 0), 100),
+            'feedback': [
+                {"category": str(k), "suggestion": str(v)}
+                for k, v in feedback.items()
+            ],
+            'suggestions': analysis_dict.get('suggestions', []),
+            'keywords_found': analysis_dict.get('keywords_found', []),
+            'missing_keywords': analysis_dict.get('missing_keywords', [])
+        }
+
+    @staticmethod
+    def keyword_match(
+        content: str,
+        job_description: Optional[Union[str, JobDescription]] = None
+    ) -> Optional[KeywordMatch]:
+        """
+        Match keywords locally, or None when the LLM should list them.
+        
+        Matching skills is deterministic, so when there is a job description
+        naming known skills keyword_matcher's result is used and the LLM is
+        only asked for the narrative analysis. A JobDescription is matched
+        like the keywords endpoint does, with its requirements weighted
+        separately.
+        """
+        if not job_description:
+            return None
+        if isinstance(job_description, JobDescription):
+            match = keyword_matcher.match(content, job_text(job_description), job_description.requirements)
+        else:
+            match = keyword_matcher.match(content, job_description)
+        return match if match.score is not None else None
+
+    @classmethod
+    def apply_keyword_match(
+        cls,
+        analysis: ResumeAnalysis,
+        content: str,
+        job_description: Optional[Union[str, JobDescription]] = None
+    ) -> ResumeAnalysis:
+        """Replace the analysis' keywords with the local match, if any (see keyword_match)."""
+        return cls._with_keywords(analysis, cls.keyword_match(content, job_description))
+
+    @staticmethod
+    def _with_keywords(analysis: ResumeAnalysis, match: Optional[KeywordMatch]) -> ResumeAnalysis:
+        if match is None:
+            return analysis
+        return analysis.model_copy(update={
+            'keywords_found': match.keywords_found,
+            'missing_keywords': match.missing_keywords,
+            'keyword_score': match.score
+        })
+
+    @staticmethod
+    def section_fingerprint(
+        model: str,
+        name: str,
+        content: str,
+        job_description: Optional[str] = None,
+        keywords: bool = True
+    ) -> str:
+        """
+        Content-address a section analysis.
+        
+        Covers everything the result depends on: the model, the prompt
+        template version and variant (with or without keywords), the
+        section name and text, and the job description, with whitespace
+        normalized so reflowed text still matches.
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "template_version": PROMPT_TEMPLATE_VERSION,
+                "keywords": keywords,
+                "section": name,
+                "content": re.sub(r'\s+', ' ', content).strip(),
+                "job_description": re.sub(r'\s+', ' ', job_description).strip() if job_description else None
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def analyze_section(
+        self,
+        name: str,
+        content: str,
+        job_description: Optional[str] = None,
+        keywords: bool = True
+    ) -> SectionAnalysis:
+        """
+        Analyze a single resume section.
+        
+        Args:
+            name: Section name, as returned by classify_sections
+            content: Section text
+            job_description: Optional job description to match against
+            keywords: Whether the LLM should list keywords (False when they
+                come from the local matcher)
+            
+        Returns:
+            SectionAnalysis fingerprinted with its inputs
+        """
+        model = self.settings.OPENAI_MODEL
+        user_prompt = f"Section: {name}\n\n{content}"
+        if job_description:
+            user_prompt += f"\n\nJob Description:\n{job_description}"
+        
+        result = await self._complete(
+            model,
+            [
+                {"role": "system", "content": SECTION_ANALYSIS_PROMPT if keywords else SECTION_FEEDBACK_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            response_format={"type": "json_object"}
+        )
+        fields = self._analysis_fields(result)
+        for item in fields['feedback']:
+            item['section'] = name
+        return SectionAnalysis(
+            fingerprint=self.section_fingerprint(model, name, content, job_description, keywords),
+            weight=len(content),
+            **fields
+        )
+
+    @staticmethod
+    def merge_section_analyses(sections: Dict[str, SectionAnalysis]) -> ResumeAnalysis:
+        """
+        Combine per-section results into one ResumeAnalysis.
+        
+        The overall score is the section scores weighted by section length;
+        feedback and suggestions are concatenated in resume order, keywords
+        de-duplicated, and keywords found in one section are not reported
+        missing by another.
+        """
+        weights = {name: max(section.weight, 1) for name, section in sections.items()}
+        score = sum(section.score * weights[name] for name, section in sections.items()) / sum(weights.values())
+        keywords_found = _unique(k for section in sections.values() for k in section.keywords_found)
+        found = {k.strip().lower() for k in keywords_found}
+        return ResumeAnalysis(
+            score=round(score, 1),
+            feedback=[item for section in sections.values() for item in section.feedback],
+            suggestions=_unique(s for section in sections.values() for s in section.suggestions),
+            keywords_found=keywords_found,
+            missing_keywords=[
+                k for k in _unique(k for section in sections.values() for k in section.missing_keywords)
+                if k.strip().lower() not in found
+            ],
+            sections=sections
+        )
+
+    async def analyze_resume_sections(
+        self,
+        content: str,
+        job_description: Optional[Union[str, JobDescription]] = None,
+        previous: Optional[ResumeAnalysis] = None
+    ) -> ResumeAnalysis:
+        """
+        Analyze a resume section by section, reusing unchanged sections.
+        
+        Each section from classify_sections is fingerprinted; sections whose
+        fingerprint matches one in ``previous`` keep their earlier result,
+        the rest are analyzed concurrently (bounded by SECTION_CONCURRENCY).
+        A typical edit touches one section, so it costs one small prompt
+        instead of a full-document analysis. Resumes without recognizable
+        section headings fall back to analyze_resume.
+        
+        Args:
+            content: Raw resume text content
+            job_description: Optional job description to match against
+            previous: The resume's current analysis, if any
+            
+        Returns:
+            Merged ResumeAnalysis including per-section results
+        """
+        sections = {
+            name: text
+            for name, text in self.classify_sections(content).items()
+            if text.strip()
+        }
+        if not sections:
+            return await self.analyze_resume(content, job_description)
+        
+        model = self.settings.OPENAI_MODEL
+        prompt_job = str(job_description) if job_description else None
+        match = self.keyword_match(content, job_description)
+        keywords = match is None
+        known = (previous.sections or {}) if previous else {}
+        semaphore = asyncio.Semaphore(self.settings.SECTION_CONCURRENCY)
+        reused = []
+        
+        async def analyze(name: str, text: str) -> SectionAnalysis:
+            cached = known.get(name)
+            if cached is not None and cached.fingerprint == self.section_fingerprint(
+                model, name, text, prompt_job, keywords
+            ):
+                reused.append(name)
+                return cached
+            async with semaphore:
+                return await self.analyze_section(name, text, prompt_job, keywords)
+        
+        names = list(sections)
+        results = await asyncio.gather(
+            *(analyze(name, sections[name]) for name in names)
+        )
+        if previous is not None:
+            logger.info(f"Re-analyzed {len(names) - len(reused)}/{len(names)} resume sections")
+        analysis = self.merge_section_analyses(dict(zip(names, results)))
+        return self._with_keywords(analysis, match)
+
+# Initialize optimizer service
+optimizer = ResumeOptimizer()
\ No newline at end of file
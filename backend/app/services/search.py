@@ -0,0 +1,181 @@
+"""Semantic search over each user's resumes."""
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+from datetime import datetime
+import asyncio
+import hashlib
+import logging
+import time
+from pydantic import TypeAdapter
+from ..config import get_settings
+from ..core.database import db
+from ..core.vector_index import VectorIndex
+from ..models.resume import Resume
+from .embeddings import EmbeddingProvider, get_embedding_provider
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_TIMESTAMP = TypeAdapter(datetime)
+
+def resume_document(title: str, content: Optional[str]) -> str:
+    """The text embedded for a resume: its title and content."""
+    return f"{title}\n{content or ''}"
+
+class _UserIndex:
+    """One user's vectors, plus what they were built from."""
+    
+    def __init__(self, dimensions: int, ann_min_size: int):
+        self.vectors = VectorIndex(dimensions, ann_min_size=ann_min_size)
+        self.titles: Dict[str, str] = {}
+        self.stamps: Dict[str, datetime] = {}
+        self.hashes: Dict[str, str] = {}
+        self.synced_at = 0.0
+
+class ResumeSearchIndex:
+    """
+    Per-user embedding indexes over resume titles and content.
+    
+    A user's index is built on their first search. Creates, edits and
+    deletes handled by this worker update it as they happen; before a
+    search, an index not synced for ``sync_ttl`` seconds is diffed against
+    the resumes' ``updated_at`` so changes made through other workers are
+    picked up too. Only new or changed texts are embedded (a resume whose
+    text hash is unchanged keeps its vector). The ``max_users`` most
+    recently searched indexes are kept in memory.
+    """
+    
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        max_users: int = 1000,
+        sync_ttl: float = 30,
+        ann_min_size: int = 1024
+    ):
+        self.provider = provider
+        self.max_users = max_users
+        self.sync_ttl = sync_ttl
+        self.ann_min_size = ann_min_size
+        self.users: "OrderedDict[str, _UserIndex]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.embedded = 0
+        self.syncs = 0
+    
+    async def _index_rows(self, user: _UserIndex, rows: Iterable[Dict]):
+        pending = []
+        for row in rows:
+            resume_id = str(row['id'])
+            document = resume_document(row['title'], row.get('content'))
+            digest = hashlib.sha256(document.encode('utf-8')).hexdigest()
+            user.titles[resume_id] = row['title']
+            user.stamps[resume_id] = _TIMESTAMP.validate_python(row['updated_at'])
+            if user.hashes.get(resume_id) != digest or resume_id not in user.vectors:
+                pending.append((resume_id, document, digest))
+        if not pending:
+            return
+        vectors = await self.provider.embed([document for _, document, _ in pending])
+        for (resume_id, _, digest), vector in zip(pending, vectors):
+            user.vectors.upsert(resume_id, vector)
+            user.hashes[resume_id] = digest
+        self.embedded += len(pending)
+    
+    def _forget(self, user: _UserIndex, resume_id: str):
+        user.vectors.remove(resume_id)
+        user.titles.pop(resume_id, None)
+        user.stamps.pop(resume_id, None)
+        user.hashes.pop(resume_id, None)
+    
+    async def upsert(self, resume: Resume):
+        """
+        Index a created or edited resume (best effort; failures are logged).
+        
+        Does nothing until the user's index has been built by a search.
+        """
+        user = self.users.get(resume.user_id)
+        if user is None:
+            return
+        try:
+            await self._index_rows(user, [resume.model_dump(include={'id', 'title', 'content', 'updated_at'})])
+        except Exception as e:
+            # The next sync re-embeds it
+            user.stamps.pop(str(resume.id), None)
+            logger.error(f"Failed to index resume {resume.id}: {str(e)}")
+    
+    def remove(self, user_id: str, resume_id) -> None:
+        """Drop a deleted resume from its user's index."""
+        user = self.users.get(user_id)
+        if user is not None:
+            self._forget(user, str(resume_id))
+    
+    async def _sync(self, user_id: str) -> _UserIndex:
+        user = self.users.get(user_id)
+        if user is not None and time.monotonic() - user.synced_at < self.sync_ttl:
+            self.users.move_to_end(user_id)
+            return user
+        
+        lock = self._locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            user = self.users.get(user_id)
+            if user is not None and time.monotonic() - user.synced_at < self.sync_ttl:
+                return user
+            if user is None:
+                user = _UserIndex(self.provider.dimensions, self.ann_min_size)
+            
+            current = {
+                str(row['id']): _TIMESTAMP.validate_python(row['updated_at'])
+                for row in await db.list_resume_stamps(user_id)
+            }
+            for resume_id in set(user.stamps) - set(current):
+                self._forget(user, resume_id)
+            stale = [resume_id for resume_id, stamp in current.items() if user.stamps.get(resume_id) != stamp]
+            if stale:
+                await self._index_rows(user, await db.get_resume_texts(user_id, stale))
+            user.synced_at = time.monotonic()
+            self.syncs += 1
+            
+            self.users[user_id] = user
+            self.users.move_to_end(user_id)
+            while len(self.users) > self.max_users:
+                evicted, _ = self.users.popitem(last=False)
+                self._locks.pop(evicted, None)
+        return user
+    
+    async def search(self, user_id: str, query: str, limit: int = 10) -> List[Tuple[str, str, float]]:
+        """
+        Find a user's resumes most similar to ``query``.
+        
+        Args:
+            user_id: User whose resumes to search
+            query: Free text, e.g. "data engineering" or a job description
+            limit: Maximum number of results
+        
+        Returns:
+            (resume id, title, similarity) tuples, most similar first
+        """
+        user = await self._sync(user_id)
+        if not len(user.vectors):
+            return []
+        vector = (await self.provider.embed([query]))[0]
+        return [
+            (resume_id, user.titles[resume_id], score)
+            for resume_id, score in user.vectors.search(vector, limit)
+        ]
+    
+    def stats(self) -> Dict:
+        return {
+            'provider': self.provider.name,
+            'dimensions': self.provider.dimensions,
+            'users': len(self.users),
+            'vectors': sum(len(user.vectors) for user in self.users.values()),
+            'bytes': sum(user.vectors.nbytes for user in self.users.values()),
+            'embedded': self.embedded,
+            'syncs': self.syncs
+        }
+
+# Initialize resume search index
+search_index = ResumeSearchIndex(
+    get_embedding_provider(settings.EMBEDDING_PROVIDER, settings.EMBEDDING_DIMENSIONS),
+    max_users=settings.SEARCH_INDEX_MAX_USERS,
+    sync_ttl=settings.SEARCH_INDEX_SYNC_TTL,
+    ann_min_size=settings.SEARCH_ANN_MIN_SIZE
+)
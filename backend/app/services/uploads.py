@@ -0,0 +1,169 @@
+"""Resume upload processing shared by the request and background-job paths."""
+from typing import Any, Awaitable, Callable, ContextManager, Dict, Optional
+from contextlib import nullcontext
+from uuid import uuid4
+import asyncio
+import logging
+from ..models.job import Job
+from ..models.resume import Resume, ResumeCreate, JobDescription, AnalysisStatus
+from ..core.storage import storage
+from ..core.database import db
+from ..core.periodic import PeriodicTask
+from .resume_optimizer import optimizer
+from .jobs import JobProgress, job_manager
+from .quota import quota
+from .search import search_index
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_JOB = "resume_upload"
+UPLOAD_STAGES = ["extract", "store", "analyze", "save"]
+
+def _no_stage(name: str) -> ContextManager:
+    return nullcontext()
+
+async def process_upload(
+    user_id: str,
+    filename: str,
+    file_ext: str,
+    content: bytes,
+    content_type: Optional[str] = None,
+    job_info: Optional[JobDescription] = None,
+    stage: Callable[[str], ContextManager] = _no_stage,
+    save: Optional[Callable[[Dict], Awaitable[Resume]]] = None,
+    content_hash: Optional[str] = None
+) -> Resume:
+    """
+    Extract, store, analyze and persist an uploaded resume.
+    
+    Text is extracted first so unreadable or scanned documents are
+    rejected before anything is written to storage or sent to the LLM.
+    
+    Args:
+        user_id: Owner of the resume
+        filename: Original file name
+        file_ext: Validated file extension
+        content: Raw file bytes
+        content_type: Optional MIME type
+        job_info: Optional job description to analyze against
+        stage: Factory returning a context manager per stage, for progress reporting
+        save: Optional coroutine persisting the row built by db.resume_row
+            (e.g. a bulk writer); defaults to a single create_resume write
+        content_hash: Optional SHA-256 of the content (from intake), lets
+            extraction reuse the text of an identical earlier upload
+    
+    Returns:
+        The saved Resume including its analysis, or with analysis pending
+        if the LLM is unavailable
+    
+    Raises:
+        ExtractionError if no text can be extracted from the file
+    """
+    file_id = str(uuid4())
+    file_path = f"user_{user_id}/{file_id}.{file_ext}"
+    
+    with stage("extract"):
+        text_content = await optimizer.extract_text_from_resume(content, file_ext, content_hash)
+    
+    with stage("store"):
+        file_url = await storage.upload_file(content, file_path, content_type)
+    
+    saving = False
+    try:
+        with stage("analyze"):
+            try:
+                analysis = await optimizer.analyze_resume(
+                    text_content,
+                    job_info
+                )
+            except Exception as e:
+                if not optimizer.is_unavailable(e):
+                    raise
+                # Degraded mode: keep the upload, analyze later via backfill
+                logger.warning(f"LLM unavailable, deferring analysis for {filename}: {str(e)}")
+                analysis = None
+        
+        with stage("save"):
+            resume = ResumeCreate(
+                title=filename,
+                content=text_content,
+                file_type=file_ext,
+                user_id=user_id
+            )
+            analysis_status = AnalysisStatus.PENDING if analysis is None else None
+            saving = True
+            if save is not None:
+                saved = await save(
+                    db.resume_row(resume, file_url, analysis, analysis_status, len(content))
+                )
+            else:
+                # One write: resume row, analysis and storage usage together
+                saved = await db.create_resume(
+                    resume,
+                    file_url,
+                    analysis=analysis,
+                    analysis_status=analysis_status,
+                    file_size=len(content)
+                )
+    except BaseException as e:
+        # Don't leave an unaccounted file behind, unless we were cancelled
+        # mid-save and the row may still be written
+        if not (saving and isinstance(e, asyncio.CancelledError)):
+            await _discard_file(file_path)
+        raise
+    
+    quota.note_usage(user_id, len(content))
+    await search_index.upsert(saved)
+    return saved
+
+async def _discard_file(file_path: str):
+    try:
+        await storage.delete_file(file_path)
+    except Exception as e:
+        logger.error(f"Failed to remove orphaned upload {file_path}: {str(e)}")
+
+async def backfill_pending_analyses():
+    """
+    Analyze resumes saved while the LLM was unavailable.
+    
+    Skips the run while the circuit breaker is open and stops early if it
+    trips again part-way through the batch. Resumes that fail for any other
+    reason are marked failed rather than retried forever.
+    """
+    if not optimizer.breaker.available:
+        return
+    pending = await db.list_pending_analyses(optimizer.settings.ANALYSIS_BACKFILL_BATCH)
+    for resume in pending:
+        try:
+            if resume.analysis and resume.analysis.sections:
+                # A deferred edit: only re-analyze the sections that changed
+                analysis = await optimizer.analyze_resume_sections(
+                    resume.content,
+                    previous=resume.analysis
+                )
+            else:
+                analysis = await optimizer.analyze_resume(resume.content)
+        except Exception as e:
+            if optimizer.is_unavailable(e):
+                logger.warning(f"Analysis backfill paused: {str(e)}")
+                return
+            logger.error(f"Analysis backfill failed for resume {resume.id}: {str(e)}")
+            # Take it out of the pending set so it can't block later batches
+            await db.update_resume(resume.id, resume.user_id, {'analysis_status': AnalysisStatus.FAILED})
+            continue
+        await db.update_resume(resume.id, resume.user_id, {}, analysis=analysis)
+    if pending:
+        logger.info(f"Backfilled analysis for {len(pending)} resume(s)")
+
+async def run_upload_job(job: Job, payload: Dict[str, Any], progress: JobProgress) -> Dict[str, Any]:
+    """Background-job handler for resume uploads."""
+    resume = await process_upload(**payload, stage=progress.stage)
+    return {"resume_id": str(resume.id)}
+
+job_manager.register(UPLOAD_JOB, run_upload_job)
+
+analysis_backfill = PeriodicTask(
+    "analysis_backfill",
+    optimizer.settings.ANALYSIS_BACKFILL_INTERVAL,
+    backfill_pending_analyses
+)
@@ -0,0 +1,153 @@
+"""Resume version history stored as line deltas with periodic snapshots."""
+from typing import List, Optional, Union
+from uuid import UUID
+import difflib
+import hashlib
+import json
+import logging
+from ..config import get_settings
+from ..core.database import db
+from ..models.resume import ResumeVersion
+
+logger = logging.getLogger(__name__)
+
+class VersionSource:
+    """What produced a resume version."""
+    ORIGINAL = "original"
+    EDIT = "edit"
+    OPTIMIZE = "optimize"
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def make_delta(base: str, content: str) -> str:
+    """
+    Encode ``content`` as line operations against ``base``.
+    
+    The delta is a compact JSON list: a positive int copies that many lines
+    from ``base``, a negative int skips that many, a string inserts a line.
+    A typo fix in one line of a long resume becomes e.g. ``[12,-1,"...",40]``.
+    """
+    base_lines = base.split('\n')
+    new_lines = content.split('\n')
+    ops: List[Union[int, str]] = []
+    matcher = difflib.SequenceMatcher(None, base_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append(i2 - i1)
+            continue
+        if i2 > i1:
+            ops.append(i1 - i2)
+        ops.extend(new_lines[j1:j2])
+    return json.dumps(ops, separators=(',', ':'), ensure_ascii=False)
+
+def apply_delta(base: str, delta: str) -> str:
+    """Rebuild content from ``base`` and a delta produced by make_delta."""
+    base_lines = base.split('\n')
+    lines: List[str] = []
+    position = 0
+    for op in json.loads(delta):
+        if isinstance(op, str):
+            lines.append(op)
+        elif op > 0:
+            lines.extend(base_lines[position:position + op])
+            position += op
+        else:
+            position -= op
+    return '\n'.join(lines)
+
+class VersionIntegrityError(Exception):
+    """A rebuilt version does not match its recorded hash."""
+    pass
+
+class ResumeHistory:
+    """
+    Record and rebuild resume versions.
+    
+    Each content change is stored as a delta against the previous version;
+    every ``snapshot_interval`` versions (and whenever the delta's base is
+    not the latest version, e.g. after a concurrent edit) the full text is
+    stored instead. Rebuilding a version therefore reads one snapshot plus
+    at most ``snapshot_interval - 1`` deltas. The ordering and base checks
+    happen in the ``add_resume_version`` database function.
+    """
+    
+    def __init__(self, snapshot_interval: int):
+        self.snapshot_interval = max(snapshot_interval, 1)
+    
+    async def record(
+        self,
+        resume_id: UUID,
+        before: Optional[str],
+        after: str,
+        source: str = VersionSource.EDIT
+    ):
+        """
+        Record ``after`` as a new version (best effort; failures are logged).
+        
+        Args:
+            resume_id: Resume UUID
+            before: Content the resume had before the change, if known
+            after: New content
+            source: What produced the change (see VersionSource)
+        """
+        params = {
+            'content': after,
+            'content_sha256': content_hash(after),
+            'source': source,
+            'snapshot_interval': self.snapshot_interval
+        }
+        if before is not None:
+            delta = make_delta(before, after)
+            params.update({
+                # Not worth it if the diff is as large as the text itself
+                'delta': delta if len(delta) < len(after) else None,
+                'base_content': before,
+                'base_sha256': content_hash(before)
+            })
+        try:
+            await db.add_resume_version(resume_id, params)
+        except Exception as e:
+            # The edit itself is already saved; don't fail the request over history
+            logger.error(f"Failed to record version of resume {resume_id}: {str(e)}")
+    
+    async def list(self, resume_id: UUID) -> List[ResumeVersion]:
+        """List a resume's versions, newest first, without content."""
+        return [ResumeVersion(**row) for row in await db.list_resume_versions(resume_id)]
+    
+    async def get(self, resume_id: UUID, version_number: int) -> Optional[ResumeVersion]:
+        """
+        Rebuild one version of a resume.
+        
+        Args:
+            resume_id: Resume UUID
+            version_number: Version to rebuild
+        
+        Returns:
+            The version including its full content, or None if it doesn't exist
+        
+        Raises:
+            VersionIntegrityError if the stored chain is inconsistent
+        """
+        rows = await db.get_resume_version_chain(resume_id, version_number, self.snapshot_interval)
+        if not any(row['kind'] == 'snapshot' for row in rows):
+            # Snapshot interval was raised after these versions were written
+            rows = await db.get_resume_version_chain(resume_id, version_number)
+        if not rows or rows[-1]['version_number'] != version_number:
+            return None
+        
+        snapshots = [i for i, row in enumerate(rows) if row['kind'] == 'snapshot']
+        if not snapshots:
+            raise VersionIntegrityError(f"No snapshot found for version {version_number} of resume {resume_id}")
+        start = snapshots[-1]
+        content = rows[start]['content']
+        for row in rows[start + 1:]:
+            content = apply_delta(content, row['delta'])
+        
+        target = rows[-1]
+        if target.get('content_sha256') and content_hash(content) != target['content_sha256']:
+            raise VersionIntegrityError(f"Version {version_number} of resume {resume_id} failed its integrity check")
+        return ResumeVersion(**{**target, 'content': content})
+
+# Initialize resume history
+history = ResumeHistory(get_settings().VERSION_SNAPSHOT_INTERVAL)
@@ -0,0 +1,29 @@
+"""Offline benchmarks for the backend services.
+
+Run from the ``backend`` directory, e.g. ``python -m benchmarks.db_latency``.
+"""
+import os
+
+# Placeholder credentials so the app settings load without a real .env.
+# Benchmarks never talk to Clerk, Supabase or OpenAI.
+_PLACEHOLDER_ENV = {
+    "CLERK_PUBLISHABLE_KEY": "bench",
+    "CLERK_SECRET_KEY": "bench",
+    "CLERK_JWT_KEY": "bench",
+    "SUPABASE_URL": "http://localhost:54321",
+    "SUPABASE_KEY": "bench.bench.bench",
+    "SUPABASE_JWT_SECRET": "bench",
+    "OPENAI_API_KEY": "bench",
+}
+
+for _key, _value in _PLACEHOLDER_ENV.items():
+    os.environ.setdefault(_key, _value)
+
+
+def percentile(samples, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
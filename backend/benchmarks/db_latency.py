@@ -0,0 +1,124 @@
+"""
+Compare DatabaseService latency with queries run inline vs. on the DB pool.
+
+A fake supabase client blocks for ``--latency`` ms per ``execute()`` to
+emulate a network round trip. For each concurrency level the benchmark
+fires that many concurrent ``get_resume`` calls and reports p50/p99
+request latency measured from submission. A probe task sleeping
+``--probe-interval`` ms in a loop runs for the whole level and reports how
+late it wakes up: the event-loop lag any other request (e.g. a health
+check) would see.
+
+    python -m benchmarks.db_latency --latency 20 --levels 1 4 16 64
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from . import percentile
+from app.core.database import DatabaseService
+
+
+class _FakeResult:
+    def __init__(self, data):
+        self.data = data
+        self.count = len(data)
+
+
+class _FakeQuery:
+    """Chainable stand-in for a postgrest query builder."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        time.sleep(self.latency)
+        now = datetime.utcnow().isoformat()
+        return _FakeResult([{
+            'id': str(uuid4()),
+            'user_id': 'bench',
+            'title': 'resume.docx',
+            'content': 'Experience\nEngineer',
+            'file_type': 'docx',
+            'created_at': now,
+            'updated_at': now,
+        }])
+
+
+class _FakeClient:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def table(self, name: str):
+        return _FakeQuery(self.latency)
+
+
+class _InlineDatabaseService(DatabaseService):
+    """Previous behaviour: execute() called directly on the event loop."""
+
+    async def _execute(self, query):
+        return query.execute()
+
+
+async def _probe_loop_lag(lags, interval: float):
+    """Record how late each ``interval`` sleep wakes up, until cancelled."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def _run_level(service: DatabaseService, concurrency: int, rounds: int, probe_interval: float):
+    latencies, lags = [], []
+
+    async def one_request(submitted: float):
+        await service.get_resume(uuid4(), 'bench')
+        latencies.append(time.perf_counter() - submitted)
+
+    probe = asyncio.create_task(_probe_loop_lag(lags, probe_interval))
+    await asyncio.sleep(0)
+    try:
+        for _ in range(rounds):
+            # Latency counts from submission, so time spent queued behind
+            # other requests blocking the loop is included
+            submitted = time.perf_counter()
+            await asyncio.gather(*(one_request(submitted) for _ in range(concurrency)))
+    finally:
+        probe.cancel()
+    return latencies, lags
+
+
+async def main(args):
+    client = _FakeClient(args.latency / 1000)
+    variants = {
+        'inline': _InlineDatabaseService(client=client, max_workers=1),
+        'pool': DatabaseService(client=client, max_workers=args.workers),
+    }
+    print(f"{'mode':<8}{'conc':>6}{'p50 ms':>10}{'p99 ms':>10}{'loop lag p99 ms':>17}{'max':>8}")
+    for level in args.levels:
+        for name, service in variants.items():
+            latencies, lags = await _run_level(service, level, args.rounds, args.probe_interval / 1000)
+            print(
+                f"{name:<8}{level:>6}"
+                f"{percentile(latencies, 50) * 1000:>10.1f}"
+                f"{percentile(latencies, 99) * 1000:>10.1f}"
+                f"{percentile(lags, 99) * 1000:>17.1f}"
+                f"{max(lags, default=0) * 1000:>8.1f}"
+            )
+    for service in variants.values():
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--latency', type=float, default=20, help="Simulated round trip in ms")
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--probe-interval', type=float, default=1, help="Loop-lag probe period in ms")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,89 @@
+"""
+Streaming DOCX extractor vs. python-docx on a generated corpus.
+
+Generates DOCX resumes in several sizes (paragraphs plus a skills table
+and a header), then for each size and engine extracts them in a fresh
+process and reports time per document, extracted characters and how far
+the worker's peak RSS grew while extracting. The streaming engine should
+be faster, find the table/header text python-docx skips, and keep its
+peak memory roughly flat as documents grow.
+
+    python -m benchmarks.docx_extraction --sizes 100,1000,10000,30000
+"""
+import argparse
+import io
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from docx import Document
+
+from app.services.extraction import DOCX_ENGINES, extract_text
+
+
+def make_docx(paragraphs: int) -> bytes:
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "Jane Doe | jane@example.com | +1 555 0100"
+    doc.add_heading("Experience", 1)
+    for index in range(paragraphs):
+        doc.add_paragraph(
+            f"Led project {index}: built Python services, cut latency by {index % 90}% "
+            "and mentored engineers across teams."
+        )
+    table = doc.add_table(rows=max(paragraphs // 50, 1), cols=3)
+    for row_index, row in enumerate(table.rows):
+        for col_index, cell in enumerate(row.cells):
+            cell.text = f"skill-{row_index}-{col_index}"
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_engine(engine: str, documents, repeat: int):
+    # Warm up imports on a tiny document so they don't count towards time or memory
+    extract_text(make_docx(1), "docx", engine)
+    baseline = _peak_rss_mb()
+    chars = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content in documents:
+            chars = len(extract_text(content, "docx", engine))
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(documents)), chars, _peak_rss_mb() - baseline
+
+
+def main(args):
+    sizes = [int(size) for size in args.sizes.split(",")]
+    context = multiprocessing.get_context("spawn")  # clean process per run
+    print(f"{'paragraphs':>10} {'file KB':>8} {'engine':<12} {'ms/doc':>9} {'chars':>9} {'peak RSS +MB':>13}")
+    speedups = []
+    for size in sizes:
+        content = make_docx(size)
+        results = {}
+        for engine in DOCX_ENGINES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                per_doc, chars, peak = executor.submit(
+                    _run_engine, engine, [content], args.repeat
+                ).result()
+            results[engine] = per_doc
+            print(
+                f"{size:>10} {len(content) / 1024:>8.0f} {engine:<12} "
+                f"{per_doc * 1000:>9.1f} {chars:>9} {peak:>13.1f}"
+            )
+        speedups.append(results["python-docx"] / results["streaming"])
+    print(f"streaming is {min(speedups):.1f}x-{max(speedups):.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default="100,1000,10000,30000", help="Comma-separated paragraph counts")
+    parser.add_argument('--repeat', type=int, default=3, help="Extractions per document and engine")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,97 @@
+"""
+Event-loop lag while DOCX resumes are being extracted.
+
+Generates DOCX files in memory, then extracts ``--docs`` of them with
+``--concurrency`` in flight, once inline on the event loop (the old
+behaviour) and once on the extraction process pool. A ticker task sleeps
+``--tick`` ms in a loop and records how late it wakes up; that lateness
+is what every other request on the worker would see.
+
+    python -m benchmarks.extraction_loop_lag --docs 40 --paragraphs 3000
+"""
+import argparse
+import asyncio
+import io
+import sys
+import time
+
+from docx import Document
+
+from . import percentile
+from app.services.extraction import ExtractionPool, extract_text
+
+
+def make_docx(paragraphs: int) -> bytes:
+    doc = Document()
+    doc.add_heading("Jane Doe", 0)
+    for index in range(paragraphs):
+        doc.add_paragraph(
+            f"Led project {index}: built Python services, cut latency by {index % 90}% "
+            "and mentored engineers across teams."
+        )
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+async def measure_lag(tick: float, stop: asyncio.Event):
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(tick)
+        lags.append((time.perf_counter() - start - tick) * 1000)
+    return lags
+
+
+async def run(name: str, extract, documents, concurrency: int, tick: float):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(content: bytes):
+        async with semaphore:
+            return await extract(content, "docx")
+
+    stop = asyncio.Event()
+    ticker = asyncio.ensure_future(measure_lag(tick, stop))
+    await asyncio.sleep(tick)  # let the ticker take its first sample
+    start = time.perf_counter()
+    texts = await asyncio.gather(*[one(content) for content in documents])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    lags = await ticker
+    print(
+        f"{name:<7} docs/s={len(texts) / elapsed:7.1f}  "
+        f"loop lag p50={percentile(lags, 50):7.1f} ms  p99={percentile(lags, 99):7.1f} ms  "
+        f"max={max(lags):7.1f} ms"
+    )
+    return percentile(lags, 99)
+
+
+async def main(args):
+    print(f"Generating {args.docs} DOCX files with {args.paragraphs} paragraphs each...")
+    template = make_docx(args.paragraphs)
+    documents = [template] * args.docs
+    print(f"  {len(template) / 1024:.0f} KB per file")
+
+    async def inline(content: bytes, file_type: str) -> str:
+        return extract_text(content, file_type)
+
+    pool = ExtractionPool(args.workers or None, timeout=args.timeout)
+    await pool.start()
+    try:
+        inline_lag = await run("inline", inline, documents, args.concurrency, args.tick / 1000)
+        pool_lag = await run("pool", pool.extract, documents, args.concurrency, args.tick / 1000)
+    finally:
+        pool.close()
+    print(f"p99 loop lag reduced {inline_lag / max(pool_lag, 0.001):.0f}x with {pool.max_workers} workers")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--docs', type=int, default=40, help="Documents to extract per mode")
+    parser.add_argument('--paragraphs', type=int, default=3000, help="Paragraphs per generated document")
+    parser.add_argument('--concurrency', type=int, default=8, help="Extractions in flight")
+    parser.add_argument('--workers', type=int, default=0, help="Pool processes (0 = one per CPU)")
+    parser.add_argument('--timeout', type=float, default=60.0, help="Per-document timeout in seconds")
+    parser.add_argument('--tick', type=float, default=5.0, help="Ticker interval in ms")
+    sys.exit(asyncio.run(main(parser.parse_args())))
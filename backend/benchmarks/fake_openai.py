@@ -0,0 +1,111 @@
+"""
+Local fake of the OpenAI chat completions API.
+
+Serves ``POST /v1/chat/completions`` (plain and streamed) with a canned
+analysis response. Failure injection is switched at runtime through
+``POST /_control`` so a running backend can be pushed into and out of
+degraded mode:
+
+    uvicorn benchmarks.fake_openai:app --port 8089
+    OPENAI_BASE_URL=http://localhost:8089/v1 uvicorn app.main:app
+    curl -X POST localhost:8089/_control -H 'content-type: application/json' \\
+        -d '{"mode": "error", "status": 503}'
+
+Modes: ``ok``, ``error`` (respond with ``status``), ``slow`` (sleep
+``latency_ms`` before answering) and ``hang`` (never answer).
+"""
+import asyncio
+import json
+import time
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+CANNED_CONTENT = json.dumps({
+    "score": 75,
+    "feedback": {"format": "Use consistent bullet points"},
+    "suggestions": ["Quantify achievements"],
+    "keywords_found": ["python"],
+    "missing_keywords": ["kubernetes"],
+})
+
+
+class FaultConfig(BaseModel):
+    mode: str = "ok"
+    status: int = 503
+    latency_ms: float = 0
+
+
+app = FastAPI(title="Fake OpenAI")
+app.state.fault = FaultConfig()
+app.state.calls = 0
+
+
+@app.post("/_control")
+async def control(config: FaultConfig):
+    """Change the failure mode; returns the active config and call count."""
+    app.state.fault = config
+    return {"fault": config.model_dump(), "calls": app.state.calls}
+
+
+@app.get("/_control")
+async def control_state():
+    return {"fault": app.state.fault.model_dump(), "calls": app.state.calls}
+
+
+def _completion(model: str, content: str) -> dict:
+    return {
+        "id": f"chatcmpl-fake-{app.state.calls}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def _chunk(model: str, content: Optional[str], finish_reason: Optional[str] = None) -> str:
+    delta = {"content": content} if content is not None else {}
+    payload = {
+        "id": f"chatcmpl-fake-{app.state.calls}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    app.state.calls += 1
+    body = await request.json()
+    model = body.get("model", "fake")
+    fault = app.state.fault
+
+    if fault.mode == "hang":
+        await asyncio.sleep(3600)
+    if fault.mode == "slow":
+        await asyncio.sleep(fault.latency_ms / 1000)
+    if fault.mode == "error":
+        return JSONResponse(
+            status_code=fault.status,
+            content={"error": {"message": "Injected failure", "type": "server_error"}},
+        )
+
+    if not body.get("stream"):
+        return _completion(model, CANNED_CONTENT)
+
+    async def events():
+        for line in ("John Doe", "Senior Engineer", "- Built things"):
+            yield _chunk(model, line + "\n")
+        yield _chunk(model, None, "stop")
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
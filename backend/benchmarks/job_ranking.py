@@ -0,0 +1,118 @@
+"""
+Ranking one resume against many job postings: per-job LLM calls vs. rank_jobs.
+
+Generates ``--jobs`` postings from the skills vocabulary and a resume that
+covers some of them, then ranks them two ways:
+
+- per-job  - one ``analyze_resume`` call per posting (the old option)
+- ranked   - ``rank_jobs``: local matrix scoring of all postings, with the
+             top ``--explain-top`` escalated to the LLM
+
+The fake OpenAI client charges latency per prompt token, as in
+``benchmarks.section_reanalysis``. Also reports how long the local
+scoring alone takes for all postings.
+
+    python -m benchmarks.job_ranking --jobs 50 --explain-top 3
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+from app.core.skills import SKILLS
+from app.models.resume import JobDescription
+from app.services.keywords import keyword_matcher
+from app.services.ranking import rank_jobs
+from app.services.resume_optimizer import optimizer
+
+
+class _FakeCompletions:
+    def __init__(self, ms_per_ktoken: float):
+        self.ms_per_ktoken = ms_per_ktoken
+        self.calls = 0
+        self.prompt_tokens = 0
+
+    async def create(self, messages, **kwargs):
+        tokens = sum(len(m["content"]) for m in messages) // 4
+        self.calls += 1
+        self.prompt_tokens += tokens
+        await asyncio.sleep(self.ms_per_ktoken * tokens / 1000 / 1000)
+        content = (
+            '{"score": 75, "feedback": {"fit": "Highlight matching projects"}, '
+            '"suggestions": ["Add metrics"], "keywords_found": [], "missing_keywords": []}'
+        )
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_jobs(rng: random.Random, count: int):
+    names = list(SKILLS)
+    return [
+        JobDescription(
+            title=f"Engineer {index}",
+            description=(
+                "We are hiring an engineer to build and run our platform. "
+                + " ".join(f"Experience with {rng.choice(SKILLS[name])}." for name in rng.sample(names, 10))
+            ),
+            requirements=[rng.choice(SKILLS[name]) for name in rng.sample(names, 3)]
+        )
+        for index in range(count)
+    ]
+
+
+def make_resume(rng: random.Random) -> str:
+    skills = rng.sample(list(SKILLS), 25)
+    lines = [f"Delivered projects using {rng.choice(SKILLS[name])} in production." for name in skills]
+    return "Experience\n" + "\n".join(lines[:20]) + "\nSkills\n" + ", ".join(lines[20:])
+
+
+async def main(args):
+    completions = _FakeCompletions(args.ms_per_ktoken)
+    optimizer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    rng = random.Random(5)
+    jobs = make_jobs(rng, args.jobs)
+    resume = make_resume(rng)
+
+    keyword_matcher.rank(resume, jobs)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        keyword_matcher.rank(resume, jobs)
+    local_ms = (time.perf_counter() - start) * 1000 / args.repeat
+
+    results = {}
+    for mode in ("per-job", "ranked"):
+        calls, tokens = completions.calls, completions.prompt_tokens
+        start = time.perf_counter()
+        if mode == "per-job":
+            await asyncio.gather(*(optimizer.analyze_resume(resume, job) for job in jobs))
+        else:
+            ranked = await rank_jobs(resume, jobs, args.explain_top)
+        results[mode] = (
+            completions.calls - calls,
+            completions.prompt_tokens - tokens,
+            time.perf_counter() - start
+        )
+
+    print(f"local scoring of {args.jobs} jobs: {local_ms:.2f}ms")
+    for mode, (calls, tokens, elapsed) in results.items():
+        print(f"{mode:<8} llm calls={calls:3d}  prompt tokens={tokens:7d}  wall={elapsed * 1000:8.1f}ms")
+    print("top matches: " + ", ".join(f"{item.title} ({item.score})" for item in ranked[:args.explain_top]))
+
+    analyzed = sum(item.analysis is not None for item in ranked)
+    ok = analyzed == args.explain_top and results["ranked"][1] < results["per-job"][1]
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=50, help="Job postings to rank")
+    parser.add_argument('--explain-top', type=int, default=3, help="Top matches escalated to the LLM")
+    parser.add_argument('--repeat', type=int, default=100, help="Repetitions when timing local scoring")
+    parser.add_argument('--ms-per-ktoken', type=float, default=400, help="Fake LLM latency per 1000 prompt tokens")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,71 @@
+"""
+Latency and accuracy of the local keyword matcher.
+
+Generates resume/job pairs from the skills vocabulary: each job asks for
+``--job-skills`` random skills, each resume mentions a random subset of
+them (using a random alias) plus unrelated skills, padded with filler
+sentences to ``--lines`` lines. Reports match latency percentiles and
+checks that exactly the planted skills are found and the rest reported
+missing. For scale, an LLM keyword analysis takes seconds.
+
+    python -m benchmarks.keyword_matching --pairs 2000 --lines 60
+"""
+import argparse
+import random
+import sys
+import time
+
+from benchmarks import percentile
+from app.core.skills import SKILLS
+from app.services.keywords import keyword_matcher
+
+FILLER = "Worked closely with the team to deliver reliable results for customers on schedule."
+
+
+def make_pair(rng: random.Random, job_skills: int, lines: int):
+    names = list(SKILLS)
+    wanted = rng.sample(names, job_skills)
+    planted = set(rng.sample(wanted, rng.randint(0, job_skills)))
+    others = rng.sample([name for name in names if name not in wanted], 5)
+
+    job = "Senior Engineer\nRequirements: " + ", ".join(rng.choice(SKILLS[name]) for name in wanted) + "."
+    mentions = [f"Built systems with {rng.choice(SKILLS[name])}." for name in list(planted) + others]
+    body = mentions + [FILLER] * max(lines - len(mentions), 0)
+    rng.shuffle(body)
+    return "\n".join(body), job, planted, set(wanted) - planted
+
+
+def main(args):
+    rng = random.Random(11)
+    pairs = [make_pair(rng, args.job_skills, args.lines) for _ in range(args.pairs)]
+
+    # Warm up regex and NumPy paths
+    keyword_matcher.match(pairs[0][0], pairs[0][1])
+
+    latencies = []
+    errors = 0
+    for resume, job, planted, missing in pairs:
+        start = time.perf_counter()
+        result = keyword_matcher.match(resume, job)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if set(result.keywords_found) != planted or set(result.missing_keywords) != missing:
+            errors += 1
+
+    print(
+        f"pairs={args.pairs} lines={args.lines} vocabulary={keyword_matcher.size}  "
+        f"p50={percentile(latencies, 50):.3f}ms p99={percentile(latencies, 99):.3f}ms "
+        f"max={max(latencies):.3f}ms"
+    )
+    print(f"mismatched keyword sets: {errors}/{args.pairs}")
+    ok = errors == 0 and percentile(latencies, 99) < args.budget_ms
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pairs', type=int, default=2000, help="Resume/job pairs to match")
+    parser.add_argument('--lines', type=int, default=60, help="Lines per resume")
+    parser.add_argument('--job-skills', type=int, default=12, help="Skills each job asks for")
+    parser.add_argument('--budget-ms', type=float, default=5.0, help="p99 latency budget")
+    sys.exit(main(parser.parse_args()))
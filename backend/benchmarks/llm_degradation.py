@@ -0,0 +1,94 @@
+"""
+Drive the LLM circuit breaker through an outage and recovery.
+
+Starts ``benchmarks.fake_openai`` in-process, points a ResumeOptimizer at
+it and runs ``analyze_resume`` calls through three phases:
+
+1. healthy   - calls succeed
+2. outage    - the fake returns ``--status`` (or hangs with ``--hang``);
+               once the breaker opens calls must fail fast
+3. recovery  - the fake is healthy again; after the cool-down half-open
+               probes must close the circuit
+
+    python -m benchmarks.llm_degradation --calls 20 --open-seconds 2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from . import percentile
+
+PORT = int(os.environ.get("FAKE_OPENAI_PORT", "8089"))
+os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{PORT}/v1"
+os.environ["LLM_CACHE_ENABLED"] = "false"
+os.environ.setdefault("OPENAI_MAX_RETRIES", "0")
+
+import uvicorn
+
+from app.core.circuit_breaker import CircuitOpenError
+from app.services.resume_optimizer import ResumeOptimizer
+from benchmarks.fake_openai import FaultConfig, app as fake_app
+
+
+async def run_phase(optimizer, name: str, calls: int):
+    latencies, ok, failed, rejected = [], 0, 0, 0
+    for index in range(calls):
+        start = time.perf_counter()
+        try:
+            await optimizer.analyze_resume(f"{name} resume {index}\nExperience\nEngineer")
+            ok += 1
+        except CircuitOpenError:
+            rejected += 1
+        except Exception:
+            failed += 1
+        latencies.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{name:<9} ok={ok:<3} failed={failed:<3} rejected={rejected:<3} "
+        f"p50={percentile(latencies, 50):8.1f} ms  p95={percentile(latencies, 95):8.1f} ms  "
+        f"breaker={optimizer.breaker.state}"
+    )
+    return ok, failed, rejected, latencies
+
+
+async def main(args):
+    server = uvicorn.Server(uvicorn.Config(fake_app, port=PORT, log_level="warning"))
+    serve = asyncio.ensure_future(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    try:
+        optimizer = ResumeOptimizer()
+        optimizer.client = optimizer.client.with_options(timeout=args.timeout)
+        optimizer.breaker.open_seconds = args.open_seconds
+        await run_phase(optimizer, "healthy", args.calls)
+
+        fake_app.state.fault = FaultConfig(mode="hang" if args.hang else "error", status=args.status)
+        # Twice as many calls so the healthy phase's successes age out of
+        # the breaker's window and the circuit opens part-way through
+        _, _, rejected, latencies = await run_phase(optimizer, "outage", args.calls * 2)
+        fast_fail = percentile(latencies[-rejected:], 95) if rejected else float("inf")
+
+        fake_app.state.fault = FaultConfig(mode="ok")
+        await asyncio.sleep(args.open_seconds)
+        recovered, _, _, _ = await run_phase(optimizer, "recovery", args.calls)
+
+        print(f"breaker={optimizer.breaker.stats()}")
+        ok = rejected > 0 and fast_fail < 50 and recovered == args.calls
+        print("PASS" if ok else "FAIL")
+        return 0 if ok else 1
+    finally:
+        server.should_exit = True
+        server.force_exit = True  # don't wait for requests left hanging
+        await serve
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=20, help="Calls per phase")
+    parser.add_argument('--status', type=int, default=503, help="HTTP status injected during the outage")
+    parser.add_argument('--hang', action='store_true', help="Hang instead of erroring (exercises timeouts)")
+    parser.add_argument('--timeout', type=float, default=1.0, help="OpenAI client timeout in seconds")
+    parser.add_argument('--open-seconds', type=float, default=2.0, help="Breaker cool-down")
+    sys.exit(asyncio.run(main(parser.parse_args())))
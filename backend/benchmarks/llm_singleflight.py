@@ -0,0 +1,66 @@
+"""
+Stress-test request coalescing in ResumeOptimizer.
+
+Fires ``--requests`` identical concurrent ``analyze_resume`` calls against
+a fake OpenAI client (cache disabled, so only coalescing can dedupe),
+cancels a fraction of the callers mid-flight, and checks that exactly one
+upstream call was made and every surviving caller got the result.
+
+    python -m benchmarks.llm_singleflight --requests 200 --cancel 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+from app.services.resume_optimizer import ResumeOptimizer
+
+
+class _FakeCompletions:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        content = '{"score": 80, "feedback": {}, "suggestions": [], "keywords_found": [], "missing_keywords": []}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+async def main(args):
+    optimizer = ResumeOptimizer()
+    completions = _FakeCompletions(args.latency / 1000)
+    optimizer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    start = time.perf_counter()
+    tasks = [
+        asyncio.ensure_future(optimizer.analyze_resume("Experience\nEngineer", "Backend role"))
+        for _ in range(args.requests)
+    ]
+    await asyncio.sleep(args.latency / 2000)
+    cancelled = int(args.requests * args.cancel)
+    for task in tasks[:cancelled]:
+        task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    succeeded = sum(1 for r in results if not isinstance(r, BaseException))
+    print(f"requests={args.requests} cancelled={cancelled} succeeded={succeeded}")
+    print(f"upstream calls={completions.calls} elapsed={elapsed * 1000:.1f} ms")
+    print(f"singleflight={optimizer.inflight.stats()}")
+    ok = completions.calls == 1 and succeeded == args.requests - cancelled
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--cancel', type=float, default=0.5, help="Fraction of callers to cancel")
+    parser.add_argument('--latency', type=float, default=200, help="Fake upstream latency in ms")
+    sys.exit(asyncio.run(main(parser.parse_args())))
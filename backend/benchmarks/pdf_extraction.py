@@ -0,0 +1,120 @@
+"""
+PDF extraction throughput: serial vs. page-parallel on the process pool.
+
+Uses the PDFs in ``--corpus`` if given, otherwise generates text PDFs of
+``--pages`` pages each. Reports pages/sec for
+
+- serial  - one process parses each PDF front to back (``extract_text``)
+- pool    - ``ExtractionPool.iter_pdf_pages``: page ranges on all workers
+
+plus the time to the first page of text, and how quickly an image-only
+(scanned) PDF is rejected.
+
+    python -m benchmarks.pdf_extraction --docs 4 --pages 60 --workers 4
+    python -m benchmarks.pdf_extraction --corpus ~/resumes/pdf
+"""
+import argparse
+import asyncio
+import io
+import pathlib
+import sys
+import time
+
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from app.services.extraction import ExtractionPool, ScannedDocumentError, extract_text
+
+
+def _escape(text: str) -> bytes:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode("latin-1")
+
+
+def make_pdf(pages: int, lines: int = 50, text: bool = True) -> bytes:
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    for page_index in range(pages):
+        page = writer.add_blank_page(612, 792)
+        if not text:
+            continue  # image-only stand-in: no text layer at all
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})
+        })
+        body = b"".join(
+            b"(" + _escape(
+                f"{page_index}.{line} Led platform work: Python, FastAPI, PostgreSQL; "
+                f"cut p99 latency {line % 90}%."
+            ) + b") '"
+            for line in range(lines)
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(b"BT /F1 9 Tf 11 TL 40 760 Td " + body + b" ET")
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def load_corpus(args):
+    if args.corpus:
+        paths = sorted(pathlib.Path(args.corpus).expanduser().glob("*.pdf"))
+        return [path.read_bytes() for path in paths]
+    print(f"Generating {args.docs} PDFs with {args.pages} pages each...")
+    return [make_pdf(args.pages)] * args.docs
+
+
+async def main(args):
+    documents = load_corpus(args)
+    if not documents:
+        print("No PDFs found")
+        return 1
+
+    start = time.perf_counter()
+    for content in documents:
+        extract_text(content, "pdf")
+    serial = time.perf_counter() - start
+
+    pool = ExtractionPool(args.workers or None, timeout=args.timeout, min_chars_per_page=20)
+    await pool.start()
+    try:
+        first_page, pages = [], 0
+        start = time.perf_counter()
+        for content in documents:
+            doc_start = time.perf_counter()
+            async for index, _ in pool.iter_pdf_pages(content):
+                if index == 0:
+                    first_page.append((time.perf_counter() - doc_start) * 1000)
+                pages += 1
+        parallel = time.perf_counter() - start
+
+        scanned = make_pdf(args.pages, text=False)
+        start = time.perf_counter()
+        try:
+            await pool.extract(scanned, "pdf")
+            rejected = "NOT rejected"
+        except ScannedDocumentError:
+            rejected = f"rejected in {(time.perf_counter() - start) * 1000:.1f} ms"
+    finally:
+        pool.close()
+
+    print(f"serial  pages/s={pages / serial:8.1f}  ({len(documents)} docs, {pages} pages)")
+    print(
+        f"pool    pages/s={pages / parallel:8.1f}  workers={pool.max_workers}  "
+        f"first page after {sum(first_page) / len(first_page):.1f} ms on average"
+    )
+    print(f"scanned {args.pages}-page PDF {rejected}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--corpus', help="Directory of PDF files to use instead of generated ones")
+    parser.add_argument('--docs', type=int, default=4, help="Generated documents")
+    parser.add_argument('--pages', type=int, default=60, help="Pages per generated document")
+    parser.add_argument('--workers', type=int, default=0, help="Pool processes (0 = one per CPU)")
+    parser.add_argument('--timeout', type=float, default=120.0, help="Per-task timeout in seconds")
+    sys.exit(asyncio.run(main(parser.parse_args())))
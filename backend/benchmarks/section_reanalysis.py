@@ -0,0 +1,113 @@
+"""
+Cost of re-analyzing an edited resume: full document vs. changed sections.
+
+Builds a resume with the usual sections, analyzes it once, then applies
+``--edits`` small edits (a typo fix in one section each) and re-analyzes
+after every edit two ways:
+
+- full         - ``analyze_resume`` over the whole document (old PUT path)
+- incremental  - ``analyze_resume_sections`` reusing unchanged sections
+
+The fake OpenAI client charges latency per prompt token, so both prompt
+tokens and wall time are compared. The LLM cache is disabled so only
+section reuse can save work.
+
+    python -m benchmarks.section_reanalysis --edits 10 --ms-per-ktoken 400
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+from app.services.resume_optimizer import ResumeOptimizer
+
+SECTIONS = ["contact", "experience", "education", "skills", "projects", "awards"]
+
+
+class _FakeCompletions:
+    def __init__(self, ms_per_ktoken: float):
+        self.ms_per_ktoken = ms_per_ktoken
+        self.calls = 0
+        self.prompt_tokens = 0
+
+    async def create(self, messages, **kwargs):
+        tokens = sum(len(m["content"]) for m in messages) // 4
+        self.calls += 1
+        self.prompt_tokens += tokens
+        await asyncio.sleep(self.ms_per_ktoken * tokens / 1000 / 1000)
+        content = (
+            '{"score": 80, "feedback": {"impact": "Quantify results"}, '
+            '"suggestions": ["Add metrics"], "keywords_found": ["python"], '
+            '"missing_keywords": ["kubernetes"]}'
+        )
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_resume(lines_per_section: int) -> dict:
+    return {
+        name: [
+            f"{name} line {index}: delivered measurable outcomes with Python and SQL"
+            for index in range(lines_per_section)
+        ]
+        for name in SECTIONS
+    }
+
+
+def render(sections: dict) -> str:
+    return "\n".join(f"{name.title()}\n" + "\n".join(lines) for name, lines in sections.items())
+
+
+async def main(args):
+    optimizer = ResumeOptimizer()
+    completions = _FakeCompletions(args.ms_per_ktoken)
+    optimizer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    rng = random.Random(7)
+    sections = make_resume(args.lines)
+    analysis = await optimizer.analyze_resume_sections(render(sections))
+
+    totals = {"full": [0, 0, 0.0], "incremental": [0, 0, 0.0]}
+    for edit in range(args.edits):
+        name = rng.choice(SECTIONS)
+        line = rng.randrange(args.lines)
+        sections[name][line] = sections[name][line].replace("outcomes", f"outcome{edit}")
+        content = render(sections)
+
+        for mode in ("full", "incremental"):
+            calls, tokens = completions.calls, completions.prompt_tokens
+            start = time.perf_counter()
+            if mode == "full":
+                await optimizer.analyze_resume(content)
+            else:
+                analysis = await optimizer.analyze_resume_sections(content, previous=analysis)
+            totals[mode][0] += completions.calls - calls
+            totals[mode][1] += completions.prompt_tokens - tokens
+            totals[mode][2] += time.perf_counter() - start
+
+    for mode, (calls, tokens, elapsed) in totals.items():
+        print(
+            f"{mode:<12} calls/edit={calls / args.edits:5.1f}  "
+            f"prompt tokens/edit={tokens / args.edits:7.0f}  "
+            f"ms/edit={elapsed * 1000 / args.edits:7.1f}"
+        )
+    full, incremental = totals["full"], totals["incremental"]
+    print(
+        f"incremental uses {incremental[1] / full[1]:.0%} of the tokens "
+        f"and {incremental[2] / full[2]:.0%} of the time"
+    )
+    ok = incremental[0] == args.edits and incremental[1] < full[1]
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--edits', type=int, default=10, help="Single-section edits to apply")
+    parser.add_argument('--lines', type=int, default=12, help="Lines per section")
+    parser.add_argument('--ms-per-ktoken', type=float, default=400, help="Fake LLM latency per 1000 prompt tokens")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,65 @@
+"""
+Measure StorageService upload/download throughput against the local backend.
+
+Uploads ``--files`` buffers of ``--size-mb`` each with ``--concurrency``
+in flight, streams them back, and reports MB/s plus the peak Python heap
+growth (tracemalloc) so chunked streaming can be checked for copies.
+
+    python -m benchmarks.storage_throughput --files 20 --size-mb 10
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+from app.core.storage import LocalStorageBackend, StorageService
+
+
+async def main(args):
+    chunk_size = args.chunk_kb * 1024
+    payloads = [os.urandom(args.size_mb * 1024 * 1024) for _ in range(args.files)]
+    total_mb = args.files * args.size_mb
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    with tempfile.TemporaryDirectory() as root:
+        backend = LocalStorageBackend(root, "resumes", "http://localhost/uploads", chunk_size)
+        service = StorageService(backend=backend)
+        service.chunk_size = chunk_size
+        await service.initialize()
+
+        async def upload(index, payload):
+            async with semaphore:
+                await service.upload_file(payload, f"user_bench/{index}.docx")
+
+        async def download(index):
+            async with semaphore:
+                async for _ in service.stream_file(f"user_bench/{index}.docx"):
+                    pass
+
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        await asyncio.gather(*(upload(i, p) for i, p in enumerate(payloads)))
+        upload_seconds = time.perf_counter() - start
+        _, upload_peak = tracemalloc.get_traced_memory()
+
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        await asyncio.gather(*(download(i) for i in range(args.files)))
+        download_seconds = time.perf_counter() - start
+        _, download_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"upload:   {total_mb / upload_seconds:8.1f} MB/s  peak heap +{(upload_peak - baseline) / 2**20:.1f} MB")
+    print(f"download: {total_mb / download_seconds:8.1f} MB/s  peak heap +{(download_peak - baseline) / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=20)
+    parser.add_argument('--size-mb', type=int, default=10)
+    parser.add_argument('--chunk-kb', type=int, default=256)
+    parser.add_argument('--concurrency', type=int, default=4)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,84 @@
+"""
+Exact vs. LSH-approximate search in VectorIndex.
+
+Embeds ``--docs`` generated resumes with the local hashing provider. Each
+resume is built around one of a few dozen role "themes" (a set of
+skills) plus random extra skills, so the corpus has the cluster structure
+real resume variants have. It then times incremental inserts, and exact
+and approximate top-``--k`` search for ``--queries`` theme queries, and
+reports recall of the approximate results against the exact ones.
+
+    python -m benchmarks.vector_search --docs 20000 --queries 200
+"""
+import argparse
+import random
+import sys
+import time
+
+from benchmarks import percentile
+from app.core.skills import SKILLS
+from app.core.vector_index import VectorIndex
+from app.services.embeddings import HashingEmbeddingProvider
+
+
+def make_corpus(rng: random.Random, docs: int, themes: int):
+    names = list(SKILLS)
+    theme_skills = [rng.sample(names, 8) for _ in range(themes)]
+
+    def text(theme: int, extra: int) -> str:
+        skills = theme_skills[theme] + rng.sample(names, extra)
+        rng.shuffle(skills)
+        return " ".join(f"Delivered work with {rng.choice(SKILLS[name])}." for name in skills)
+
+    documents = [text(rng.randrange(themes), 4) for _ in range(docs)]
+    return documents, text
+
+
+def main(args):
+    rng = random.Random(3)
+    provider = HashingEmbeddingProvider(args.dimensions)
+    documents, text = make_corpus(rng, args.docs, args.themes)
+
+    start = time.perf_counter()
+    vectors = provider.embed_many(documents)
+    embed_s = time.perf_counter() - start
+
+    index = VectorIndex(args.dimensions, ann_min_size=args.ann_min_size)
+    start = time.perf_counter()
+    for i, vector in enumerate(vectors):
+        index.upsert(i, vector)
+    insert_s = time.perf_counter() - start
+
+    queries = provider.embed_many([text(rng.randrange(args.themes), 0) for _ in range(args.queries)])
+    exact_ms, approx_ms, recalls = [], [], []
+    for query in queries:
+        start = time.perf_counter()
+        exact = index.search(query, args.k, approximate=False)
+        exact_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        approx = index.search(query, args.k, approximate=True)
+        approx_ms.append((time.perf_counter() - start) * 1000)
+        recalls.append(len({i for i, _ in exact} & {i for i, _ in approx}) / args.k)
+
+    recall = sum(recalls) / len(recalls)
+    print(
+        f"docs={args.docs} dims={args.dimensions}  embed={args.docs / embed_s:,.0f} docs/s  "
+        f"insert={args.docs / insert_s:,.0f} vectors/s  index={index.nbytes / 2**20:.1f}MB"
+    )
+    print(f"exact   p50={percentile(exact_ms, 50):6.2f}ms p99={percentile(exact_ms, 99):6.2f}ms")
+    print(f"approx  p50={percentile(approx_ms, 50):6.2f}ms p99={percentile(approx_ms, 99):6.2f}ms  recall@{args.k}={recall:.2f}")
+    ok = recall >= args.min_recall and percentile(approx_ms, 50) < percentile(exact_ms, 50)
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--docs', type=int, default=20000, help="Resumes to index")
+    parser.add_argument('--queries', type=int, default=200, help="Queries to run")
+    parser.add_argument('--themes', type=int, default=40, help="Role themes the resumes cluster around")
+    parser.add_argument('--k', type=int, default=10, help="Results per query")
+    parser.add_argument('--dimensions', type=int, default=512, help="Embedding dimensions")
+    parser.add_argument('--ann-min-size', type=int, default=1024, help="Index size where LSH kicks in")
+    parser.add_argument('--min-recall', type=float, default=0.8, help="Required approximate recall@k")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,10 @@
+-- Track resumes whose analysis was deferred while the LLM was unavailable
+ALTER TABLE resumes
+    ADD COLUMN IF NOT EXISTS analysis_status TEXT NOT NULL DEFAULT 'complete';
+
+-- Backfill scans only the (small) set of pending rows
+CREATE INDEX IF NOT EXISTS idx_resumes_analysis_pending
+    ON resumes(created_at)
+    WHERE analysis_status = 'pending';
+
+COMMENT ON COLUMN resumes.analysis_status IS 'complete, or pending while awaiting analysis backfill';
@@ -0,0 +1,38 @@
+-- Incremental storage quota accounting
+
+ALTER TABLE user_settings
+    ADD COLUMN IF NOT EXISTS storage_used_bytes BIGINT NOT NULL DEFAULT 0;
+
+ALTER TABLE resumes
+    ADD COLUMN IF NOT EXISTS file_size BIGINT;
+
+-- Atomically adjust a user's usage counter (creating the settings row on
+-- first use) and return the new usage together with the quota
+CREATE OR REPLACE FUNCTION increment_storage_usage(p_user_id TEXT, p_delta BIGINT)
+RETURNS TABLE (storage_used_bytes BIGINT, max_storage_bytes BIGINT) AS $$
+    INSERT INTO user_settings AS s (user_id, storage_used_bytes)
+    VALUES (p_user_id, GREATEST(p_delta, 0))
+    ON CONFLICT (user_id) DO UPDATE
+        SET storage_used_bytes = GREATEST(s.storage_used_bytes + p_delta, 0)
+    RETURNING s.storage_used_bytes, s.max_storage_bytes;
+$$ LANGUAGE sql;
+
+-- Backfill file sizes and counters from the storage bucket
+UPDATE resumes r
+SET file_size = (o.metadata->>'size')::BIGINT
+FROM storage.objects o
+WHERE o.bucket_id = 'resumes'
+  AND o.name = split_part(r.file_url, '/object/public/resumes/', 2)
+  AND r.file_size IS NULL;
+
+INSERT INTO user_settings AS s (user_id, storage_used_bytes)
+SELECT substring(split_part(o.name, '/', 1) FROM 6), SUM((o.metadata->>'size')::BIGINT)
+FROM storage.objects o
+WHERE o.bucket_id = 'resumes'
+  AND o.name LIKE 'user\_%/%'
+GROUP BY 1
+ON CONFLICT (user_id) DO UPDATE
+    SET storage_used_bytes = EXCLUDED.storage_used_bytes;
+
+COMMENT ON COLUMN user_settings.storage_used_bytes IS 'Bytes stored in the resumes bucket, maintained incrementally and reconciled periodically';
+COMMENT ON COLUMN resumes.file_size IS 'Size of the stored file in bytes';
@@ -0,0 +1,7 @@
+-- Keyset pagination for GET /resumes:
+--   WHERE user_id = $1 AND (created_at, id) < ($2, $3)
+--   ORDER BY created_at DESC, id DESC LIMIT n
+-- Serves each page as a single index range scan per user instead of
+-- filtering idx_resumes_created_at by user.
+CREATE INDEX IF NOT EXISTS idx_resumes_user_created_id
+    ON resumes(user_id, created_at DESC, id DESC);
@@ -0,0 +1,27 @@
+-- Create a resume, with its analysis, and account its file against the
+-- owner's storage quota in one transaction / one round trip.
+CREATE OR REPLACE FUNCTION create_resume(p_resume JSONB, p_file_size BIGINT DEFAULT NULL)
+RETURNS SETOF resumes AS $$
+BEGIN
+    IF p_file_size IS NOT NULL THEN
+        PERFORM increment_storage_usage(p_resume->>'user_id', p_file_size);
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO resumes (
+        user_id, title, content, file_type, file_url,
+        file_size, analysis, analysis_status
+    )
+    VALUES (
+        p_resume->>'user_id',
+        p_resume->>'title',
+        p_resume->>'content',
+        p_resume->>'file_type',
+        p_resume->>'file_url',
+        p_file_size,
+        NULLIF(p_resume->'analysis', 'null'::jsonb),
+        COALESCE(p_resume->>'analysis_status', 'complete')
+    )
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql;
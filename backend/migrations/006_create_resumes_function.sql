@@ -0,0 +1,33 @@
+-- Bulk variant of create_resume() for batch uploads: insert many resumes
+-- and account their files against the owners' quotas in one transaction.
+-- Each element of p_resumes has the same shape as create_resume's p_resume
+-- plus an optional file_size.
+CREATE OR REPLACE FUNCTION create_resumes(p_resumes JSONB)
+RETURNS SETOF resumes AS $$
+BEGIN
+    PERFORM increment_storage_usage(usage.user_id, usage.total)
+    FROM (
+        SELECT r->>'user_id' AS user_id, SUM((r->>'file_size')::BIGINT) AS total
+        FROM jsonb_array_elements(p_resumes) AS r
+        WHERE r->>'file_size' IS NOT NULL
+        GROUP BY 1
+    ) AS usage;
+
+    RETURN QUERY
+    INSERT INTO resumes (
+        user_id, title, content, file_type, file_url,
+        file_size, analysis, analysis_status
+    )
+    SELECT
+        r->>'user_id',
+        r->>'title',
+        r->>'content',
+        r->>'file_type',
+        r->>'file_url',
+        (r->>'file_size')::BIGINT,
+        NULLIF(r->'analysis', 'null'::jsonb),
+        COALESCE(r->>'analysis_status', 'complete')
+    FROM jsonb_array_elements(p_resumes) AS r
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,98 @@
+-- Delta-compressed resume version history.
+--
+-- Most versions store only a line diff (`delta`) against the previous
+-- version; a full `content` snapshot is written every p_snapshot_interval
+-- versions (and whenever a delta cannot be trusted), so reconstructing any
+-- version replays at most that many deltas.
+ALTER TABLE resume_versions ALTER COLUMN content DROP NOT NULL;
+ALTER TABLE resume_versions
+    ADD COLUMN IF NOT EXISTS kind TEXT NOT NULL DEFAULT 'snapshot'
+        CHECK (kind IN ('snapshot', 'delta')),
+    ADD COLUMN IF NOT EXISTS delta TEXT,
+    ADD COLUMN IF NOT EXISTS content_sha256 TEXT,
+    ADD COLUMN IF NOT EXISTS content_length INTEGER,
+    ADD COLUMN IF NOT EXISTS source TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resume_versions_number
+    ON resume_versions(resume_id, version_number);
+
+-- Record a new version of a resume's content.
+--
+-- p_delta transforms the content hashed as p_base_sha256 into p_content. It
+-- is stored only if that base is the latest recorded version; otherwise (a
+-- concurrent edit got in first, or this is the first version) p_content is
+-- stored as a snapshot. When a resume has no history yet, p_base_content is
+-- recorded first as version 1 so the pre-edit text is not lost.
+-- Content equal to the latest version is not recorded again.
+CREATE OR REPLACE FUNCTION add_resume_version(
+    p_resume_id UUID,
+    p_content TEXT,
+    p_content_sha256 TEXT,
+    p_delta TEXT DEFAULT NULL,
+    p_base_content TEXT DEFAULT NULL,
+    p_base_sha256 TEXT DEFAULT NULL,
+    p_source TEXT DEFAULT NULL,
+    p_snapshot_interval INTEGER DEFAULT 10
+)
+RETURNS SETOF resume_versions AS $$
+DECLARE
+    latest resume_versions%ROWTYPE;
+    last_snapshot INTEGER;
+    next_number INTEGER;
+BEGIN
+    -- One writer per resume at a time, so version numbers and delta bases
+    -- cannot interleave
+    PERFORM pg_advisory_xact_lock(hashtext(p_resume_id::TEXT));
+
+    SELECT * INTO latest FROM resume_versions
+    WHERE resume_id = p_resume_id
+    ORDER BY version_number DESC
+    LIMIT 1;
+
+    IF latest.id IS NULL AND p_base_content IS NOT NULL
+            AND p_base_sha256 IS DISTINCT FROM p_content_sha256 THEN
+        INSERT INTO resume_versions (
+            resume_id, version_number, kind, content, content_sha256, content_length, source
+        )
+        VALUES (
+            p_resume_id, 1, 'snapshot', p_base_content, p_base_sha256,
+            char_length(p_base_content), 'original'
+        )
+        RETURNING * INTO latest;
+    END IF;
+
+    IF latest.content_sha256 = p_content_sha256 THEN
+        RETURN NEXT latest;
+        RETURN;
+    END IF;
+
+    next_number := COALESCE(latest.version_number, 0) + 1;
+    SELECT MAX(version_number) INTO last_snapshot FROM resume_versions
+    WHERE resume_id = p_resume_id AND kind = 'snapshot';
+
+    IF p_delta IS NULL
+            OR latest.id IS NULL
+            OR latest.content_sha256 IS DISTINCT FROM p_base_sha256
+            OR next_number - COALESCE(last_snapshot, 0) >= p_snapshot_interval THEN
+        RETURN QUERY
+        INSERT INTO resume_versions (
+            resume_id, version_number, kind, content, content_sha256, content_length, source
+        )
+        VALUES (
+            p_resume_id, next_number, 'snapshot', p_content, p_content_sha256,
+            char_length(p_content), p_source
+        )
+        RETURNING *;
+    ELSE
+        RETURN QUERY
+        INSERT INTO resume_versions (
+            resume_id, version_number, kind, delta, content_sha256, content_length, source
+        )
+        VALUES (
+            p_resume_id, next_number, 'delta', p_delta, p_content_sha256,
+            char_length(p_content), p_source
+        )
+        RETURNING *;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
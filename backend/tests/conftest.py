@@ -0,0 +1,20 @@
+"""Test configuration.
+
+Run from the ``backend`` directory: ``python -m pytest``.
+"""
+import os
+
+# Placeholder credentials so the app settings load without a real .env.
+# Tests never talk to Clerk, Supabase or OpenAI.
+_PLACEHOLDER_ENV = {
+    "CLERK_PUBLISHABLE_KEY": "test",
+    "CLERK_SECRET_KEY": "test",
+    "CLERK_JWT_KEY": "test",
+    "SUPABASE_URL": "http://localhost:54321",
+    "SUPABASE_KEY": "test.test.test",
+    "SUPABASE_JWT_SECRET": "test",
+    "OPENAI_API_KEY": "test",
+}
+
+for _key, _value in _PLACEHOLDER_ENV.items():
+    os.environ.setdefault(_key, _value)
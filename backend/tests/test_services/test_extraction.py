@@ -0,0 +1,51 @@
+"""Streaming DOCX extraction."""
+import io
+import zipfile
+
+from app.services.extraction import extract_docx_streaming
+
+_NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"'
+)
+
+
+def _paragraph(text: str) -> str:
+    return f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+
+
+def _docx(body: str) -> bytes:
+    document = f'<?xml version="1.0" encoding="UTF-8"?><w:document {_NAMESPACES}><w:body>{body}</w:body></w:document>'
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as package:
+        package.writestr('word/document.xml', document)
+    return buffer.getvalue()
+
+
+def _text_box(text: str) -> str:
+    """A text box as Word writes it: a DrawingML choice plus a VML fallback copy."""
+    content = f'<w:txbxContent>{_paragraph(text)}</w:txbxContent>'
+    return (
+        '<w:p><w:r><mc:AlternateContent>'
+        f'<mc:Choice Requires="wps"><w:drawing><wps:txbx>{content}</wps:txbx></w:drawing></mc:Choice>'
+        f'<mc:Fallback><w:pict><v:shape><v:textbox>{content}</v:textbox></v:shape></w:pict></mc:Fallback>'
+        '</mc:AlternateContent></w:r></w:p>'
+    )
+
+
+def test_paragraphs_and_tables():
+    table = (
+        '<w:tbl><w:tr>'
+        f'<w:tc>{_paragraph("Python")}</w:tc><w:tc>{_paragraph("5 years")}</w:tc>'
+        '</w:tr></w:tbl>'
+    )
+    text = extract_docx_streaming(_docx(_paragraph("Jane Doe") + table))
+    assert text.splitlines() == ["Jane Doe", "Python\t5 years"]
+
+
+def test_text_box_extracted_once():
+    body = _paragraph("Experience") + _text_box("Sidebar: Python, SQL") + _paragraph("Engineer")
+    text = extract_docx_streaming(_docx(body))
+    assert text.splitlines() == ["Experience", "Sidebar: Python, SQL", "Engineer"]
@@ -0,0 +1,74 @@
+"""Local keyword matching."""
+from app.core.skills import SKILLS
+from app.services.keywords import KeywordMatcher
+
+matcher = KeywordMatcher(SKILLS)
+
+
+def _skills(text: str):
+    counts = matcher.count(text)
+    return {matcher.names[i] for i in counts.nonzero()[0]}
+
+
+def test_qualified_aliases_match():
+    text = "Built Spring Boot services on AWS Lambda; led application security reviews."
+    assert {"Spring", "Serverless", "Security"} <= _skills(text)
+
+
+def test_ambiguous_words_do_not_match():
+    text = (
+        "B.S. Computer Science, Spring 2022. Loaded shipping containers, "
+        "volunteered for campus security, studied lambda calculus, ts: 14:00."
+    )
+    assert _skills(text) == set()
+
+
+def test_longest_alias_wins():
+    assert _skills("Shipped apps in React Native") == {"React Native"}
+
+
+def test_analysis_keywords_match_endpoint():
+    from datetime import datetime
+    from app.models.resume import JobDescription, ResumeAnalysis
+    from app.services.keywords import job_text, keyword_matcher
+    from app.services.resume_optimizer import ResumeOptimizer
+
+    job = JobDescription(
+        title="Backend Engineer",
+        description="Build APIs in Python with PostgreSQL.",
+        requirements=["Kubernetes", "Kafka"]
+    )
+    resume = "Python developer running Kafka on Kubernetes."
+    analysis = ResumeAnalysis(
+        score=70, feedback=[], suggestions=[], keywords_found=[], missing_keywords=[],
+        analysis_date=datetime.utcnow()
+    )
+    expected = keyword_matcher.match(resume, job_text(job), job.requirements)
+    result = ResumeOptimizer.apply_keyword_match(analysis, resume, job)
+    assert result.keywords_found == expected.keywords_found
+    assert result.missing_keywords == expected.missing_keywords
+    assert result.keyword_score == expected.score
+
+
+def test_analysis_prompt_skips_keywords_when_matched_locally():
+    import asyncio
+    import json
+    from app.models.resume import JobDescription
+    from app.services.resume_optimizer import ResumeOptimizer
+
+    prompts = []
+
+    async def complete(model, messages, **params):
+        prompts.append(messages[0]["content"])
+        return json.dumps({"score": 80, "feedback": {"impact": "Quantify results"}})
+
+    optimizer = ResumeOptimizer()
+    optimizer._complete = complete
+    job = JobDescription(title="Data Engineer", description="Airflow and Spark pipelines.")
+    analysis = asyncio.run(optimizer.analyze_resume("Built Spark jobs.", job))
+    assert "keywords" not in prompts[-1].lower()
+    assert analysis.keywords_found == ["Spark"]
+    assert analysis.missing_keywords == ["Airflow"]
+
+    asyncio.run(optimizer.analyze_resume("Built Spark jobs."))
+    assert "keywords" in prompts[-1].lower()